@@ -12,16 +12,20 @@ from fastapi.responses import JSONResponse
 from hundredandten.engine.errors import HundredAndTenError
 
 from src.auth import (
+    firebase_keys,
     get_authorized_identity_for_path_player,
 )
-from src.models.db.setup import initialize_odm
+from src.models.db.setup import initialize_odm, odm_initialized
 from src.models.internal.errors import (
     AuthenticationError,
     AuthorizationError,
     BadRequestError,
+    ConflictError,
     NotFoundError,
 )
 from src.routers import games, lobbies, players
+from src.services import ADVANCE_GAME_QUEUE, AdvanceGame, GameService
+from src.timing import ServerTimingMiddleware
 
 # =============================================================================
 # Context manager
@@ -32,7 +36,8 @@ from src.routers import games, lobbies, players
 async def lifespan(_: FastAPI):
     """Initialize the context of FastAPI"""
     await initialize_odm()
-    yield
+    async with firebase_keys.refreshing():
+        yield
 
 
 # =============================================================================
@@ -63,6 +68,13 @@ fastapi_app.add_middleware(
     allow_headers=["*"],
 )
 
+# =============================================================================
+# Server-Timing middleware
+# =============================================================================
+
+
+fastapi_app.add_middleware(ServerTimingMiddleware)
+
 # =============================================================================
 # Exception handlers
 # =============================================================================
@@ -88,6 +100,12 @@ async def bad_request_error_handler(_: Request, exc: NotFoundError) -> JSONRespo
     return JSONResponse(status_code=400, content=str(exc))
 
 
+@fastapi_app.exception_handler(ConflictError)
+async def conflict_error_handler(_: Request, exc: ConflictError) -> JSONResponse:
+    """Return 409 for conflict errors"""
+    return JSONResponse(status_code=409, content=str(exc))
+
+
 @fastapi_app.exception_handler(AuthorizationError)
 async def authorization_error_handler(
     _: Request, exc: AuthorizationError
@@ -121,3 +139,20 @@ fastapi_app.include_router(games)
 # =============================================================================
 
 app = func.AsgiFunctionApp(app=fastapi_app, http_auth_level=func.AuthLevel.ANONYMOUS)
+
+# =============================================================================
+# Queue worker
+# =============================================================================
+
+
+@app.queue_trigger(
+    arg_name="message",
+    queue_name=ADVANCE_GAME_QUEUE,
+    connection="AzureWebJobsStorage",
+)
+async def advance_game(message: func.QueueMessage) -> None:
+    """Make the automated moves left pending in a game, outside of any request"""
+    if not odm_initialized():
+        await initialize_odm()
+
+    await GameService.advance(AdvanceGame.model_validate_json(message.get_body()))
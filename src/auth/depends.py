@@ -6,6 +6,7 @@ from fastapi import Depends, Path
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.models.internal.errors import AuthenticationError, AuthorizationError
+from src.timing import stage
 
 from .firebase import verify_firebase_token
 from .identity import Identity
@@ -19,17 +20,18 @@ http_bearer = HTTPBearer(
 )
 
 
-def get_authenticated_identity(
+async def get_authenticated_identity(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(http_bearer)],
 ) -> Identity:
     """Validate the Bearer token and return the authenticated identity"""
     try:
-        return verify_firebase_token(credentials.credentials)
+        with stage("auth"):
+            return await verify_firebase_token(credentials.credentials)
     except ValueError as exc:
         raise AuthenticationError(str(exc)) from exc
 
 
-def get_authorized_identity_for_path_player(
+async def get_authorized_identity_for_path_player(
     player_id: Annotated[str, Path()],
     identity: Annotated[Identity, Depends(get_authenticated_identity)],
 ) -> Identity:
@@ -1,30 +1,44 @@
 """Firebase ID token validation"""
 
-import cachecontrol
-import google.auth.transport.requests
-import requests
-from google.oauth2 import id_token
+import os
+from hashlib import sha256
+from time import time
+
+import jwt
+from jwt.exceptions import PyJWTError
+
+from src.cache import LruCache
 
 from .identity import Identity
+from .keys import REFRESH_ERRORS, KeyStore
 
 FIREBASE_PROJECT_ID = "hundred-and-ten"
 CERTS = "https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com"
 ISSUER = f"https://securetoken.google.com/{FIREBASE_PROJECT_ID}"
 
-# Module-level cached session for Google's public key fetches.
-# CacheControl respects Cache-Control headers from Google's cert endpoint,
-# avoiding a network round-trip on every token validation.
-_session = requests.Session()
-_cached_session = cachecontrol.CacheControl(_session)
-_request = google.auth.transport.requests.Request(session=_cached_session)
+# Firebase's public keys; the app keeps them fresh in the background while it runs
+firebase_keys = KeyStore(CERTS)
+
+# Identities of tokens that have already been verified, keyed by digests of the key
+# set they were verified against and of the token. Entries are trusted until
+# EXPIRY_SKEW seconds before the token expires; once the keys rotate, no lookup
+# matches the old entries and they are evicted as the cache fills.
+EXPIRY_SKEW = 30
+verified_tokens: LruCache[tuple[str, str], Identity] = LruCache(
+    int(os.environ.get("VerifiedTokenCacheSize", "1024"))
+)
 
 
-def verify_firebase_token(token: str) -> Identity:
+async def verify_firebase_token(token: str) -> Identity:
     """
     Validate a Firebase ID token and return the user's identity.
 
     Validates the token's signature, audience, expiry, and issuer against
-    Firebase's public keys. Returns an Identity populated from token claims.
+    Firebase's public keys, as held in memory by ``firebase_keys``; the keys are
+    fetched again first if they have expired or do not have the token's key, as
+    when Firebase rotates them. Returns an Identity populated from token claims.
+    Verified tokens are cached until shortly before they expire, as long as
+    Firebase's keys do not change.
 
     Args:
         token: The encoded Firebase ID token from the client.
@@ -36,15 +50,34 @@ def verify_firebase_token(token: str) -> Identity:
         ValueError: If the token is invalid/expired, or the token is missing the ``sub`` claim.
     """
 
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except PyJWTError as exc:
+        raise ValueError(f"Invalid Firebase token: {exc}") from exc
+
+    try:
+        await firebase_keys.load(kid)
+    except REFRESH_ERRORS as exc:
+        raise ValueError(f"Firebase keys unavailable: {exc}") from exc
+
+    key = (firebase_keys.digest, sha256(token.encode()).hexdigest())
+    if identity := verified_tokens.get(key):
+        return identity
+
+    signing_key = firebase_keys.keys.get(kid) if kid else None
+    if signing_key is None:
+        raise ValueError(f"Invalid Firebase token: unknown key {kid}")
+
     try:
         # Verify signature + standard claims
-        id_info = id_token.verify_token(
+        id_info = jwt.decode(
             token,
-            _request,
+            signing_key.key,
+            algorithms=[signing_key.algorithm_name],
             audience=FIREBASE_PROJECT_ID,
-            certs_url=CERTS,
+            options={"require": ["exp", "iat"]},
         )
-    except Exception as exc:
+    except PyJWTError as exc:
         raise ValueError(f"Invalid Firebase token: {exc}") from exc
 
     sub = id_info.get("sub")
@@ -55,8 +88,14 @@ def verify_firebase_token(token: str) -> Identity:
     if iss != ISSUER:
         raise ValueError(f"Invalid issuer {iss}")
 
-    return Identity(
+    identity = Identity(
         id=sub,
         name=id_info.get("name"),
         picture_url=id_info.get("picture"),
     )
+
+    expires_at = id_info.get("exp")
+    if expires_at and expires_at - EXPIRY_SKEW > time():
+        verified_tokens.put(key, identity, expires_at - EXPIRY_SKEW)
+
+    return identity
@@ -0,0 +1,99 @@
+"""Public keys for token verification, kept in memory and refreshed in the background"""
+
+import asyncio
+import logging
+import re
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from hashlib import sha256
+from time import monotonic
+
+import requests
+from jwt import PyJWK, PyJWKSet
+from jwt.exceptions import PyJWTError
+
+logger = logging.getLogger(__name__)
+
+FETCH_TIMEOUT = 10
+# when the key set does not say how long it may be cached for
+DEFAULT_MAX_AGE = 300
+# how long before the key set expires to refresh it
+REFRESH_MARGIN = 300
+# the least time between refreshes, including after a failed refresh
+MIN_REFRESH_DELAY = 30
+
+REFRESH_ERRORS = (requests.RequestException, ValueError, PyJWTError)
+
+
+class KeyStore:
+    """
+    The parsed keys of a JWK set.
+
+    While ``refreshing``, a background task fetches the key set again shortly before
+    it expires, so verifying a token needs neither a network request nor a thread.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.keys: Mapping[str, PyJWK] = {}
+        self.digest = ""  # changes whenever the key set does
+        # monotonic times of the last attempt to fetch the key set, and of when the
+        # key set last fetched expires
+        self.fetched_at = 0.0
+        self.expires_at = 0.0
+
+    async def load(self, key_id: str | None = None) -> None:
+        """
+        Fetch the key set if it has never been fetched, or if it has expired or does
+        not have the key with the provided ID; once it has been fetched, it is not
+        fetched again within ``MIN_REFRESH_DELAY`` seconds of the last attempt
+        """
+        now = monotonic()
+        if self.digest and (
+            now - self.fetched_at < MIN_REFRESH_DELAY
+            or (now < self.expires_at and (key_id is None or key_id in self.keys))
+        ):
+            return
+
+        await self.refresh()
+
+    async def refresh(self) -> int:
+        """Fetch and parse the key set, returning the seconds it may be cached for"""
+        self.fetched_at = monotonic()
+        response = await asyncio.to_thread(
+            requests.get, self.url, timeout=FETCH_TIMEOUT
+        )
+        response.raise_for_status()
+
+        key_set = PyJWKSet.from_dict(response.json())
+        self.keys = {
+            key.key_id: key
+            for key in key_set.keys
+            if key.key_id and key.public_key_use in ("sig", None)
+        }
+        self.digest = sha256(response.content).hexdigest()
+
+        max_age = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+        seconds = int(max_age[1]) if max_age else DEFAULT_MAX_AGE
+        self.expires_at = self.fetched_at + seconds
+        return seconds
+
+    async def keep_fresh(self) -> None:
+        """Refresh the key set shortly before it expires, until cancelled"""
+        while True:
+            try:
+                max_age = await self.refresh()
+                delay = max(max_age - REFRESH_MARGIN, MIN_REFRESH_DELAY)
+            except REFRESH_ERRORS:
+                logger.exception("Could not refresh the keys at %s", self.url)
+                delay = MIN_REFRESH_DELAY
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def refreshing(self):
+        """Keep the key set fresh in the background for the duration of the context"""
+        task = asyncio.create_task(self.keep_fresh())
+        try:
+            yield
+        finally:
+            task.cancel()
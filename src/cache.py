@@ -0,0 +1,56 @@
+"""In-process caches shared by the requests an instance serves"""
+
+from collections import OrderedDict
+from time import time
+
+
+class LruCache[K, V]:
+    """A size-bounded cache that forgets its least recently used entries first"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> V | None:
+        """Get the value cached for the key, if there is one that has not expired"""
+        entry = self.__entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time():
+            del self.__entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.__entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: K, value: V, expires_at: float | None = None) -> None:
+        """
+        Cache the value for the key, until the epoch time ``expires_at`` if given,
+        forgetting old entries if the cache is full
+        """
+        self.__entries[key] = (value, expires_at)
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    def forget(self, key: K) -> None:
+        """Forget the value cached for the key, if there is one"""
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every cached entry"""
+        self.__entries.clear()
@@ -7,9 +7,9 @@ from src.models.client import requests
 def __card(c_card: requests.CardRequest) -> internal.Card:
     """Create a card object from a passed client card"""
 
-    return internal.Card(
-        suit=internal.CardSuit[c_card.suit.value],
-        number=internal.CardNumber[c_card.number.value],
+    return internal.Card.of(
+        internal.CardSuit[c_card.suit.value],
+        internal.CardNumber[c_card.number.value],
     )
 
 
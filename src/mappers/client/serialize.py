@@ -3,8 +3,19 @@
 from src.models import internal
 from src.models.client import responses
 from src.models.client.constants import CardNumberName, SelectableSuit, Suit
+from src.timing import timed
+
+# the client format of every card, made once and shared by every response
+__CARDS = {
+    internal.Card.of(suit, number): responses.Card(
+        suit=Suit[suit.name], number=CardNumberName[number.name]
+    )
+    for suit in internal.CardSuit
+    for number in internal.CardNumber
+}
 
 
+@timed("serialize")
 def player(m_player: internal.Player) -> responses.Player:
     """Return a player as it can be provided to the client"""
     return responses.Player(
@@ -14,6 +25,7 @@ def player(m_player: internal.Player) -> responses.Player:
     )
 
 
+@timed("serialize")
 def lobby(
     m_lobby: internal.Lobby,
 ) -> responses.LobbyResponse:
@@ -34,18 +46,34 @@ def lobby(
     )
 
 
+@timed("serialize")
 def events(
-    m_events: list[internal.Event], client_player_id: str
+    m_events: list[internal.Event], client_player_id: str, start: int = 0
 ) -> list[responses.Event]:
-    """Return a list of events as they can be provided to the client"""
+    """Return a list of events, sequenced from start, as they can be provided to the client"""
     return [
         responses.Event(
             sequence=index, content=__event_content(event, client_player_id)
         )
-        for index, event in enumerate(m_events)
+        for index, event in enumerate(m_events, start)
     ]
 
 
+def new_events(m_game: internal.Game, client_player_id: str) -> list[responses.Event]:
+    """
+    Return the events produced by changes to the game, sequenced from where they
+    start in the game, as they can be provided to the client
+    """
+    # games sent to clients will be saved, which counts their events
+    assert m_game.event_count is not None
+    return events(
+        m_game.new_events,
+        client_player_id,
+        m_game.event_count - len(m_game.new_events),
+    )
+
+
+@timed("serialize")
 def game(
     m_game: internal.Game,
     client_player_id: str,
@@ -70,6 +98,20 @@ def game(
     )
 
 
+@timed("serialize")
+def game_summary(m_summary: internal.GameSummary) -> responses.GameSummaryResponse:
+    """Return a game summary as it can be provided to the client"""
+    return responses.GameSummaryResponse(
+        id=m_summary.id,
+        name=m_summary.name,
+        players=[__player_in_game(p) for p in m_summary.ordered_players],
+        status=m_summary.status.name,
+        active_player_id=m_summary.active_player_id,
+        winner_player_id=m_summary.winner_player_id,
+        scores=m_summary.scores,
+    )
+
+
 def __completed_round(
     m_round: internal.Round,
 ) -> responses.CompletedRound:
@@ -93,7 +135,7 @@ def __completed_round(
                 for player_id, record in m_round.discards.items()
             },
             tricks=[__trick(t) for t in m_round.tricks],
-            scores=m_round.scores,
+            scores=dict(m_round.scores),
         )
 
     return responses.CompletedNoBiddersRound(
@@ -156,6 +198,7 @@ def __discard_record(discard: internal.DiscardRecord) -> responses.DiscardRecord
     )
 
 
+@timed("serialize")
 def action(m_action: internal.Action) -> responses.GameAction:
     """Return an action as it can be provided to the client"""
     if isinstance(m_action, internal.Bid):
@@ -221,9 +264,7 @@ def __player_type(player_in_game: internal.PlayerInGame) -> responses.PlayerType
 
 
 def __card(card: internal.Card) -> responses.Card:
-    return responses.Card(
-        suit=Suit[card.suit.name], number=CardNumberName[card.number.name]
-    )
+    return __CARDS[card]
 
 
 def __event_content(
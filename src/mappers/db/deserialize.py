@@ -4,6 +4,17 @@ from collections import deque
 
 from src.models import db, internal
 
+# the model of every card, by its suit and number in the DB and by its packed code
+__CARDS = {
+    (db.Suit[suit.name], db.CardNumber[number.name]): internal.Card.of(suit, number)
+    for suit in internal.CardSuit
+    for number in internal.CardNumber
+}
+__PACKED_CARDS = {
+    db.PACKED_SUITS.index(suit) * 16 + db.PACKED_NUMBERS.index(number): card
+    for (suit, number), card in __CARDS.items()
+}
+
 
 def player(db_player: db.Player) -> internal.Player:
     """Convert a Player DB DTO to its model"""
@@ -28,7 +39,7 @@ def lobby(db_lobby: db.Lobby) -> internal.Lobby:
 
 
 def game(db_game: db.Game) -> internal.Game:
-    """Convert a Game DB DTO to its model"""
+    """Convert a Game DB DTO to its model, without making pending automated moves"""
     return internal.Game(
         id=str(db_game.id),
         name=db_game.name,
@@ -36,10 +47,78 @@ def game(db_game: db.Game) -> internal.Game:
         accessibility=internal.Accessibility[db_game.accessibility.name],
         organizer=__person(db_game.organizer),
         players=internal.PlayerGroup(map(__person, db_game.players)),
-        initial_actions=list(map(__move, db_game.moves)),
+        initial_actions=__actions(db_game),
+        initial_event_count=db_game.event_count,
+        initial_automation=False,
+    )
+
+
+def moves(packed: bytes, player_ids: list[str]) -> list[internal.Action]:
+    """Unpack the game actions from the DB, made by the players with the given IDs"""
+    return [__unpacked_move(m, player_ids) for m in db.split_packed_moves(packed)]
+
+
+def game_summary(db_summary: db.GameSummary) -> internal.GameSummary:
+    """Convert a GameSummary DB projection to its model"""
+    assert db_summary.scores is not None  # summaries are only kept with their scores
+
+    return internal.GameSummary(
+        id=str(db_summary.id),
+        name=db_summary.name,
+        ordered_players=internal.PlayerGroup(
+            map(__person, [db_summary.organizer, *db_summary.players])
+        ),
+        status=internal.GameStatus[db_summary.status.name],
+        active_player_id=db_summary.active_player_id,
+        winner_player_id=db_summary.winner_player_id,
+        scores={s.player_id: s.value for s in db_summary.scores},
     )
 
 
+def event(db_event: db.Event) -> internal.Event:
+    """Convert an Event DB DTO to its model"""
+    content = db_event.content
+    result: internal.Event
+
+    match content:
+        case db.GameStartEvent():
+            result = internal.GameStart()
+        case db.RoundStartEvent():
+            result = internal.RoundStart(
+                dealer=content.dealer,
+                hands={h.player_id: list(map(__card, h.cards)) for h in content.hands},
+            )
+        case db.TrickStartEvent():
+            result = internal.TrickStart()
+        case db.TrickEndEvent():
+            result = internal.TrickEnd(winner=content.winner)
+        case db.RoundEndEvent():
+            result = internal.RoundEnd(
+                scores={s.player_id: s.value for s in content.scores}
+            )
+        case db.GameEndEvent():
+            result = internal.GameEnd(winner=content.winner)
+        case _:
+            result = __move(content)
+
+    return result
+
+
+def __actions(db_game: db.Game) -> list[internal.Action]:
+    """Convert the moves of a game document, in either format, to game actions"""
+    match db_game:
+        case db.GameV0():
+            return list(map(__move, db_game.moves))
+        case db.GameV1():
+            return moves(
+                db_game.moves,
+                [p.player_id for p in [db_game.organizer, *db_game.players]],
+            )
+
+    # type: ignore[unreachable]
+    raise ValueError(f"Unknown game document {type(db_game)}")  # pragma: no cover
+
+
 def __person(person: db.PlayerInGame) -> internal.PlayerInGame:
     if isinstance(person, db.NaiveCpuPlayer):
         return internal.NaiveCpu(id=person.player_id)
@@ -85,8 +164,37 @@ def __move(db_move: db.Move) -> internal.Action:
 
 def __card(db_card: db.Card) -> internal.Card:
     """Convert a card from the DB to its model"""
+    return __CARDS[db_card.suit, db_card.number]
 
-    return internal.Card(
-        suit=internal.CardSuit[db_card.suit.name],
-        number=internal.CardNumber[db_card.number.name],
-    )
+
+def __unpacked_move(packed_move: bytes, player_ids: list[str]) -> internal.Action:
+    """Convert a packed DB move to a game action"""
+    player_id = player_ids[packed_move[0] & 0xF]
+
+    match db.PackedMoveType(packed_move[0] >> 4):
+        case db.PackedMoveType.BID:
+            return internal.Bid(
+                player_id=player_id, amount=internal.BidAmount(packed_move[1])
+            )
+        case db.PackedMoveType.SELECT_TRUMP:
+            return internal.SelectTrump(
+                player_id=player_id,
+                suit=internal.CardSuit[db.PACKED_SUITS[packed_move[1]].name],
+            )
+        case db.PackedMoveType.DISCARD:
+            return internal.Discard(
+                player_id=player_id,
+                cards=tuple(map(__unpacked_card, packed_move[2:])),
+            )
+        case db.PackedMoveType.PLAY:
+            return internal.Play(
+                player_id=player_id, card=__unpacked_card(packed_move[1])
+            )
+        # type: ignore[unreachable]
+        case _:  # pragma: no cover
+            raise ValueError(f"Unknown packed move type: {packed_move[0] >> 4}")
+
+
+def __unpacked_card(code: int) -> internal.Card:
+    """Convert the code of a packed card to its model"""
+    return __PACKED_CARDS[code]
@@ -4,6 +4,20 @@ from beanie import PydanticObjectId
 
 from src.models import db, internal
 
+# the DB format of every card, made once and shared by every document
+__CARDS = {
+    internal.Card.of(suit, number): db.Card(
+        suit=db.Suit[suit.name], number=db.CardNumber[number.name]
+    )
+    for suit in internal.CardSuit
+    for number in internal.CardNumber
+}
+__CARD_CODES = {
+    card: db.PACKED_SUITS.index(db_card.suit) * 16
+    + db.PACKED_NUMBERS.index(db_card.number)
+    for card, db_card in __CARDS.items()
+}
+
 
 def lobby(m_lobby: internal.Lobby) -> db.Lobby:
     """Convert a Lobby model to its DB DTO"""
@@ -26,7 +40,7 @@ def game(m_game: internal.Game) -> db.Game:
         m_game.active_player_id if m_game.status != internal.GameStatus.WON else None
     )
 
-    return db.GameV0(
+    return db.GameV1(
         id=PydanticObjectId(m_game.id) if m_game.id else None,
         name=m_game.name,
         seed=m_game.seed,
@@ -35,8 +49,27 @@ def game(m_game: internal.Game) -> db.Game:
         players=list(map(__player_in_game, m_game.players)),
         winner_player_id=winner,
         active_player_id=active_player,
-        moves=list(map(__move, m_game.actions)),
+        moves=moves(m_game.actions, [p.id for p in m_game.ordered_players]),
         status=db.Status[m_game.status.name],
+        scores=[
+            db.Score(player_id=player_id, value=value)
+            for player_id, value in m_game.scores.items()
+        ],
+        automation_pending=m_game.automation_pending,
+    )
+
+
+def moves(m_actions: list[internal.Action], player_ids: list[str]) -> bytes:
+    """Pack game actions, made by the players with the given IDs, for the DB"""
+    return b"".join(__packed_move(a, player_ids.index(a.player_id)) for a in m_actions)
+
+
+def event(m_event: internal.Event, game_id: str, sequence: int) -> db.Event:
+    """Convert a game Event model to its DB DTO"""
+    return db.EventV0(
+        game_id=PydanticObjectId(game_id),
+        sequence=sequence,
+        content=__event_content(m_event),
     )
 
 
@@ -51,7 +84,11 @@ def player(m_player: internal.Player) -> db.Player:
 
 
 def __card(card: internal.Card) -> db.Card:
-    return db.Card(suit=db.Suit[card.suit.name], number=db.CardNumber[card.number.name])
+    return __CARDS[card]
+
+
+def __card_code(card: internal.Card) -> int:
+    return __CARD_CODES[card]
 
 
 def __player_in_game(person: internal.PlayerInGame) -> db.PlayerInGame:
@@ -71,6 +108,39 @@ def __human(person: internal.Human) -> db.HumanPlayer:
     )
 
 
+def __event_content(m_event: internal.Event) -> db.EventContent:
+    content: db.EventContent
+
+    match m_event:
+        case internal.GameStart():
+            content = db.GameStartEvent()
+        case internal.RoundStart():
+            content = db.RoundStartEvent(
+                dealer=m_event.dealer,
+                hands=[
+                    db.Hand(player_id=player_id, cards=list(map(__card, cards)))
+                    for player_id, cards in m_event.hands.items()
+                ],
+            )
+        case internal.TrickStart():
+            content = db.TrickStartEvent()
+        case internal.TrickEnd():
+            content = db.TrickEndEvent(winner=m_event.winner)
+        case internal.RoundEnd():
+            content = db.RoundEndEvent(
+                scores=[
+                    db.Score(player_id=player_id, value=value)
+                    for player_id, value in m_event.scores.items()
+                ]
+            )
+        case internal.GameEnd():
+            content = db.GameEndEvent(winner=m_event.winner)
+        case _:
+            content = __move(m_event)
+
+    return content
+
+
 def __move(move: internal.Action) -> db.Move:
     """Convert a game action to a DB move"""
     if isinstance(move, internal.Bid):
@@ -98,3 +168,29 @@ def __move(move: internal.Action) -> db.Move:
             card=__card(move.card),
         )
     raise ValueError(f"Unknown move type: {type(move)}")  # pragma: no cover
+
+
+def __packed_move(move: internal.Action, player_index: int) -> bytes:
+    """Pack a game action, made by the player with the given index"""
+    if isinstance(move, internal.Bid):
+        return bytes((db.PackedMoveType.BID << 4 | player_index, move.amount))
+    if isinstance(move, internal.SelectTrump):
+        return bytes(
+            (
+                db.PackedMoveType.SELECT_TRUMP << 4 | player_index,
+                db.PACKED_SUITS.index(db.Suit[move.suit.name]),
+            )
+        )
+    if isinstance(move, internal.Discard):
+        return bytes(
+            (
+                db.PackedMoveType.DISCARD << 4 | player_index,
+                len(move.cards),
+                *map(__card_code, move.cards),
+            )
+        )
+    if isinstance(move, internal.Play):
+        return bytes(
+            (db.PackedMoveType.PLAY << 4 | player_index, __card_code(move.card))
+        )
+    raise ValueError(f"Unknown move type: {type(move)}")  # pragma: no cover
@@ -2,6 +2,7 @@
 
 from typing import Annotated, Literal
 
+from beanie import PydanticObjectId
 from pydantic import Field
 
 from .constants import CardNumberName, SelectableSuit, Suit
@@ -84,6 +85,12 @@ class SearchGamesRequest(ClientModel):
     winner_player_id: str | None = Field(default=None, alias="winner")
 
 
+class GetGamesRequest(ClientModel):
+    """Request body for retrieving several games at once"""
+
+    game_ids: list[PydanticObjectId] = Field(min_length=1, max_length=50)
+
+
 class GamePlayerLeaveRequest(ClientModel):
     """Request to leave a game as a player"""
 
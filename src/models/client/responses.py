@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Annotated, Literal
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from .constants import CardNumberName, SelectableSuit, Suit
 from .shared import ClientModel
@@ -14,7 +14,12 @@ from .shared import ClientModel
 
 
 class Card(ClientModel):
-    """A class to model the client format of a Hundred and Ten card"""
+    """A class to model the client format of a Hundred and Ten card
+
+    Frozen, as every response shares the same cards.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     suit: Suit
     number: CardNumberName
@@ -241,3 +246,15 @@ class GameResponse(ClientModel):
     scores: dict[str, int]
     active: ActiveInfo
     completed_rounds: list[CompletedRound]
+
+
+class GameSummaryResponse(ClientModel):
+    """A summary of a Hundred and Ten game, as found by search"""
+
+    id: str
+    name: str
+    players: list[PlayerInGame]
+    status: Literal["BIDDING", "TRUMP_SELECTION", "DISCARD", "TRICKS", "WON"]
+    active_player_id: str | None = None
+    winner_player_id: str | None = None
+    scores: dict[str, int]
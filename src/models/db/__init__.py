@@ -1,41 +1,90 @@
 """Init the DB module"""
 
-from .game import Game, GameV0, Status
-from .lobby import Accessibility, Lobby, LobbyV0
+from .event import (
+    Event,
+    EventContent,
+    EventV0,
+    GameEndEvent,
+    GameStartEvent,
+    Hand,
+    RoundEndEvent,
+    RoundStartEvent,
+    Score,
+    TrickEndEvent,
+    TrickStartEvent,
+)
+from .game import (
+    Game,
+    GameEventCount,
+    GamePlayers,
+    GameRevision,
+    GameSummary,
+    GameTurn,
+    GameV0,
+    GameV1,
+    Status,
+)
+from .lobby import Accessibility, Lobby, LobbyRevision, LobbyV0
 from .move import (
+    PACKED_NUMBERS,
+    PACKED_SUITS,
     BidMove,
     Card,
     CardNumber,
     DiscardMove,
     Move,
+    PackedMoveType,
     PlayMove,
     SelectableSuit,
     SelectTrumpMove,
     Suit,
+    split_packed_moves,
 )
 from .player import HumanPlayer, NaiveCpuPlayer, Player, PlayerInGame, PlayerV0
 from .setup import initialize_odm
 
 __all__ = [
+    "PACKED_NUMBERS",
+    "PACKED_SUITS",
     "Accessibility",
     "BidMove",
     "Card",
     "CardNumber",
     "DiscardMove",
+    "Event",
+    "EventContent",
+    "EventV0",
     "Game",
+    "GameEndEvent",
+    "GameEventCount",
+    "GamePlayers",
+    "GameRevision",
+    "GameStartEvent",
+    "GameSummary",
+    "GameTurn",
     "GameV0",
+    "GameV1",
+    "Hand",
     "HumanPlayer",
     "Lobby",
+    "LobbyRevision",
     "LobbyV0",
     "Move",
     "NaiveCpuPlayer",
+    "PackedMoveType",
     "PlayMove",
     "Player",
     "PlayerInGame",
     "PlayerV0",
+    "RoundEndEvent",
+    "RoundStartEvent",
+    "Score",
     "SelectTrumpMove",
     "SelectableSuit",
     "Status",
     "Suit",
+    "TrickEndEvent",
+    "TrickStartEvent",
     "initialize_odm",
+    "split_packed_moves",
 ]
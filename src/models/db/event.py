@@ -0,0 +1,102 @@
+"""Format of the events of a game of Hundred and Ten in the DB"""
+
+from abc import ABC
+from typing import Annotated, ClassVar, Literal
+
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
+
+from .move import BidMove, Card, DiscardMove, PlayMove, SelectTrumpMove
+
+
+class Hand(BaseModel):
+    """The cards dealt to a player at the start of a round"""
+
+    player_id: str
+    cards: list[Card]
+
+
+class Score(BaseModel):
+    """The score a player earned in a round"""
+
+    player_id: str
+    value: int
+
+
+class GameStartEvent(BaseModel):
+    """A game start event"""
+
+    type: Literal["game_start"] = "game_start"
+
+
+class RoundStartEvent(BaseModel):
+    """A round start event"""
+
+    type: Literal["round_start"] = "round_start"
+    dealer: str
+    hands: list[Hand]
+
+
+class TrickStartEvent(BaseModel):
+    """A trick start event"""
+
+    type: Literal["trick_start"] = "trick_start"
+
+
+class TrickEndEvent(BaseModel):
+    """A trick end event"""
+
+    type: Literal["trick_end"] = "trick_end"
+    winner: str
+
+
+class RoundEndEvent(BaseModel):
+    """A round end event"""
+
+    type: Literal["round_end"] = "round_end"
+    scores: list[Score]
+
+
+class GameEndEvent(BaseModel):
+    """A game end event"""
+
+    type: Literal["game_end"] = "game_end"
+    winner: str
+
+
+type EventContent = Annotated[
+    BidMove
+    | SelectTrumpMove
+    | DiscardMove
+    | PlayMove
+    | GameStartEvent
+    | RoundStartEvent
+    | TrickStartEvent
+    | TrickEndEvent
+    | RoundEndEvent
+    | GameEndEvent,
+    Field(discriminator="type"),
+]
+
+
+class Event(ABC, Document):
+    """A base class for logged game events"""
+
+    class Settings:
+        """Settings for the base event Beanie model"""
+
+        is_root = True
+        name = "events"  # the collection
+        class_id = "schema_version"  # the field to discriminate on
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel([("game_id", ASCENDING), ("sequence", ASCENDING)], unique=True),
+        ]
+
+    game_id: PydanticObjectId
+    sequence: int
+    content: EventContent
+
+
+class EventV0(Event):
+    """A V0 event document"""
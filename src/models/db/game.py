@@ -1,13 +1,17 @@
 """Format of a games of Hundred and Ten in the DB"""
 
-from abc import ABC
+from abc import ABC, abstractmethod
 from enum import Enum
+from typing import ClassVar
 
-from beanie import Document
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
 
-from src.models.db.lobby import Accessibility
+from src.models.db.lobby import SEARCH_INDEXES, Accessibility
 
-from .move import Move
+from .event import Score
+from .move import Move, split_packed_moves
 from .player import PlayerInGame
 
 
@@ -30,6 +34,12 @@ class Game(ABC, Document):
         is_root = True
         name = "games"  # the collection
         class_id = "schema_version"  # the field to discriminate on
+        indexes: ClassVar[list[IndexModel]] = [
+            *SEARCH_INDEXES,
+            IndexModel([("active_player_id", ASCENDING), ("status", ASCENDING)]),
+            IndexModel([("winner_player_id", ASCENDING)]),
+            IndexModel([("status", ASCENDING)]),
+        ]
 
     name: str
     seed: str
@@ -38,9 +48,84 @@ class Game(ABC, Document):
     winner_player_id: str | None
     active_player_id: str | None
     status: Status
-    moves: list[Move]
     accessibility: Accessibility
+    scores: list[Score] | None = None  # kept for summaries; None if saved before
+    event_count: int | None = None  # events in the event log; None if never logged
+    automation_pending: bool = False  # automated moves are left to make
+    saved_at: float | None = None  # epoch time of the last save; None if not kept
+    revision: int = 0  # incremented on every change to the game
+
+    @property
+    @abstractmethod
+    def move_count(self) -> int:
+        """The number of moves made in the game"""
 
 
 class GameV0(Game):
-    """A V0 game document"""
+    """A V0 game document, with a sub-document for each move"""
+
+    moves: list[Move]
+
+    @property
+    def move_count(self) -> int:
+        return len(self.moves)
+
+
+class GameV1(Game):
+    """A V1 game document, with its moves packed as described by PackedMoveType"""
+
+    moves: bytes
+
+    @property
+    def move_count(self) -> int:
+        return len(split_packed_moves(self.moves))
+
+
+class GameEventCount(BaseModel):
+    """
+    A projection of a game document to the size of its event log, and whether
+    automated moves are left to make, as of when it was saved
+    """
+
+    event_count: int | None = None
+    automation_pending: bool = False
+    saved_at: float | None = None
+
+
+class GameTurn(BaseModel):
+    """
+    A projection of a game document to whose turn it is, who won it, the size of its
+    event log, and whether automated moves are left to make, as of when it was saved
+    """
+
+    active_player_id: str | None = None
+    winner_player_id: str | None = None
+    event_count: int | None = None
+    automation_pending: bool = False
+    saved_at: float | None = None
+
+
+class GamePlayers(BaseModel):
+    """A projection of a game document to everyone in the game"""
+
+    organizer: PlayerInGame
+    players: list[PlayerInGame]
+
+
+class GameRevision(BaseModel):
+    """A projection of a game document to its revision"""
+
+    revision: int = 0
+
+
+class GameSummary(BaseModel):
+    """A projection of a game document to the fields that summarize it"""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    organizer: PlayerInGame
+    players: list[PlayerInGame]
+    winner_player_id: str | None
+    active_player_id: str | None
+    status: Status
+    scores: list[Score] | None = None
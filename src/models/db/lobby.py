@@ -2,8 +2,11 @@
 
 from abc import ABC
 from enum import Enum
+from typing import ClassVar
 
 from beanie import Document
+from pydantic import BaseModel
+from pymongo import ASCENDING, IndexModel
 
 from .player import PlayerInGame
 
@@ -15,6 +18,16 @@ class Accessibility(Enum):
     PRIVATE = "PRIVATE"
 
 
+# indexes for the name and every branch of the visibility filter that lobbies and
+# games are searched by
+SEARCH_INDEXES = [
+    IndexModel([("name", ASCENDING)]),
+    IndexModel([("accessibility", ASCENDING)]),
+    IndexModel([("organizer.player_id", ASCENDING)]),
+    IndexModel([("players.player_id", ASCENDING)]),
+]
+
+
 class Lobby(ABC, Document):
     """A base class for lobbies"""
 
@@ -24,13 +37,24 @@ class Lobby(ABC, Document):
         is_root = True
         name = "lobbies"  # the collection
         class_id = "schema_version"  # the field to discriminate on
+        indexes: ClassVar[list[IndexModel]] = [
+            *SEARCH_INDEXES,
+            IndexModel([("invitees.player_id", ASCENDING)]),
+        ]
 
     name: str
     accessibility: Accessibility
     organizer: PlayerInGame
     players: list[PlayerInGame]
     invitees: list[PlayerInGame]
+    revision: str | None = None  # changes on every save; None if saved before revisions
 
 
 class LobbyV0(Lobby):
     """A V0 lobby document"""
+
+
+class LobbyRevision(BaseModel):
+    """A projection of a lobby document to its revision"""
+
+    revision: str | None = None
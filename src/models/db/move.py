@@ -1,10 +1,10 @@
 """Format of a moves of Hundred and Ten in the DB"""
 
 from abc import ABC
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Suit(str, Enum):
@@ -46,7 +46,9 @@ class CardNumber(str, Enum):
 
 
 class Card(BaseModel):
-    """A class to model the DB format of a card"""
+    """A class to model the DB format of a card; frozen, as cards are shared"""
+
+    model_config = ConfigDict(frozen=True)
 
     suit: Suit
     number: CardNumber
@@ -91,3 +93,54 @@ class PlayMove(AbstractMove):
 type Move = Annotated[
     BidMove | SelectTrumpMove | DiscardMove | PlayMove, Field(discriminator="type")
 ]
+
+
+class PackedMoveType(IntEnum):
+    """
+    The type of a packed move, kept in the high bits of its first byte; the low bits
+    are the index of the player who moved, among the organizer and then the players.
+
+    The rest of the move is one byte: the amount of a bid, the ``PACKED_SUITS`` index
+    of a selected trump, or the card code of a play. A discard is instead a byte
+    counting its cards, then the card code of each card.
+    """
+
+    BID = 0
+    SELECT_TRUMP = 1
+    DISCARD = 2
+    PLAY = 3
+
+
+# the suits and numbers of packed cards; the code of a card is the index of its suit
+# times 16 plus the index of its number, so these must only ever be appended to
+PACKED_SUITS = (Suit.JOKER, Suit.DIAMONDS, Suit.CLUBS, Suit.HEARTS, Suit.SPADES)
+PACKED_NUMBERS = (
+    CardNumber.JOKER,
+    CardNumber.ACE,
+    CardNumber.KING,
+    CardNumber.QUEEN,
+    CardNumber.JACK,
+    CardNumber.TEN,
+    CardNumber.NINE,
+    CardNumber.EIGHT,
+    CardNumber.SEVEN,
+    CardNumber.SIX,
+    CardNumber.FIVE,
+    CardNumber.FOUR,
+    CardNumber.THREE,
+    CardNumber.TWO,
+)
+
+
+def split_packed_moves(packed: bytes) -> list[bytes]:
+    """Split packed moves into the bytes of each move"""
+    moves = []
+    start = 0
+    while start < len(packed):
+        end = start + 2
+        if packed[start] >> 4 == PackedMoveType.DISCARD:
+            end += packed[start + 1]
+        moves.append(packed[start:end])
+        start = end
+
+    return moves
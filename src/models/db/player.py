@@ -1,10 +1,11 @@
 """Format of a players of Hundred and Ten in the DB"""
 
 from abc import ABC
-from typing import Annotated, Literal
+from typing import Annotated, ClassVar, Literal
 
 from beanie import Document
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
 
 from .move import Move
 
@@ -40,6 +41,10 @@ class Player(ABC, Document):
         is_root = True
         name = "players"  # the collection
         class_id = "schema_version"  # the field to discriminate on
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel([("player_id", ASCENDING)], unique=True),
+            IndexModel([("name", ASCENDING)]),
+        ]
 
     player_id: str
     name: str
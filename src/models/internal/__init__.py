@@ -16,7 +16,7 @@ from .actions import (
     TrickStart,
 )
 from .constants import Accessibility, BidAmount, CardNumber, CardSuit, GameStatus
-from .game import Game, Lobby, PlayerGroup
+from .game import Game, GameSummary, Lobby, PlayerGroup
 from .player import Human, NaiveCpu, Player, PlayerInGame
 from .round import DiscardRecord, Round
 from .trick import Trick
@@ -36,6 +36,7 @@ __all__ = [
     "GameEnd",
     "GameStart",
     "GameStatus",
+    "GameSummary",
     "Human",
     "Lobby",
     "NaiveCpu",
@@ -23,25 +23,44 @@ from .constants import BidAmount, CardNumber, CardSuit
 
 @dataclass(frozen=True)
 class Card:
-    """Internal representation of a card"""
+    """
+    Internal representation of a card.
+
+    Cards are shared: ``of`` and the engine conversions look up the one instance of
+    each card rather than creating another.
+    """
 
     suit: CardSuit
     number: CardNumber
 
-    @classmethod
-    def from_engine(cls, engine_card: EngineCard) -> Self:
-        """Create an internal Card from an engine Card."""
-        return cls(
-            suit=CardSuit[engine_card.suit.name],
-            number=CardNumber(engine_card.number.name),
-        )
+    @staticmethod
+    def of(suit: CardSuit, number: CardNumber) -> "Card":
+        """Get the internal Card with the suit and number."""
+        return _CARDS[suit, number]
+
+    @staticmethod
+    def from_engine(engine_card: EngineCard) -> "Card":
+        """Get the internal Card of an engine Card."""
+        return _CARDS_FROM_ENGINE[engine_card]
 
     def to_engine(self) -> EngineCard:
-        """Convert this internal Card to an engine Card."""
-        return EngineCard(
-            suit=EngineCardSuit[self.suit.name],
-            number=EngineCardNumber(self.number.name),
-        )
+        """Get the engine Card of this internal Card."""
+        return _ENGINE_CARDS[self]
+
+
+_CARDS = {
+    (suit, number): Card(suit=suit, number=number)
+    for suit in CardSuit
+    for number in CardNumber
+}
+_ENGINE_CARDS = {
+    card: EngineCard(
+        suit=EngineCardSuit[card.suit.name],
+        number=EngineCardNumber(card.number.name),
+    )
+    for card in _CARDS.values()
+}
+_CARDS_FROM_ENGINE = {engine_card: card for card, engine_card in _ENGINE_CARDS.items()}
 
 
 @dataclass(frozen=True)
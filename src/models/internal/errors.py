@@ -17,5 +17,9 @@ class BadRequestError(Exception):
     """Raised when a request is incorrect (400)"""
 
 
+class ConflictError(Exception):
+    """Raised when a request conflicts with the current state of a resource (409)"""
+
+
 class InternalServerError(Exception):
     """Raised when something went wrong internally (500)"""
@@ -1,8 +1,10 @@
 """Model a Hundred and Ten game through its lifecycle (lobby and play phases)."""
 
+import os
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from dataclasses import InitVar, dataclass, field
-from typing import override
+from typing import ClassVar, override
 from uuid import uuid4
 
 from hundredandten.automation import naive
@@ -12,6 +14,8 @@ from hundredandten.engine import (
     Player as EnginePlayer,
 )
 
+from src.timing import stage
+
 from .actions import (
     Action,
     ActionFactory,
@@ -107,17 +111,55 @@ class Lobby(BaseGame):
         self.invitees.append(invitee)
 
 
+@dataclass
+class GameSummary:
+    """A summary of a Hundred and Ten game, available without playing through it"""
+
+    id: str
+    name: str
+    ordered_players: PlayerGroup
+    status: GameStatus
+    active_player_id: str | None
+    winner_player_id: str | None
+    scores: dict[str, int]
+
+
 @dataclass
 class Game(BaseGame):
     """A class to model an in-progress or completed Hundred and Ten game"""
 
+    # the most automated moves made by one change before the rest are left pending
+    automation_steps: ClassVar[int | None] = (
+        int(os.environ["GameAutomationSteps"])
+        if os.environ.get("GameAutomationSteps")
+        else None
+    )
+
     initial_actions: InitVar[list[Action] | None] = None
+    initial_event_count: InitVar[int | None] = None
+    # whether automated moves are made once the initial actions are replayed
+    initial_automation: InitVar[bool] = True
 
     # The underlying game engine (always exists for a Game)
     _engine: Engine = field(init=False, repr=False)
-
-    def __post_init__(self, initial_actions: list[Action] | None):
-        self.__initialize_engine(initial_actions or [])
+    # Events produced by changes to the game since it was created
+    _new_events: list[Event] = field(init=False, repr=False, default_factory=list)
+    # The number of events in the game when it was created, if known
+    _initial_event_count: int | None = field(init=False, repr=False, default=None)
+    # The most automated moves made by one change, if not ``automation_steps``
+    _automation_limit: int | None = field(init=False, repr=False, default=None)
+
+    def __post_init__(
+        self,
+        initial_actions: list[Action] | None,
+        initial_event_count: int | None,
+        initial_automation: bool,
+    ):
+        self.__initialize_engine(initial_actions or [], initial_automation)
+
+        # automation while initializing adds events the initial count doesn't know about
+        self._initial_event_count = None if self._new_events else initial_event_count
+        self._new_events = []
 
     @staticmethod
     def from_lobby(lobby: Lobby) -> "Game":
@@ -132,6 +174,21 @@ class Game(BaseGame):
             initial_actions=[],
         )
 
+    def clone(
+        self, event_count: int | None, automation_limit: int | None = None
+    ) -> "Game":
+        """
+        Copy the game, as if it were created as it is now with ``event_count`` events,
+        so the copy can be changed without changing this game. Each change to the copy
+        makes at most ``automation_limit`` automated moves, if given, instead of
+        ``automation_steps``; with 0, they are all left pending
+        """
+        game = deepcopy(self)
+        game._initial_event_count = event_count  # pylint: disable=protected-access
+        game._new_events = []  # pylint: disable=protected-access
+        game._automation_limit = automation_limit  # pylint: disable=protected-access
+        return game
+
     @property
     def actions(self) -> list[Action]:
         """Get all moves made in the game"""
@@ -159,6 +216,10 @@ class Game(BaseGame):
     @property
     def events(self) -> list[Event]:
         """Get all game events via action-walking replay"""
+        with stage("events"):
+            return self.__events()
+
+    def __events(self) -> list[Event]:
         replay_engine = Engine(
             players=[EnginePlayer(p.id) for p in self.ordered_players],
             seed=self.seed,
@@ -249,31 +310,103 @@ class Game(BaseGame):
             ),
         ]
 
+    @property
+    def new_events(self) -> list[Event]:
+        """Get the events produced by changes to the game since it was created"""
+        return list(self._new_events)
+
+    @property
+    def event_count(self) -> int | None:
+        """Get the number of events in the game, if it is known without a replay"""
+        if self._initial_event_count is None:
+            return None
+        return self._initial_event_count + len(self._new_events)
+
+    def count_events(self, event_count: int) -> None:
+        """Record the number of events in the game, once a replay has counted them"""
+        self._initial_event_count = event_count - len(self._new_events)
+
     @property
     def rounds(self) -> list[Round]:
         """Get all rounds as structured objects via direct engine inspection"""
 
-        return [Round(r) for r in self._engine.rounds]
+        return [Round.of(r) for r in self._engine.rounds]
 
     @property
     def scores(self) -> dict[str, int]:
         """Get current scores"""
         return self._engine.scores
 
+    @property
+    def automation_pending(self) -> bool:
+        """
+        Whether automated moves are left to make, as automation stopped after
+        ``automation_steps`` moves; ``continue_automation`` makes them
+        """
+        return (
+            not self.winner
+            and self.ordered_players.find_or_throw(
+                self.active_player_id
+            ).has_next_action()
+        )
+
+    @property
+    def summary(self) -> GameSummary:
+        """Get a summary of the game"""
+        assert self.id  # only saved games are summarized
+
+        return GameSummary(
+            id=self.id,
+            name=self.name,
+            ordered_players=self.ordered_players,
+            status=self.status,
+            active_player_id=None if self.winner else self.active_player_id,
+            winner_player_id=self.winner.id if self.winner else None,
+            scores=self.scores,
+        )
+
     @override
     def leave(self, player_id: str) -> None:
         """Automate a player (used when leaving an active game)"""
         self._update_game_player(NaiveCpu(player_id))
 
+    def continue_automation(self) -> None:
+        """
+        Make the automated moves left pending, up to ``automation_steps`` more, even
+        if changes to this game are limited to fewer
+        """
+        with stage("automation"):
+            self.__automate(Game.automation_steps)
+
     def act(self, action: Action) -> None:
         """Perform a game action"""
-        self._engine.act(action.to_engine())
+        if self._engine.winner:
+            raise BadRequestError("Cannot act on a game that has been won")
+
+        self.__act(action)
 
         self.__automated_act()
 
+    def __act(self, action: Action) -> None:
+        """Perform a game action on the engine, recording the events it produces"""
+        self._new_events.extend(Game.__events_for_action(self._engine, action))
+
+        if self._engine.winner:
+            self._new_events.append(GameEnd(winner=self._engine.winner.identifier))
+
     def __automated_act(self) -> None:
+        with stage("automation"):
+            self.__automate(
+                Game.automation_steps
+                if self._automation_limit is None
+                else self._automation_limit
+            )
+
+    def __automate(self, limit: int | None) -> None:
+        steps = 0
         while (
-            not self.winner
+            (limit is None or steps < limit)
+            and not self.winner
             and (
                 active_player := self.ordered_players.find_or_throw(
                     self.active_player_id
@@ -282,16 +415,19 @@ class Game(BaseGame):
             is not None
             and (action_request := active_player.next_action()) != NoAction()
         ):
+            steps += 1
             match action_request:
                 case ConcreteAction(action):
                     try:
-                        self._engine.act(
-                            EngineAdapter.action_for(
-                                self._engine,
-                                active_player.id,
-                                lambda _: EngineAdapter.available_action_from_engine(
-                                    action.to_engine()
-                                ),
+                        self.__act(
+                            ActionFactory.from_engine(
+                                EngineAdapter.action_for(
+                                    self._engine,
+                                    active_player.id,
+                                    lambda _: EngineAdapter.available_action_from_engine(
+                                        action.to_engine()
+                                    ),
+                                )
                             )
                         )
                     except UnavailableActionError:
@@ -299,13 +435,16 @@ class Game(BaseGame):
                             "Only Human players produce ConcreteAction; "
                             f"got {active_player}"
                         )
-                        self._update_game_player(active_player.clear_queued_actions())
+                        # carry on within this limit, rather than starting another
+                        self.__replace_player(active_player.clear_queued_actions())
                 case RequestAutomation():
-                    self._engine.act(
-                        EngineAdapter.action_for(
-                            self._engine,
-                            active_player.id,
-                            naive.action_for,
+                    self.__act(
+                        ActionFactory.from_engine(
+                            EngineAdapter.action_for(
+                                self._engine,
+                                active_player.id,
+                                naive.action_for,
+                            )
                         )
                     )
                 case _:  # pragma: no cover
@@ -329,7 +468,15 @@ class Game(BaseGame):
         self._update_game_player(player.clear_queued_actions())
 
     def _update_game_player(self, new_player: PlayerInGame):
-        """Update a game player and re-initialize the engine with that player"""
+        """Update a game player and resume automation with that player"""
+        self.__replace_player(new_player)
+        self.__automated_act()
+
+    def __replace_player(self, new_player: PlayerInGame) -> None:
+        """
+        Replace the game player with the same ID as the new player; the engine only
+        knows players by ID, so it is unaffected by the change
+        """
         original_player = self.ordered_players.find_or_throw(new_player.id)
 
         if original_player == self.organizer:
@@ -337,8 +484,6 @@ class Game(BaseGame):
         else:
             self.players[self.players.index(original_player)] = new_player
 
-        self.__initialize_engine(self.actions)
-
     def suggestions_for(self, player_id: str) -> list[Action]:
         """Return a list of suggested actions for the given player"""
         try:
@@ -354,7 +499,14 @@ class Game(BaseGame):
         except UnavailableActionError:
             return []  # if no suggestion is available, return an empty list
 
-    def __initialize_engine(self, actions: list[Action]) -> None:
+    def __initialize_engine(self, actions: list[Action], automate: bool) -> None:
+        with stage("replay"):
+            self.__replay(actions)
+
+        if automate:
+            self.__automated_act()
+
+    def __replay(self, actions: list[Action]) -> None:
         self._engine = Engine(
             players=[EnginePlayer(p.id) for p in self.ordered_players],
             seed=self.seed,
@@ -362,5 +514,3 @@ class Game(BaseGame):
 
         for a in actions:
             self._engine.act(a.to_engine())
-
-        self.__automated_act()
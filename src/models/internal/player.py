@@ -53,6 +53,10 @@ class PlayerInGame(ABC):
     def next_action(self) -> ActionRequest:
         """Return the next action for this player, or a sentinel indicating intent."""
 
+    def has_next_action(self) -> bool:
+        """Whether the player has an action to take now, without taking it"""
+        return False
+
 
 @dataclass
 class Human(PlayerInGame):
@@ -65,6 +69,9 @@ class Human(PlayerInGame):
             return NoAction()
         return ConcreteAction(self.queued_actions.popleft())
 
+    def has_next_action(self) -> bool:
+        return bool(self.queued_actions)
+
     def queue_action(self, action: Action) -> Self:
         """Queue an action for the player"""
         self.queued_actions.append(action)
@@ -83,6 +90,9 @@ class NaiveCpu(PlayerInGame):
     def next_action(self) -> ActionRequest:
         return RequestAutomation()
 
+    def has_next_action(self) -> bool:
+        return True
+
 
 @dataclass
 class PlayerInRound:
@@ -1,36 +1,77 @@
 """Internal model for a structured round of Hundred and Ten"""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
 
-from hundredandten.engine import Player as EnginePlayer, Round as EngineRound
+from hundredandten.engine import (
+    Player as EnginePlayer,
+    Round as EngineRound,
+    Status as EngineRoundStatus,
+)
+
+from src.cache import LruCache
 
 from .actions import Bid, Card, CardSuit, Play
 from .trick import Trick
 
+# completed rounds never change, so their Rounds (and everything they have computed)
+# are shared across requests, keyed by (seed, dealer, players)
+_COMPLETED_ROUNDS: LruCache[
+    tuple[str, str, tuple[str, ...]], tuple[EngineRound, "Round"]
+] = LruCache(1024)
 
-@dataclass
+
+@dataclass(frozen=True)
 class DiscardRecord:
     """A record of a discard by a player"""
 
-    discarded: list[Card]
-    received: list[Card]
+    discarded: tuple[Card, ...]
+    received: tuple[Card, ...]
 
 
 @dataclass
 class Round:
     """
     Internal representation of a single round (completed or active).
+
+    Everything about the round is computed once, when first used; a Round is a
+    view of the engine round as it was at that time.
     """
 
     _engine_round: EngineRound
 
+    @staticmethod
+    def of(engine_round: EngineRound) -> "Round":
+        """Get the Round of an engine round, reusing the Round of a completed round"""
+        if engine_round.status not in (
+            EngineRoundStatus.COMPLETED,
+            EngineRoundStatus.COMPLETED_NO_BIDDERS,
+        ):
+            return Round(engine_round)
+
+        key = (
+            engine_round.seed,
+            engine_round.dealer.identifier,
+            tuple(p.identifier for p in engine_round.players),
+        )
+        cached = _COMPLETED_ROUNDS.get(key)
+
+        # seeds are unique to a game, but confirm it is the same round regardless
+        if cached is None or cached[0].actions != engine_round.actions:
+            cached = (engine_round, Round(engine_round))
+            _COMPLETED_ROUNDS.put(key, cached)
+
+        return cached[1]
+
     @property
     def dealer_player_id(self) -> str:
         """The player ID of the dealer"""
         return self._engine_round.dealer.identifier
 
-    @property
-    def initial_hands(self) -> dict[str, list[Card]]:
+    @cached_property
+    def initial_hands(self) -> Mapping[str, tuple[Card, ...]]:
         """The initial hands of each player in this round"""
         # cheat and get initial hands by recreating the start of the round
         recreated_round = EngineRound(
@@ -40,63 +81,71 @@ class Round:
             dealer_identifier=self._engine_round.dealer.identifier,
             seed=self._engine_round.seed,
         )
-        return {
-            p.identifier: [Card.from_engine(c) for c in p.hand]
-            for p in recreated_round.players
-        }
+        return MappingProxyType(
+            {
+                p.identifier: tuple(Card.from_engine(c) for c in p.hand)
+                for p in recreated_round.players
+            }
+        )
 
-    @property
-    def current_hands(self) -> dict[str, list[Card]]:
+    @cached_property
+    def current_hands(self) -> Mapping[str, tuple[Card, ...]]:
         """The current hands of each player in this round; will be empty when complete"""
-        return {
-            p.identifier: [Card.from_engine(c) for c in p.hand]
-            for p in self._engine_round.players
-        }
+        return MappingProxyType(
+            {
+                p.identifier: tuple(Card.from_engine(c) for c in p.hand)
+                for p in self._engine_round.players
+            }
+        )
 
-    @property
-    def discards(self) -> dict[str, DiscardRecord]:
+    @cached_property
+    def discards(self) -> Mapping[str, DiscardRecord]:
         """The discard records of each player in the round; will have no keys prior to discard"""
-        current_hands = self.current_hands
-        initial_hands = self.initial_hands
-        played_cards = {
-            p.identifier: [
-                Card.from_engine(play.card)
-                for t in self._engine_round.tricks
-                for play in t.plays
-                if play.identifier == p.identifier
-            ]
-            for p in self._engine_round.players
+        if not self._engine_round.discards:
+            return MappingProxyType({})
+
+        played_cards: dict[str, list[Card]] = {
+            p.identifier: [] for p in self._engine_round.players
         }
-        return {
-            d.identifier: DiscardRecord(
-                discarded=[Card.from_engine(c) for c in d.cards],
-                received=[
+        for trick in self.tricks:
+            for play in trick.plays:
+                played_cards[play.player_id].append(play.card)
+
+        records = {}
+        for d in self._engine_round.discards:
+            initial_hand = set(self.initial_hands[d.identifier])
+            records[d.identifier] = DiscardRecord(
+                discarded=tuple(Card.from_engine(c) for c in d.cards),
+                received=tuple(
                     c
-                    for c in (current_hands[d.identifier] + played_cards[d.identifier])
-                    if c not in initial_hands[d.identifier]
-                ],
+                    for c in (
+                        *self.current_hands[d.identifier],
+                        *played_cards[d.identifier],
+                    )
+                    if c not in initial_hand
+                ),
             )
-            for d in self._engine_round.discards
-        }
 
-    @property
-    def bid_history(self) -> list[Bid]:
+        return MappingProxyType(records)
+
+    @cached_property
+    def bid_history(self) -> tuple[Bid, ...]:
         """The bid history of the round"""
-        return [Bid.from_engine(b) for b in self._engine_round.bids]
+        return tuple(Bid.from_engine(b) for b in self._engine_round.bids)
 
-    @property
-    def scores(self) -> dict[str, int]:
+    @cached_property
+    def scores(self) -> Mapping[str, int]:
         """The scores of the round"""
-        round_scores = {}
+        round_scores: dict[str, int] = {}
 
         for score in self._engine_round.scores:
             round_scores[score.identifier] = (
                 round_scores.get(score.identifier, 0) + score.value
             )
 
-        return round_scores
+        return MappingProxyType(round_scores)
 
-    @property
+    @cached_property
     def trump(self) -> CardSuit | None:
         """The trump of the round, if one is selected"""
         return (
@@ -105,21 +154,21 @@ class Round:
             else None
         )
 
-    @property
-    def tricks(self) -> list[Trick]:
+    @cached_property
+    def tricks(self) -> tuple[Trick, ...]:
         """The tricks played this round"""
-        return [
+        return tuple(
             Trick(
                 bleeding=t.bleeding,
-                plays=[Play.from_engine(p) for p in t.plays],
+                plays=tuple(Play.from_engine(p) for p in t.plays),
                 winning_play=(
                     Play.from_engine(t.winning_play) if len(t.plays) else None
                 ),
             )
             for t in self._engine_round.tricks
-        ]
+        )
 
-    @property
+    @cached_property
     def max_bid(self) -> Bid | None:
         """The greatest non-pass bid, or None if no bids have been placed or all passed"""
         if not self.bid_history:
@@ -5,10 +5,10 @@ from dataclasses import dataclass
 from .actions import Play
 
 
-@dataclass
+@dataclass(frozen=True)
 class Trick:
     """Internal representation of a trick"""
 
     bleeding: bool
     winning_play: Play | None
-    plays: list[Play]
+    plays: tuple[Play, ...]
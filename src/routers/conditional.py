@@ -0,0 +1,43 @@
+"""
+Conditional requests, so clients can skip downloading what they already have.
+"""
+
+from hashlib import sha256
+from typing import Annotated, Any
+
+from fastapi import Header, Response
+
+# the documentation of the response to a request for what the client already has
+NOT_MODIFIED: dict[int | str, dict[str, Any]] = {304: {"description": "Not Modified"}}
+
+
+def entity_tag(*parts: object) -> str:
+    """A strong entity tag for the representation identified by the parts"""
+    return f'"{sha256("\0".join(map(str, parts)).encode()).hexdigest()[:32]}"'
+
+
+class Conditional:
+    """The entity tags a client already has, as a dependency of an endpoint"""
+
+    def __init__(
+        self,
+        response: Response,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ):
+        self.response = response
+        self.if_none_match = if_none_match
+
+    def not_modified(self, tag: str) -> Response | None:
+        """
+        Tag the response, or return a Not Modified response instead if the client
+        already has the tagged representation
+        """
+        if self.if_none_match and (
+            self.if_none_match.strip() == "*"
+            or tag
+            in (t.strip().removeprefix("W/") for t in self.if_none_match.split(","))
+        ):
+            return Response(status_code=304, headers={"ETag": tag})
+
+        self.response.headers["ETag"] = tag
+        return None
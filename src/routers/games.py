@@ -2,8 +2,13 @@
 The router for game operations.
 """
 
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Annotated
+
 from beanie import PydanticObjectId
-from fastapi import APIRouter
+from fastapi import APIRouter, Body, Depends, Header, Query
+from fastapi.sse import EventSourceResponse, ServerSentEvent
+from hundredandten.engine.errors import HundredAndTenError
 
 from src.mappers.client import deserialize, serialize
 from src.models.client.requests import (
@@ -11,24 +16,52 @@ from src.models.client.requests import (
     GamePlayerKickRequest,
     GamePlayerLeaveRequest,
     GamePlayerRequest,
+    GetGamesRequest,
     SearchGamesRequest,
 )
-from src.models.client.responses import Event, GameAction, GameResponse, Player
+from src.models.client.responses import (
+    Event,
+    GameAction,
+    GameResponse,
+    GameSummaryResponse,
+    Player,
+)
+from src.models.internal import Event as InternalEvent, Game
 from src.models.internal.errors import AuthorizationError, BadRequestError
 from src.services import GameService, PlayerService
 
+from .conditional import NOT_MODIFIED, Conditional, entity_tag
+from .encoding import ModelResponse
+
+# the longest a request may wait for a turn, in seconds
+MAX_TURN_TIMEOUT = 120
+# the most actions that may be submitted together
+MAX_BATCH_ACTIONS = 50
+
 router = APIRouter(
     prefix="/players/{player_id}/games",
     tags=["Games"],
 )
 
 
-@router.get("/{game_id}", response_model=GameResponse)
-async def game_info(player_id: str, game_id: PydanticObjectId):
+@router.get("/{game_id}", response_model=GameResponse, responses=NOT_MODIFIED)
+async def game_info(
+    player_id: str,
+    game_id: PydanticObjectId,
+    conditional: Annotated[Conditional, Depends()],
+):
     """Retrieve 110 game."""
-    game = await GameService.get(game_id)
+    revision = await GameService.revision(game_id)
+    tag = entity_tag("game", game_id, revision, player_id)
+    if unchanged := conditional.not_modified(tag):
+        return unchanged
+
+    # the tagged game is at least as new as the tag, so clients never keep a stale one
+    game = await GameService.get(game_id, revision)
 
-    return serialize.game(game, player_id)
+    return ModelResponse(
+        serialize.game(game, player_id), GameResponse, conditional.response.headers
+    )
 
 
 @router.post("/{game_id}/players", response_model=list[Event])
@@ -36,87 +69,168 @@ async def leave_game(
     player_id: str, game_id: PydanticObjectId, body: GamePlayerRequest
 ):
     """Leave a 110 game (automates the player)"""
-    game = await GameService.get(game_id)
-    initial_event_knowledge = len(game.events)
 
-    match body:
-        case GamePlayerLeaveRequest():
-            game.leave(player_id)
-        case GamePlayerKickRequest():
-            if player_id != game.organizer.id:
-                raise AuthorizationError("Only the organizer may kick players")
-            game.leave(body.player_id)
-        case _:  # pragma: no cover
-            # type: ignore[unreachable]
-            raise BadRequestError(f"Invalid request {body}")
+    def leave(game: Game) -> None:
+        match body:
+            case GamePlayerLeaveRequest():
+                game.leave(player_id)
+            case GamePlayerKickRequest():
+                if player_id != game.organizer.id:
+                    raise AuthorizationError("Only the organizer may kick players")
+                game.leave(body.player_id)
+            case _:  # pragma: no cover
+                # type: ignore[unreachable]
+                raise BadRequestError(f"Invalid request {body}")
 
-    game = await GameService.save(game)
+    game = await GameService.update(game_id, leave)
 
-    return serialize.events(game.events[initial_event_knowledge:], player_id)
+    return ModelResponse(serialize.new_events(game, player_id), list[Event])
 
 
-@router.get("/{game_id}/players", response_model=list[Player])
-async def game_players(game_id: PydanticObjectId):
+@router.get("/{game_id}/players", response_model=list[Player], responses=NOT_MODIFIED)
+async def game_players(
+    game_id: PydanticObjectId,
+    conditional: Annotated[Conditional, Depends()],
+):
     """Retrieve players in a 110 game."""
-    game = await GameService.get(game_id)
+    player_ids = await GameService.player_ids(game_id)
 
-    people_ids = [p.id for p in game.ordered_players]
+    people = [
+        serialize.player(u) for u in await PlayerService.by_player_ids(player_ids)
+    ]
 
-    return [serialize.player(u) for u in await PlayerService.by_player_ids(people_ids)]
+    # players change outside of the game, so the tag is of the players themselves
+    tag = entity_tag("game-players", *(p.model_dump_json() for p in people))
+    return conditional.not_modified(tag) or ModelResponse(
+        people, list[Player], conditional.response.headers
+    )
 
 
 @router.post("/{game_id}/actions", response_model=list[Event])
 async def act(player_id: str, game_id: PydanticObjectId, body: ActRequest):
     """Act in a 110 game"""
-    game = await GameService.get(game_id)
-    initial_event_knowledge = len(game.events)
+    game = await GameService.update(
+        game_id, lambda g: g.act(deserialize.action(player_id, body))
+    )
 
-    game.act(deserialize.action(player_id, body))
+    return ModelResponse(serialize.new_events(game, player_id), list[Event])
 
-    await GameService.save(game)
 
-    return serialize.events(game.events[initial_event_knowledge:], player_id)
+@router.post("/{game_id}/actions/batch", response_model=list[Event])
+async def act_in_batch(
+    player_id: str,
+    game_id: PydanticObjectId,
+    body: Annotated[list[ActRequest], Body(min_length=1, max_length=MAX_BATCH_ACTIONS)],
+):
+    """Act several times in a 110 game, in order; if any action fails, none are saved"""
+    actions = [deserialize.action(player_id, a) for a in body]
+
+    def act_in_order(game: Game) -> None:
+        for index, action in enumerate(actions):
+            if index:
+                # other players move between the actions, even when queued
+                game.continue_automation()
+            try:
+                game.act(action)
+            except (HundredAndTenError, ValueError, BadRequestError) as exc:
+                raise BadRequestError(f"Action {index} failed: {exc}") from exc
+
+    game = await GameService.update(game_id, act_in_order)
+
+    return ModelResponse(serialize.new_events(game, player_id), list[Event])
 
 
 @router.post("/{game_id}/queued-actions", response_model=list[Event])
 async def queued_action(player_id: str, game_id: PydanticObjectId, body: ActRequest):
     """Queue an action in a 110 game"""
-    game = await GameService.get(game_id)
-    initial_event_knowledge = len(game.events)
-
-    game.queue_action_for(player_id, deserialize.action(player_id, body))
+    game = await GameService.update(
+        game_id,
+        lambda g: g.queue_action_for(player_id, deserialize.action(player_id, body)),
+    )
 
-    game = await GameService.save(game)
-
-    return serialize.events(game.events[initial_event_knowledge:], player_id)
+    return ModelResponse(serialize.new_events(game, player_id), list[Event])
 
 
 @router.delete("/{game_id}/queued-actions", response_model=list[Event])
 async def remove_queued_action(player_id: str, game_id: PydanticObjectId):
     """Clear all queued actions for a player in a 110 game"""
-    game = await GameService.get(game_id)
-    initial_event_knowledge = len(game.events)
-
-    game.clear_queued_actions_for(player_id)
+    game = await GameService.update(
+        game_id, lambda g: g.clear_queued_actions_for(player_id)
+    )
 
-    await GameService.save(game)
+    return ModelResponse(serialize.new_events(game, player_id), list[Event])
 
-    return serialize.events(game.events[initial_event_knowledge:], player_id)
 
-
-@router.get("/{game_id}/events", response_model=list[Event])
+@router.get("/{game_id}/events", response_model=list[Event], responses=NOT_MODIFIED)
 async def events(
     player_id: str,
     game_id: PydanticObjectId,
+    conditional: Annotated[Conditional, Depends()],
     skip: int = 0,
     limit: int | None = None,
 ):
     """Retrieve the events in a 110 game."""
-    game = await GameService.get(game_id)
+    tag = entity_tag(
+        "events", game_id, await GameService.revision(game_id), player_id, skip, limit
+    )
+    if unchanged := conditional.not_modified(tag):
+        return unchanged
 
-    return serialize.events(game.events, player_id)[
-        skip : (skip + limit) if limit else None
-    ]
+    start, game_events = await GameService.events(game_id, skip, limit)
+
+    return ModelResponse(
+        serialize.events(game_events, player_id, start),
+        list[Event],
+        conditional.response.headers,
+    )
+
+
+async def followed_events(
+    game_id: PydanticObjectId,
+    skip: int = 0,
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> AsyncIterator[tuple[int, list[InternalEvent]]]:
+    """Follow the events of a game from where the client left off"""
+    return await GameService.follow_events(
+        game_id, skip if last_event_id is None else last_event_id + 1
+    )
+
+
+@router.get("/{game_id}/events/stream", response_class=EventSourceResponse)
+async def stream_events(
+    player_id: str,
+    pages: Annotated[
+        AsyncIterator[tuple[int, list[InternalEvent]]], Depends(followed_events)
+    ],
+) -> AsyncIterable[ServerSentEvent]:
+    """
+    Stream the events in a 110 game as they happen.
+
+    The Azure Functions ASGI adapter sends a response only once it is complete, so
+    there the events arrive together when the stream ends, after at most
+    ``GameService.follow_duration`` seconds; clients that need each event as it
+    happens wait for their turn instead.
+    """
+    async for start, game_events in pages:
+        for event in serialize.events(game_events, player_id, start):
+            yield ServerSentEvent(
+                id=str(event.sequence), raw_data=event.model_dump_json(by_alias=True)
+            )
+
+
+@router.get("/{game_id}/turn", response_model=list[Event])
+async def wait_for_turn(
+    player_id: str,
+    game_id: PydanticObjectId,
+    after_sequence: Annotated[int, Query(alias="afterSequence", ge=-1)] = -1,
+    timeout: Annotated[float, Query(ge=0, le=MAX_TURN_TIMEOUT)] = 30,
+):
+    """Wait for the player's turn, or new events, in a 110 game."""
+    start, game_events = await GameService.wait_for_turn(
+        game_id, player_id, after_sequence, timeout
+    )
+
+    return ModelResponse(serialize.events(game_events, player_id, start), list[Event])
 
 
 @router.get("/{game_id}/suggestions", response_model=list[GameAction])
@@ -124,12 +238,26 @@ async def suggestion(player_id: str, game_id: PydanticObjectId):
     """Ask for suggestions in a 110 game"""
     game = await GameService.get(game_id)
 
-    return [serialize.action(s) for s in game.suggestions_for(player_id)]
+    return ModelResponse(
+        [serialize.action(s) for s in game.suggestions_for(player_id)],
+        list[GameAction],
+    )
+
+
+@router.post("/bulk", response_model=list[GameResponse])
+async def games_info(player_id: str, body: GetGamesRequest):
+    """Retrieve several 110 games at once; games that do not exist are left out."""
+    games = await GameService.get_many(body.game_ids)
 
+    return ModelResponse(
+        [serialize.game(game, player_id) for game in games], list[GameResponse]
+    )
 
-@router.post("/search", response_model=list[GameResponse])
+
+@router.post("/search", response_model=list[GameSummaryResponse])
 async def search_games(player_id: str, body: SearchGamesRequest):
     """Search for games"""
-    return [
-        serialize.game(g, player_id) for g in await GameService.search(player_id, body)
-    ]
+    return ModelResponse(
+        [serialize.game_summary(g) for g in await GameService.search(player_id, body)],
+        list[GameSummaryResponse],
+    )
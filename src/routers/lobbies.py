@@ -2,8 +2,10 @@
 The router for lobby operations.
 """
 
+from typing import Annotated
+
 from beanie import PydanticObjectId
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.mappers.client import serialize
 from src.models.client.requests import (
@@ -25,6 +27,9 @@ from src.models.internal import (
 from src.models.internal.errors import AuthorizationError, BadRequestError
 from src.services import LobbyService, PlayerService
 
+from .conditional import NOT_MODIFIED, Conditional, entity_tag
+from .encoding import ModelResponse
+
 MIN_PLAYERS = 4
 
 router = APIRouter(
@@ -44,15 +49,26 @@ async def create_lobby(player_id: str, body: CreateLobbyRequest):
 
     lobby = await LobbyService.save(lobby)
 
-    return serialize.lobby(lobby)
+    return ModelResponse(serialize.lobby(lobby), LobbyResponse)
 
 
-@router.get("/{lobby_id}", response_model=LobbyResponse)
-async def lobby_info(lobby_id: PydanticObjectId):
+@router.get("/{lobby_id}", response_model=LobbyResponse, responses=NOT_MODIFIED)
+async def lobby_info(
+    lobby_id: PydanticObjectId,
+    conditional: Annotated[Conditional, Depends()],
+):
     """Retrieve 110 lobby."""
+    revision = await LobbyService.revision(lobby_id)
+    if revision and (
+        unchanged := conditional.not_modified(entity_tag("lobby", lobby_id, revision))
+    ):
+        return unchanged
+
     lobby = await LobbyService.get(lobby_id)
 
-    return serialize.lobby(lobby)
+    return ModelResponse(
+        serialize.lobby(lobby), LobbyResponse, conditional.response.headers
+    )
 
 
 @router.post("/{lobby_id}/players", response_model=LobbyResponse)
@@ -79,17 +95,24 @@ async def invite_to_lobby(
 
     lobby = await LobbyService.save(lobby)
 
-    return serialize.lobby(lobby)
+    return ModelResponse(serialize.lobby(lobby), LobbyResponse)
 
 
-@router.get("/{lobby_id}/players", response_model=list[Player])
-async def lobby_players(lobby_id: PydanticObjectId):
+@router.get("/{lobby_id}/players", response_model=list[Player], responses=NOT_MODIFIED)
+async def lobby_players(
+    lobby_id: PydanticObjectId,
+    conditional: Annotated[Conditional, Depends()],
+):
     """Retrieve players in a 110 lobby."""
     lobby = await LobbyService.get(lobby_id)
 
-    people_ids = [p.id for p in lobby.ordered_players]
+    people = [serialize.player(u) for u in await PlayerService.participants(lobby)]
 
-    return [serialize.player(u) for u in await PlayerService.by_player_ids(people_ids)]
+    # players change outside of the lobby, so the tag is of the players themselves
+    tag = entity_tag("lobby-players", *(p.model_dump_json() for p in people))
+    return conditional.not_modified(tag) or ModelResponse(
+        people, list[Player], conditional.response.headers
+    )
 
 
 @router.post("/{lobby_id}/start", response_model=list[Event])
@@ -109,16 +132,19 @@ async def start_game(player_id: str, lobby_id: PydanticObjectId):
     # Start the game (converts lobby record to game record)
     game = await LobbyService.start_game(lobby)
 
-    return serialize.events(game.events, player_id)
+    return ModelResponse(serialize.events(game.events, player_id), list[Event])
 
 
 @router.post("/search", response_model=list[LobbyResponse])
 async def search_lobbies(player_id: str, body: SearchLobbiesRequest):
     """Search for lobbies"""
-    return [
-        serialize.lobby(lobby)
-        for lobby in await LobbyService.search(
-            player_id,
-            body,
-        )
-    ]
+    return ModelResponse(
+        [
+            serialize.lobby(lobby)
+            for lobby in await LobbyService.search(
+                player_id,
+                body,
+            )
+        ],
+        list[LobbyResponse],
+    )
@@ -13,6 +13,8 @@ from src.models.client.responses import Player
 from src.models.internal import Player as InternalPlayer
 from src.services import PlayerService
 
+from .encoding import ModelResponse
+
 router = APIRouter(
     prefix="/players/{player_id}",
     tags=["Players"],
@@ -24,7 +26,9 @@ async def get_player(
     player_id: str,
 ):
     """Get player"""
-    return serialize.player(await PlayerService.by_player_id(player_id))
+    return ModelResponse(
+        serialize.player(await PlayerService.by_player_id(player_id)), Player
+    )
 
 
 @router.put("", response_model=Player)
@@ -32,20 +36,22 @@ async def refresh(
     identity: Annotated[Identity, Depends(get_authorized_identity_for_path_player)],
 ):
     """Save the authenticated principal as a player in the DB"""
-    return serialize.player(
-        await PlayerService.save(
-            InternalPlayer(
-                player_id=identity.id,
-                name=identity.name or identity.id,
-                picture_url=identity.picture_url,
-            )
+    player = await PlayerService.save(
+        InternalPlayer(
+            player_id=identity.id,
+            name=identity.name or identity.id,
+            picture_url=identity.picture_url,
         )
     )
 
+    return ModelResponse(serialize.player(player), Player)
+
 
 @router.post("/search", response_model=list[Player])
 async def search_players(
     body: SearchPlayersRequest,
 ):
     """Search players"""
-    return [serialize.player(u) for u in await PlayerService.search(body)]
+    return ModelResponse(
+        [serialize.player(u) for u in await PlayerService.search(body)], list[Player]
+    )
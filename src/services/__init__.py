@@ -2,6 +2,28 @@
 
 from .game import GameService
 from .lobby import LobbyService
+from .notifier import GameNotifier
 from .player import PlayerService
+from .queue import (
+    ADVANCE_GAME_QUEUE,
+    AdvanceGame,
+    GameQueue,
+    MemoryGameQueue,
+    StorageGameQueue,
+    queue_from_environment,
+)
+from .runner import GameRunner
 
-__all__ = ["GameService", "LobbyService", "PlayerService"]
+__all__ = [
+    "ADVANCE_GAME_QUEUE",
+    "AdvanceGame",
+    "GameNotifier",
+    "GameQueue",
+    "GameRunner",
+    "GameService",
+    "LobbyService",
+    "MemoryGameQueue",
+    "PlayerService",
+    "StorageGameQueue",
+    "queue_from_environment",
+]
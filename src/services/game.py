@@ -1,36 +1,411 @@
 """Facilitate interaction with the game DB"""
 
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from time import monotonic, time
+
 from beanie import PydanticObjectId
-from beanie.operators import ElemMatch, In, Or, RegEx
+from beanie.exceptions import DocumentNotFound
+from beanie.operators import ElemMatch, In, Inc, Or, RegEx, Set
+from pymongo.results import UpdateResult
 
+from src.cache import LruCache
 from src.mappers.db import deserialize, serialize
 from src.models.client.requests import SearchGamesRequest
-from src.models.db import Game as DbGame
+from src.models.db import (
+    Event as DbEvent,
+    Game as DbGame,
+    GameEventCount,
+    GamePlayers,
+    GameRevision,
+    GameSummary as DbGameSummary,
+    GameTurn,
+    GameV1 as DbGameV1,
+)
 from src.models.db.lobby import Accessibility
-from src.models.internal import Game
-from src.models.internal.errors import NotFoundError
+from src.models.internal import Event, Game, GameEnd, GameSummary
+from src.models.internal.errors import ConflictError, NotFoundError
+from src.timing import timed
+
+from .notifier import GameNotifier
+from .queue import AdvanceGame, GameQueue, queue_from_environment
+from .runner import GameRunner
+
+
+@dataclass
+class CachedGame:
+    """A game, as loaded from its document, kept for later requests"""
+
+    document: DbGame
+    game: Game  # never changed once cached; changes are made to clones
+    event_count: int | None  # the events of the game in the event log, if known
+    verified_at: float  # when the document was last known to be the latest
 
 
 class GameService:
     """A service used to handle the business logic of games"""
 
+    # the fields of a saved game that can change as it is played
+    __CHANGEABLE_FIELDS = (
+        "moves",
+        "organizer",
+        "players",
+        "winner_player_id",
+        "active_player_id",
+        "status",
+        "scores",
+        "event_count",
+        "automation_pending",
+        "saved_at",
+    )
+
+    # the number of times a change is applied before giving up on concurrent changes
+    __UPDATE_ATTEMPTS = 3
+
+    # the games most recently used by this instance
+    cache: LruCache[PydanticObjectId, CachedGame] = LruCache(
+        int(os.environ.get("GameCacheSize", "256"))
+    )
+    # how long, in seconds, a cached game is read without checking it is the latest
+    cache_max_age = float(os.environ.get("GameCacheMaxAge", "0"))
+
+    # how long, in seconds, events are followed before the follower must reconnect;
+    # kept well under the 230 seconds Azure allows an HTTP request to run
+    __MAX_FOLLOW_DURATION = 200
+    follow_duration = min(
+        float(os.environ.get("GameEventFollowDuration", "180")), __MAX_FOLLOW_DURATION
+    )
+    # how often, in seconds, waiting requests check for saves by other instances
+    follow_interval = float(os.environ.get("GameEventFollowInterval", "5"))
+
+    # where games with automated moves to make are sent; if None, reads make them
+    queue: GameQueue | None = queue_from_environment()
+    # how long, in seconds, a queued game's moves are left to the queue before reads
+    # make them instead, as its message may have been lost
+    queue_timeout = float(os.environ.get("AdvanceGameQueueTimeout", "60"))
+
     @staticmethod
+    @timed("gameService")
     async def save(game: Game) -> Game:
-        """Save the provided game to the DB"""
-        return deserialize.game(await serialize.game(game).save())
+        """Save the provided game and its new events to the DB"""
+        await GameService.__save(game)
+        return game
 
     @staticmethod
-    async def get(game_id: PydanticObjectId) -> Game:
-        """Retrieve the game with the provided ID"""
-        result = await DbGame.get(game_id, with_children=True)
+    @timed("gameService")
+    async def update(game_id: PydanticObjectId, change: Callable[[Game], None]) -> Game:
+        """
+        Apply a change to the game with the provided ID and save the result.
+
+        The change is made to a copy of the latest game, which is only replayed if
+        it is not cached; the returned game lists the events produced by the change
+        in ``new_events``. Only the parts of the game that changed are written.
+
+        If the game is changed concurrently, the change is applied again to the
+        latest game; a ConflictError is raised if that keeps happening.
+
+        With a ``queue``, the change makes no automated moves itself (though it may
+        ``continue_automation``); they are left pending and the game is queued for
+        ``advance`` to make them.
+        """
+        automation_limit = None if GameService.queue is None else 0
+        for _ in range(GameService.__UPDATE_ATTEMPTS):
+            cached_game = await GameService.__load(game_id)
+            game = cached_game.game.clone(cached_game.event_count, automation_limit)
+            await GameRunner.change(game, cached_game.document.move_count, change)
+            if await GameService.__save(game, cached_game.document):
+                return game
+
+        raise ConflictError(f"Game {game_id} is being changed by another request")
+
+    @staticmethod
+    @timed("gameService")
+    async def advance(message: AdvanceGame) -> None:
+        """
+        Make, and save, the automated moves left pending in a queued game.
+
+        Nothing is done if the game has been saved since it was queued, as that save
+        queued the game again if it needed to; so a message can be handled more than
+        once. If the moves are still not all made, the game is queued again.
+        """
+        game_id = PydanticObjectId(message.game_id)
+        cached_game = await GameService.__load(game_id)
+        if (
+            cached_game.document.revision != message.revision
+            or not cached_game.game.automation_pending
+        ):
+            return
+
+        game = cached_game.game.clone(cached_game.event_count)
+        await GameRunner.change(
+            game, cached_game.document.move_count, Game.continue_automation
+        )
+        await GameService.__save(game, cached_game.document)
+
+    @staticmethod
+    @timed("gameService")
+    async def get(game_id: PydanticObjectId, revision: int | None = None) -> Game:
+        """
+        Retrieve the game with the provided ID, to read.
+
+        The game may be shared with other requests, so must not be changed. Given
+        the ``revision`` the game was just read at, the game is at least that new;
+        otherwise, it may be up to ``cache_max_age`` seconds out of date. Automated
+        moves left pending in the game are made, and saved, first.
+        """
+        cached_game = await GameService.__load(
+            game_id, GameService.cache_max_age, revision
+        )
+        if GameService.__continues_on_read(
+            cached_game.game.automation_pending, cached_game.document.saved_at
+        ):
+            return await GameService.__continue_automation(game_id)
+
+        return cached_game.game
+
+    @staticmethod
+    @timed("gameService")
+    async def get_many(game_ids: list[PydanticObjectId]) -> list[Game]:
+        """
+        Retrieve the games with the provided IDs, to read, in the order of the IDs.
+
+        Games that do not exist are left out. Games that are not cached are read in
+        one query and replayed concurrently by the ``GameRunner``; as with ``get``,
+        cached games may be up to ``cache_max_age`` seconds out of date, and automated
+        moves left pending are made first.
+        """
+        games = await GameService.__load_many(game_ids)
+
+        pending = [
+            i
+            for i, g in games.items()
+            if GameService.__continues_on_read(
+                g.game.automation_pending, g.document.saved_at
+            )
+        ]
+        continued_games = dict(
+            zip(
+                pending,
+                await asyncio.gather(*map(GameService.__continue_automation, pending)),
+            )
+        )
+
+        return [
+            continued_games.get(game_id) or games[game_id].game
+            for game_id in game_ids
+            if game_id in games
+        ]
+
+    @staticmethod
+    async def __load_many(
+        game_ids: list[PydanticObjectId],
+    ) -> dict[PydanticObjectId, CachedGame]:
+        """
+        Load the games with the provided IDs that exist, from the cache where it is
+        fresh enough and otherwise in one query, replaying them concurrently
+        """
+        games: dict[PydanticObjectId, CachedGame] = {}
+        stale: dict[PydanticObjectId, CachedGame | None] = {}
+        for game_id in dict.fromkeys(game_ids):
+            cached_game = GameService.cache.get(game_id)
+            if (
+                cached_game is not None
+                and monotonic() - cached_game.verified_at <= GameService.cache_max_age
+            ):
+                games[game_id] = cached_game
+            else:
+                stale[game_id] = cached_game
+
+        if stale:
+            db_games = {
+                g.id: g
+                for g in await DbGame.find(
+                    In(DbGame.id, list(stale)), with_children=True
+                ).to_list()
+                if g.id
+            }
+            loaded_games = await asyncio.gather(
+                *(GameService.__reload(g, stale[i]) for i, g in db_games.items())
+            )
+            games.update(zip(db_games, loaded_games))
+
+        return games
+
+    @staticmethod
+    @timed("gameService")
+    async def revision(game_id: PydanticObjectId) -> int:
+        """
+        Retrieve the revision of the game with the provided ID, which changes
+        whenever the game is saved
+        """
+        revision = await GameService.__revision(game_id)
+        if revision is None:
+            raise NotFoundError(f"No game found with id {game_id}")
+
+        return revision
+
+    @staticmethod
+    @timed("gameService")
+    async def player_ids(game_id: PydanticObjectId) -> list[str]:
+        """
+        Retrieve the IDs of everyone in the game with the provided ID, in order,
+        without loading the game
+        """
+        result = await DbGame.find_one(
+            DbGame.id == game_id, with_children=True
+        ).project(GamePlayers)
+        if not result:
+            raise NotFoundError(f"No game found with id {game_id}")
+
+        return [p.player_id for p in [result.organizer, *result.players]]
+
+    @staticmethod
+    @timed("gameService")
+    async def events(
+        game_id: PydanticObjectId, skip: int = 0, limit: int | None = None
+    ) -> tuple[int, list[Event]]:
+        """
+        Retrieve a page of events of the game with the provided ID, along with the
+        sequence of the first event in the page.
+
+        Events are read from the game's event log when it is complete, so only the
+        requested events are loaded; otherwise the game is replayed. Automated moves
+        left pending in the game are made, and saved, first.
+        """
+        result = await DbGame.find_one(
+            DbGame.id == game_id, with_children=True
+        ).project(GameEventCount)
         if not result:
             raise NotFoundError(f"No game found with id {game_id}")
 
-        return deserialize.game(result)
+        if GameService.__continues_on_read(result.automation_pending, result.saved_at):
+            await GameService.__continue_automation(game_id)
+            result = await DbGame.find_one(
+                DbGame.id == game_id, with_children=True
+            ).project(GameEventCount)
+            assert result  # the game was just saved
+
+        return await GameService.__events(game_id, result.event_count, skip, limit)
+
+    @staticmethod
+    async def __events(
+        game_id: PydanticObjectId,
+        event_count: int | None,
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> tuple[int, list[Event]]:
+        """
+        Read a page of events of the game with the provided ID, as ``events`` does,
+        given the size of its event log, without making pending automated moves
+        """
+        page = slice(skip, (skip + limit) if limit else None)
+
+        if event_count is not None:
+            start, stop, _ = page.indices(event_count)
+            logged_events = (
+                await DbEvent.find(
+                    DbEvent.game_id == game_id,
+                    DbEvent.sequence >= start,
+                    DbEvent.sequence < stop,
+                    with_children=True,
+                )
+                .sort("+sequence")
+                .to_list()
+            )
+            if [e.sequence for e in logged_events] == list(range(start, stop)):
+                return start, list(map(deserialize.event, logged_events))
+
+        cached_game = await GameService.__load(game_id)
+        game_events = await GameRunner.events(
+            cached_game.game, cached_game.document.move_count
+        )
+        start, stop, _ = page.indices(len(game_events))
+        return start, game_events[start:stop]
+
+    @staticmethod
+    @timed("gameService")
+    async def follow_events(
+        game_id: PydanticObjectId, skip: int = 0
+    ) -> AsyncIterator[tuple[int, list[Event]]]:
+        """
+        Follow the events of the game with the provided ID, starting from ``skip``.
+
+        The first page of events is read immediately, so a missing game is reported
+        here. The returned iterator produces pages of events, with the sequence of
+        the first event in each, as they are saved; it ends once the game has ended
+        or after ``follow_duration`` seconds.
+        """
+        start, game_events = await GameService.events(game_id, skip)
+        ended = any(isinstance(e, GameEnd) for e in game_events) or (
+            not game_events and (await GameService.get(game_id)).winner is not None
+        )
+        return GameService.__follow(game_id, start, game_events, ended)
+
+    @staticmethod
+    @timed("gameService")
+    async def wait_for_turn(
+        game_id: PydanticObjectId, player_id: str, after_sequence: int, timeout: float
+    ) -> tuple[int, list[Event]]:
+        """
+        Wait, for up to ``timeout`` seconds, until it is the player's turn in the game
+        with the provided ID or events after ``after_sequence`` have been saved; a
+        game that has been won has no turns left to wait for.
+
+        Return the events after ``after_sequence``, with the sequence of the first.
+        Only whose turn it is and the size of the event log are read while waiting.
+        """
+        deadline = monotonic() + timeout
+
+        with GameNotifier.listen(str(game_id)) as saved:
+            while True:
+                saved.clear()
+                turn = await DbGame.find_one(
+                    DbGame.id == game_id, with_children=True
+                ).project(GameTurn)
+                if not turn:
+                    raise NotFoundError(f"No game found with id {game_id}")
+
+                if GameService.__continues_on_read(
+                    turn.automation_pending, turn.saved_at
+                ):
+                    # make one budget of the moves per wake-up, then check the turn
+                    await GameService.__continue_automation(game_id)
+                    turn = await DbGame.find_one(
+                        DbGame.id == game_id, with_children=True
+                    ).project(GameTurn)
+                    assert turn  # the game was just saved
+
+                if (
+                    turn.active_player_id == player_id
+                    or turn.winner_player_id is not None
+                    or turn.event_count is None
+                    or turn.event_count > after_sequence + 1
+                ):
+                    # the moves of this wake-up were made above, so none are made here
+                    return await GameService.__events(
+                        game_id, turn.event_count, after_sequence + 1
+                    )
+                if monotonic() >= deadline:
+                    return after_sequence + 1, []
+
+                await GameService.__wait(saved, deadline)
 
     @staticmethod
-    async def search(player_id: str, search_game: SearchGamesRequest) -> list[Game]:
-        """Search for games matching the provided criteria"""
+    @timed("gameService")
+    async def search(
+        player_id: str, search_game: SearchGamesRequest
+    ) -> list[GameSummary]:
+        """
+        Search for games matching the provided criteria.
+
+        Only the summary of each game is read, so no game is replayed unless it
+        was saved before its summary was kept; those games are read together in one
+        query and replayed, without being saved, and keep their summary the next
+        time they are saved.
+        """
 
         filters = [
             RegEx(DbGame.name, search_game.search_text, "i"),
@@ -47,12 +422,250 @@ class GameService:
         if search_game.statuses is not None:
             filters.append(In(DbGame.status, search_game.statuses))
 
-        return list(
-            map(
-                deserialize.game,
-                await DbGame.find(*filters, with_children=True)
-                .limit(search_game.limit)
-                .skip(search_game.offset)
-                .to_list(),
+        summaries = (
+            await DbGame.find(*filters, with_children=True)
+            .limit(search_game.limit)
+            .skip(search_game.offset)
+            .project(DbGameSummary)
+            .to_list()
+        )
+        legacy_games = await GameService.__load_many(
+            [s.id for s in summaries if s.scores is None]
+        )
+
+        return [
+            (
+                deserialize.game_summary(summary)
+                if summary.scores is not None
+                else legacy_games[summary.id].game.summary
+            )
+            for summary in summaries
+            if summary.scores is not None or summary.id in legacy_games
+        ]
+
+    @staticmethod
+    async def __follow(
+        game_id: PydanticObjectId, start: int, game_events: list[Event], ended: bool
+    ) -> AsyncIterator[tuple[int, list[Event]]]:
+        """Produce the page of events, then each page saved after it until the end"""
+        if game_events:
+            yield start, game_events
+        deadline = monotonic() + GameService.follow_duration
+
+        with GameNotifier.listen(str(game_id)) as saved:
+            while not ended and monotonic() < deadline:
+                # read after listening begins, so no save goes unnoticed
+                saved.clear()
+                start, game_events = await GameService.events(
+                    game_id, start + len(game_events)
+                )
+                if game_events:
+                    yield start, game_events
+                    ended = any(isinstance(e, GameEnd) for e in game_events)
+                    continue
+
+                await GameService.__wait(saved, deadline)
+
+    @staticmethod
+    def __continues_on_read(automation_pending: bool, saved_at: float | None) -> bool:
+        """
+        Whether reading a game, with automated moves pending as of when it was saved,
+        makes them: they are made by reads unless there is a ``queue``, and then only
+        once they have been left to it for longer than ``queue_timeout`` seconds
+        """
+        return automation_pending and (
+            GameService.queue is None
+            or saved_at is None
+            or time() - saved_at > GameService.queue_timeout
+        )
+
+    @staticmethod
+    async def __continue_automation(game_id: PydanticObjectId) -> Game:
+        """Make, and save, the automated moves left pending in the game"""
+        return await GameService.update(game_id, Game.continue_automation)
+
+    @staticmethod
+    async def __wait(saved: asyncio.Event, deadline: float) -> None:
+        """
+        Wait until the game is saved on this instance, it is time to check for saves
+        by other instances, or the deadline passes
+        """
+        with suppress(TimeoutError):
+            await asyncio.wait_for(
+                saved.wait(), min(GameService.follow_interval, deadline - monotonic())
+            )
+
+    @staticmethod
+    async def __load(
+        game_id: PydanticObjectId, max_age: float = 0, revision: int | None = None
+    ) -> CachedGame:
+        """
+        Load the game with the provided ID, from the cache if possible.
+
+        Given the ``revision`` the game was just read at, a cached game is used if
+        it is of that revision. Otherwise, a cached game is used without checking it
+        is the latest if it was verified in the last ``max_age`` seconds, or else
+        only if its revision is the latest.
+        """
+        cached_game = GameService.cache.get(game_id)
+        if cached_game is not None:
+            if revision is None and monotonic() - cached_game.verified_at <= max_age:
+                return cached_game
+            if revision is None:
+                revision = await GameService.__revision(game_id)
+            if revision == cached_game.document.revision:
+                cached_game.verified_at = monotonic()
+                return cached_game
+
+        db_game = await GameService.__get(game_id)
+        game = await GameRunner.replay(db_game)
+        return GameService.__cache(db_game, game, game.event_count)
+
+    @staticmethod
+    async def __reload(db_game: DbGame, cached_game: CachedGame | None) -> CachedGame:
+        """
+        Cache the game as read from the document, replaying it unless the cached
+        game is of the same revision
+        """
+        if (
+            cached_game is not None
+            and cached_game.document.revision == db_game.revision
+        ):
+            cached_game.verified_at = monotonic()
+            return cached_game
+
+        game = await GameRunner.replay(db_game)
+        return GameService.__cache(db_game, game, game.event_count)
+
+    @staticmethod
+    def __cache(db_game: DbGame, game: Game, event_count: int | None) -> CachedGame:
+        """Cache the game as loaded from, or saved to, the document"""
+        assert db_game.id  # only saved games are cached
+        cached_game = CachedGame(
+            document=db_game,
+            game=game,
+            event_count=event_count,
+            verified_at=monotonic(),
+        )
+        GameService.cache.put(db_game.id, cached_game)
+        return cached_game
+
+    @staticmethod
+    async def __revision(game_id: PydanticObjectId) -> int | None:
+        """Retrieve the revision of the game with the provided ID, if it exists"""
+        result = await DbGame.find_one(
+            DbGame.id == game_id, with_children=True
+        ).project(GameRevision)
+        return result.revision if result else None
+
+    @staticmethod
+    async def __get(game_id: PydanticObjectId) -> DbGame:
+        """Retrieve the game document with the provided ID"""
+        result = await DbGame.get(game_id, with_children=True)
+        if not result:
+            raise NotFoundError(f"No game found with id {game_id}")
+
+        return result
+
+    @staticmethod
+    async def __save(game: Game, saved_game: DbGame | None = None) -> bool:
+        """
+        Save the provided game and its new events to the DB.
+
+        When the game was loaded from ``saved_game``, only the changes since then
+        are written, and only if the game has not been saved since it was loaded;
+        otherwise the whole game is. Return whether the game was saved.
+        """
+        db_game = serialize.game(game)
+        event_count = game.event_count
+
+        if event_count is None:
+            # the event log is missing or out of date; rebuild it from a replay
+            unlogged_events = await GameRunner.events(game, db_game.move_count)
+            event_count = len(unlogged_events)
+            game.count_events(event_count)
+        else:
+            unlogged_events = game.new_events
+
+        db_game.event_count = event_count
+        db_game.saved_at = time()
+        if saved_game is None:
+            await db_game.save()
+        elif await GameService.__save_changes(saved_game, db_game):
+            db_game.revision = saved_game.revision + 1
+        else:
+            return False
+        game.id = str(db_game.id)
+        GameService.__cache(db_game, game, event_count)
+
+        await GameService.__log_events(
+            game.id, event_count - len(unlogged_events), unlogged_events
+        )
+        GameNotifier.notify(game.id)
+
+        if GameService.queue is not None and db_game.automation_pending:
+            await GameService.queue.send(
+                AdvanceGame(game_id=game.id, revision=db_game.revision)
             )
+
+        return True
+
+    @staticmethod
+    async def __save_changes(saved_game: DbGame, db_game: DbGame) -> bool:
+        """
+        Write the changes from the saved game document to the new one: set the fields
+        that changed, and move to the next revision. A saved V0 document is replaced
+        whole instead, so its moves are packed as the new document's are.
+
+        Return False, without writing, when the saved document has been saved again
+        since it was loaded.
+        """
+        unchanged_game = DbGame.find_one(
+            DbGame.id == saved_game.id,
+            (
+                DbGame.revision == saved_game.revision
+                if saved_game.revision
+                # games saved before revisions were tracked have none stored
+                else In(DbGame.revision, [0, None])
+            ),
+            with_children=True,
+        )
+
+        if not isinstance(saved_game, DbGameV1):
+            db_game.revision = saved_game.revision + 1
+            try:
+                await unchanged_game.replace_one(db_game)
+            except DocumentNotFound:
+                return False
+            return True
+
+        changes = {
+            name: getattr(db_game, name)
+            for name in GameService.__CHANGEABLE_FIELDS
+            if getattr(db_game, name) != getattr(saved_game, name)
+        }
+
+        result = await unchanged_game.update(
+            Inc({"revision": 1}), *([Set(changes)] if changes else [])
         )
+
+        return isinstance(result, UpdateResult) and result.matched_count == 1
+
+    @staticmethod
+    async def __log_events(game_id: str, start: int, events: list[Event]) -> None:
+        """Write events to the game's event log, starting at the provided sequence"""
+        # clear events left by any save that was interrupted before completing
+        await DbEvent.find(
+            DbEvent.game_id == PydanticObjectId(game_id),
+            DbEvent.sequence >= start,
+            DbEvent.sequence < start + len(events),
+            with_children=True,
+        ).delete()
+
+        if events:
+            await DbEvent.insert_many(
+                [
+                    serialize.event(e, game_id, sequence)
+                    for sequence, e in enumerate(events, start)
+                ]
+            )
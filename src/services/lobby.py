@@ -1,26 +1,34 @@
 """Facilitate interaction with the lobby DB"""
 
 from re import escape
+from uuid import uuid4
 
 from beanie import PydanticObjectId
 from beanie.operators import ElemMatch, Or, RegEx
 
 from src.mappers.db import deserialize, serialize
 from src.models.client.requests import SearchLobbiesRequest
-from src.models.db import Lobby as DbLobby
+from src.models.db import Lobby as DbLobby, LobbyRevision
 from src.models.internal import Accessibility, Game, Lobby
 from src.models.internal.errors import NotFoundError
+from src.timing import timed
+
+from .game import GameService
 
 
 class LobbyService:
     """A service used to handle the business logic of lobbies"""
 
     @staticmethod
+    @timed("lobbyService")
     async def save(lobby: Lobby) -> Lobby:
         """Save the provided lobby to the DB"""
-        return deserialize.lobby(await serialize.lobby(lobby).save())
+        db_lobby = serialize.lobby(lobby)
+        db_lobby.revision = uuid4().hex
+        return deserialize.lobby(await db_lobby.save())
 
     @staticmethod
+    @timed("lobbyService")
     async def get(lobby_id: PydanticObjectId) -> Lobby:
         """Retrieve the lobby with the provided ID"""
         result = await DbLobby.get(lobby_id, with_children=True)
@@ -31,6 +39,22 @@ class LobbyService:
         return deserialize.lobby(result)
 
     @staticmethod
+    @timed("lobbyService")
+    async def revision(lobby_id: PydanticObjectId) -> str | None:
+        """
+        Retrieve the revision of the lobby with the provided ID, which changes
+        whenever the lobby is saved; None if it has not been saved since revisions
+        """
+        result = await DbLobby.find_one(
+            DbLobby.id == lobby_id, with_children=True
+        ).project(LobbyRevision)
+        if not result:
+            raise NotFoundError(f"No lobby found with id {lobby_id}")
+
+        return result.revision
+
+    @staticmethod
+    @timed("lobbyService")
     async def search(player_id: str, search_lobby: SearchLobbiesRequest) -> list[Lobby]:
         """Search for lobbies matching the provided criteria"""
         return list(
@@ -53,9 +77,9 @@ class LobbyService:
         )
 
     @staticmethod
+    @timed("lobbyService")
     async def start_game(lobby: Lobby) -> Game:
         """Convert a lobby to a game (starts the game)"""
-        game = Game.from_lobby(lobby)
-        saved_game = await serialize.game(game).save()  # Create FIRST
+        game = await GameService.save(Game.from_lobby(lobby))  # Create FIRST
         await serialize.lobby(lobby).delete()  # Delete AFTER
-        return deserialize.game(saved_game)
+        return game
@@ -0,0 +1,38 @@
+"""Notify the requests following a game that it has been saved"""
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import ClassVar
+
+
+class GameNotifier:
+    """
+    Wakes the requests on this instance that are following a game whenever it is
+    saved on this instance.
+
+    Saves made by other instances are not seen, so followers should also check for
+    changes periodically.
+    """
+
+    __listeners: ClassVar[dict[str, set[asyncio.Event]]] = {}
+
+    @staticmethod
+    def notify(game_id: str) -> None:
+        """Wake everything listening for saves of the game"""
+        for listener in GameNotifier.__listeners.get(game_id, ()):
+            listener.set()
+
+    @staticmethod
+    @contextmanager
+    def listen(game_id: str) -> Iterator[asyncio.Event]:
+        """Listen for saves of the game; the yielded event is set on each save"""
+        listener = asyncio.Event()
+        listeners = GameNotifier.__listeners.setdefault(game_id, set())
+        listeners.add(listener)
+        try:
+            yield listener
+        finally:
+            listeners.discard(listener)
+            if not listeners:
+                del GameNotifier.__listeners[game_id]
@@ -1,18 +1,39 @@
 """Facilitate interaction with the player DB"""
 
+import os
+from dataclasses import dataclass
+from time import time
+
 from beanie.operators import In, RegEx
 
+from src.cache import LruCache
 from src.mappers.db import deserialize, serialize
 from src.models.client.requests import SearchPlayersRequest
 from src.models.db import Player as DbPlayer
-from src.models.internal import Player
+from src.models.internal import Game, Lobby, Player
 from src.models.internal.errors import NotFoundError
+from src.timing import timed
+
+
+@dataclass(frozen=True)
+class CachedPlayer:
+    """A player, or the lack of one, as read for a player ID"""
+
+    player: Player | None  # CPU players, and people yet to log in, have no player
 
 
 class PlayerService:
     """A service used to handle the business logic of players"""
 
+    # players by player ID, as listed in lobbies and games
+    cache: LruCache[str, CachedPlayer] = LruCache(
+        int(os.environ.get("PlayerCacheSize", "1024"))
+    )
+    # how long, in seconds, a cached player is used before it is read again
+    cache_ttl = float(os.environ.get("PlayerCacheTtl", "60"))
+
     @staticmethod
+    @timed("playerService")
     async def save(player: Player) -> Player:
         """Save the provided player to the DB"""
         serialized_player = serialize.player(player)
@@ -24,9 +45,13 @@ class PlayerService:
         if existing_player:
             serialized_player.id = existing_player.id
 
-        return deserialize.player(await serialized_player.save())
+        saved_player = deserialize.player(await serialized_player.save())
+        PlayerService.cache.forget(saved_player.player_id)
+
+        return saved_player
 
     @staticmethod
+    @timed("playerService")
     async def search(search_request: SearchPlayersRequest) -> list[Player]:
         """Retrieve the players with names like the provided"""
         return list(
@@ -43,8 +68,14 @@ class PlayerService:
         )
 
     @staticmethod
+    @timed("playerService")
     async def by_player_id(player_id: str) -> Player:
-        """Retrieve the player with the player ID provided"""
+        """
+        Retrieve the player with the player ID provided.
+
+        The player is read from the DB rather than the cache, so a player who has
+        just logged in, perhaps through another instance, is found at once.
+        """
         result = await DbPlayer.find_one(
             DbPlayer.player_id == player_id, with_children=True
         )
@@ -54,13 +85,42 @@ class PlayerService:
         return deserialize.player(result)
 
     @staticmethod
+    @timed("playerService")
     async def by_player_ids(player_ids: list[str]) -> list[Player]:
-        """Retrieve the players with the player IDs in the list provided"""
-        return list(
-            map(
-                deserialize.player,
-                await DbPlayer.find(
-                    In(DbPlayer.player_id, player_ids), with_children=True
-                ).to_list(),
-            )
-        )
+        """
+        Retrieve the players with the player IDs in the list provided, in its order.
+
+        Cached players are used for up to ``cache_ttl`` seconds; the rest are read
+        together and cached. Players changed by another instance may be that out of
+        date here.
+        """
+        cached = {
+            player_id: cached_player
+            for player_id in dict.fromkeys(player_ids)
+            if (cached_player := PlayerService.cache.get(player_id)) is not None
+        }
+        missing = [p for p in dict.fromkeys(player_ids) if p not in cached]
+
+        if missing:
+            read = {
+                db_player.player_id: deserialize.player(db_player)
+                for db_player in await DbPlayer.find(
+                    In(DbPlayer.player_id, missing), with_children=True
+                ).to_list()
+            }
+            expires_at = time() + PlayerService.cache_ttl
+            for player_id in missing:
+                cached[player_id] = CachedPlayer(read.get(player_id))
+                PlayerService.cache.put(player_id, cached[player_id], expires_at)
+
+        return [
+            player
+            for player_id in player_ids
+            if (player := cached[player_id].player) is not None
+        ]
+
+    @staticmethod
+    @timed("playerService")
+    async def participants(game: Lobby | Game) -> list[Player]:
+        """Retrieve, in one call, the players of everyone in the lobby or game"""
+        return await PlayerService.by_player_ids([p.id for p in game.ordered_players])
@@ -0,0 +1,82 @@
+"""Queue games whose automated moves are left to make outside of requests"""
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+
+from azure.core.exceptions import AzureError
+from azure.storage.queue import QueueClient, TextBase64EncodePolicy
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# the storage queue of games with automated moves to make
+ADVANCE_GAME_QUEUE = "advance-game"
+
+
+class AdvanceGame(BaseModel):
+    """A message to make the automated moves left pending in a game"""
+
+    game_id: str
+    revision: int  # the revision of the game the moves were left pending in
+
+
+class GameQueue(ABC):
+    """
+    A queue of games with automated moves to make.
+
+    Sending is best effort: the game is already saved when it is queued, so a
+    message that cannot be sent is logged rather than raised, and the game's moves
+    are made by a later read instead.
+    """
+
+    @abstractmethod
+    async def send(self, message: AdvanceGame) -> None:
+        """Queue the message"""
+
+
+class StorageGameQueue(GameQueue):
+    """
+    A game queue in Azure Storage (or Azurite), as read by the function app's queue
+    trigger; messages are base64 encoded, as the trigger expects by default
+    """
+
+    def __init__(self, connection_string: str, queue_name: str):
+        self.client = QueueClient.from_connection_string(
+            connection_string,
+            queue_name,
+            message_encode_policy=TextBase64EncodePolicy(),
+        )
+
+    async def send(self, message: AdvanceGame) -> None:
+        try:
+            await asyncio.to_thread(self.client.send_message, message.model_dump_json())
+        except AzureError:
+            logger.exception("Could not queue game %s", message.game_id)
+
+
+class MemoryGameQueue(GameQueue):
+    """A game queue kept in memory, for running without Azure Storage"""
+
+    def __init__(self) -> None:
+        self.messages: list[AdvanceGame] = []
+
+    async def send(self, message: AdvanceGame) -> None:
+        self.messages.append(message)
+
+    def receive(self) -> list[AdvanceGame]:
+        """Take every message queued so far"""
+        messages, self.messages = self.messages, []
+        return messages
+
+
+def queue_from_environment() -> GameQueue | None:
+    """
+    The storage queue in the account of ``AzureWebJobsStorage`` when
+    ``AdvanceGameQueue`` is ``on``; otherwise None, so automation is left to requests
+    """
+    if os.environ.get("AdvanceGameQueue", "off") != "on":
+        return None
+
+    return StorageGameQueue(os.environ["AzureWebJobsStorage"], ADVANCE_GAME_QUEUE)
@@ -0,0 +1,80 @@
+"""Run the CPU-heavy work of games away from the event loop"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from operator import attrgetter
+from typing import Any
+
+from src.mappers.db import deserialize
+from src.models.db import Game as DbGame
+from src.models.internal import Event, Game
+
+
+class GameRunner:
+    """
+    Runs the replays, event derivations and automation of games on worker pools, so
+    a long game does not hold the event loop while other requests wait.
+
+    Replays and event derivations run on the ``pool``, of threads or of processes
+    as set by ``GameReplayExecutor``; their inputs and results are pickled to reach
+    a process. Changes to games run on the ``threads``, as a change cannot be sent
+    to another process. Games of fewer than ``inline_moves`` moves are run on the
+    event loop, where a pool would cost more than it saves.
+    """
+
+    # games of fewer moves than this are run on the event loop
+    inline_moves = int(os.environ.get("GameReplayInlineMoves", "50"))
+
+    # the most games each pool works on at once
+    workers = int(os.environ.get("GameReplayWorkers", "4"))
+
+    threads: Executor = ThreadPoolExecutor(workers, thread_name_prefix="game-runner")
+    pool: Executor = (
+        ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        if os.environ.get("GameReplayExecutor", "thread") == "process"
+        else threads
+    )
+
+    @staticmethod
+    async def replay(db_game: DbGame) -> Game:
+        """Replay the game saved in the document"""
+        return await GameRunner.__run(
+            GameRunner.pool, db_game.move_count, deserialize.game, db_game
+        )
+
+    @staticmethod
+    async def events(game: Game, moves: int) -> list[Event]:
+        """Derive all the events of the game, which has made ``moves`` moves"""
+        return await GameRunner.__run(
+            GameRunner.pool, moves, attrgetter("events"), game
+        )
+
+    @staticmethod
+    async def change(game: Game, moves: int, change: Callable[[Game], None]) -> None:
+        """Apply the change, and any automation it causes, to the game"""
+        await GameRunner.__run(GameRunner.threads, moves, change, game)
+
+    @staticmethod
+    async def __run[T](
+        executor: Executor, moves: int, work: Callable[..., T], *args: Any
+    ) -> T:
+        """Do the work for a game of ``moves`` moves, on the executor if it is long"""
+        if moves < GameRunner.inline_moves:
+            return work(*args)
+
+        if isinstance(executor, ThreadPoolExecutor):
+            # run in the request's context, so the work is timed with the request
+            context = copy_context()
+
+            def in_context() -> T:
+                return context.run(work, *args)
+
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, in_context
+            )
+
+        return await asyncio.get_running_loop().run_in_executor(executor, work, *args)
@@ -0,0 +1,12 @@
+"""Init the timing module"""
+
+from .middleware import ServerTimingMiddleware
+from .stages import Timings, current_timings, stage, timed
+
+__all__ = [
+    "ServerTimingMiddleware",
+    "Timings",
+    "current_timings",
+    "stage",
+    "timed",
+]
@@ -0,0 +1,82 @@
+"""Report how long each stage of a request took, as it is answered"""
+
+import logging
+import os
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .stages import Timings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    Times the stages of each request, when ``RequestTiming`` is ``on``.
+
+    The time spent in each stage is sent in a ``Server-Timing`` header, along with
+    the ``total`` until the response started, and logged once the request is done
+    with the timings in ``custom_dimensions``, as Application Insights expects.
+    Stages may run within each other, so their times are not meant to add up.
+    """
+
+    enabled = os.environ.get("RequestTiming", "off") == "on"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not ServerTimingMiddleware.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = current_timings.set(timings)
+        start = perf_counter()
+        status = 500
+        total = 0.0
+
+        async def send_with_timings(message: Message) -> None:
+            nonlocal status, total
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                total = perf_counter() - start
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", server_timing(timings, total)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            current_timings.reset(token)
+            route = getattr(scope.get("route"), "path", scope["path"])
+            logger.info(
+                "%s %s answered %s in %.1fms",
+                scope["method"],
+                route,
+                status,
+                total * 1000,
+                extra={
+                    "custom_dimensions": {
+                        "method": scope["method"],
+                        "route": route,
+                        "status": status,
+                        "totalMs": round(total * 1000, 3),
+                        **{
+                            f"{name}Ms": round(seconds * 1000, 3)
+                            for name, seconds in timings.durations.items()
+                        },
+                    }
+                },
+            )
+
+
+def server_timing(timings: Timings, total: float) -> str:
+    """The value of a Server-Timing header with the timings, in milliseconds"""
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.3f}"
+        for name, seconds in [*timings.durations.items(), ("total", total)]
+    )
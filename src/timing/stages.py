@@ -0,0 +1,87 @@
+"""Time the stages of the request being handled, when it is being timed"""
+
+import inspect
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from functools import wraps
+from time import perf_counter
+from typing import Any, cast
+
+
+class Timings:
+    """The time spent in each stage of a request"""
+
+    def __init__(self) -> None:
+        # seconds spent in each stage, in the order the stages were first entered
+        self.durations: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Count seconds spent in the stage"""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+
+# the timings of the request being handled, if it is being timed
+current_timings: ContextVar[Timings | None] = ContextVar(
+    "current_timings", default=None
+)
+# the stages being timed in this context, so a stage within itself is counted once
+_active_stages: ContextVar[frozenset[str]] = ContextVar(
+    "active_stages", default=frozenset()
+)
+
+# what is entered instead of a stage when nothing is being timed
+_UNTIMED = nullcontext()
+
+
+class _Stage:
+    """A stage being timed, adding its duration to the timings once it is left"""
+
+    def __init__(self, timings: Timings, name: str):
+        self.timings = timings
+        self.name = name
+        self.__start = 0.0
+        self.__token: Token[frozenset[str]] | None = None
+
+    def __enter__(self) -> None:
+        self.__token = _active_stages.set(_active_stages.get() | {self.name})
+        self.__start = perf_counter()
+
+    def __exit__(self, *_: object) -> None:
+        self.timings.add(self.name, perf_counter() - self.__start)
+        if self.__token is not None:
+            _active_stages.reset(self.__token)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """
+    Time the work done within the context as the named stage of the request being
+    handled; when no request is being timed, nothing is done
+    """
+    timings = current_timings.get()
+    if timings is None or name in _active_stages.get():
+        return _UNTIMED
+    return _Stage(timings, name)
+
+
+def timed[F: Callable[..., Any]](name: str) -> Callable[[F], F]:
+    """Time every call of the decorated function, or coroutine, as the named stage"""
+
+    def decorate(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                with stage(name):
+                    return await func(*args, **kwargs)
+
+            return cast(F, timed_coroutine)
+
+        @wraps(func)
+        def timed_function(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return cast(F, timed_function)
+
+    return decorate
@@ -1,67 +1,201 @@
-"""Google OAuth token validation unit tests"""
+"""Firebase ID token validation unit tests"""
 
+import asyncio
+from time import time
+from typing import Any
 from unittest.mock import patch
 
+import jwt
 import pytest
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
 
-from src.auth.firebase import ISSUER, verify_firebase_token
+from src.auth import firebase, keys
+from src.auth.firebase import FIREBASE_PROJECT_ID, ISSUER, verify_firebase_token
+from src.auth.keys import KeyStore
+from src.cache import LruCache
+from tests.helpers import key_set, key_set_response, signed_token
 
-FAKE_TOKEN = "eyJhbGciOiJSUzI1NiJ9.fake.token"
 FAKE_SUB = "116954529561234567890"
 
 
-@patch("src.auth.firebase.id_token.verify_token")
-def test_valid_token(mock_verify):
-    """A valid token returns an Identity with id, name, and picture_url"""
-    mock_verify.return_value = {
+def claims(expires_in: int = 3600, **overrides: Any) -> dict[str, Any]:
+    """The claims of a valid token expiring in the given number of seconds"""
+    now = int(time())
+    return {
         "sub": FAKE_SUB,
         "name": "Test User",
         "picture": "https://example.com/photo.jpg",
-        "email": "user@example.com",
-        "email_verified": True,
+        "aud": FIREBASE_PROJECT_ID,
         "iss": ISSUER,
+        "iat": now,
+        "exp": now + expires_in,
+        **overrides,
     }
 
-    result = verify_firebase_token(FAKE_TOKEN)
+
+def verify(token: str):
+    """Verify the token outside of a running app"""
+    return asyncio.run(verify_firebase_token(token))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_keys():
+    """Start each test with no keys loaded and no verified tokens"""
+    with (
+        patch("src.auth.firebase.firebase_keys", KeyStore(firebase.CERTS)),
+        patch("src.auth.firebase.verified_tokens", LruCache(8)),
+    ):
+        yield
+
+
+def test_valid_token():
+    """A valid token returns an Identity with id, name, and picture_url"""
+    result = verify(signed_token(claims()))
 
     assert FAKE_SUB == result.id
     assert "Test User" == result.name
     assert "https://example.com/photo.jpg" == result.picture_url
-    mock_verify.assert_called_once()
 
 
-@patch("src.auth.firebase.id_token.verify_token")
-def test_invalid_token(mock_verify):
-    """Raises ValueError when token validation fails"""
-    mock_verify.side_effect = ValueError("Token expired")
+def test_invalid_signature():
+    """Raises ValueError when the token was not signed by a Firebase key"""
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
 
-    with pytest.raises(ValueError):
-        verify_firebase_token(FAKE_TOKEN)
+    with pytest.raises(ValueError, match="Invalid Firebase token"):
+        verify(signed_token(claims(), private_key=other_key))
 
 
-@patch("src.auth.firebase.id_token.verify_token")
-def test_wrong_issuer(mock_verify):
-    """Raises ValueError when token has wrong issuer"""
-    mock_verify.return_value = {
-        "sub": FAKE_SUB,
-        "name": "Test User",
-        "picture": "https://example.com/photo.jpg",
-        "email": "user@example.com",
-        "email_verified": True,
-        "iss": "wrong-issuer",
-    }
+def test_unknown_key():
+    """Raises ValueError when the token was signed by a key Firebase does not have"""
+    with pytest.raises(ValueError, match="unknown key"):
+        verify(signed_token(claims(), key_id="unknown"))
+
 
-    with pytest.raises(ValueError):
-        verify_firebase_token(FAKE_TOKEN)
+def test_malformed_token():
+    """Raises ValueError when the token is not a JWT"""
+    with pytest.raises(ValueError, match="Invalid Firebase token"):
+        verify("not.a.token")
 
 
-@patch("src.auth.firebase.id_token.verify_token")
-def test_missing_sub_claim(mock_verify):
+def test_expired_token():
+    """Raises ValueError when the token has expired"""
+    with pytest.raises(ValueError, match="expired"):
+        verify(signed_token(claims(expires_in=-60)))
+
+
+def test_wrong_audience():
+    """Raises ValueError when the token is for another project"""
+    with pytest.raises(ValueError, match="Audience"):
+        verify(signed_token(claims(aud="another-project")))
+
+
+def test_wrong_issuer():
+    """Raises ValueError when token has wrong issuer"""
+    with pytest.raises(ValueError, match="issuer"):
+        verify(signed_token(claims(iss="wrong-issuer")))
+
+
+def test_missing_sub_claim():
     """Raises ValueError when token is missing sub claim"""
-    mock_verify.return_value = {
-        "email": "user@example.com",
-        "email_verified": True,
-    }
+    token_claims = claims()
+    del token_claims["sub"]
+
+    with pytest.raises(ValueError, match="sub"):
+        verify(signed_token(token_claims))
+
+
+def test_unavailable_keys(_mock_key_set):
+    """Raises ValueError when Firebase's keys cannot be fetched"""
+    _mock_key_set.return_value.raise_for_status.side_effect = requests.HTTPError(
+        "unavailable"
+    )
+
+    with pytest.raises(ValueError, match="keys unavailable"):
+        verify(signed_token(claims()))
 
-    with pytest.raises(ValueError):
-        verify_firebase_token(FAKE_TOKEN)
+
+def test_keys_fetched_once(_mock_key_set):
+    """Verifying tokens does not fetch the keys again once they are loaded"""
+    verify(signed_token(claims()))
+    verify(signed_token(claims(sub="another")))
+
+    _mock_key_set.assert_called_once()
+
+
+def test_cached_token():
+    """A token is only verified once while it is valid"""
+    token = signed_token(claims())
+
+    with patch("src.auth.firebase.jwt.decode", wraps=jwt.decode) as decode:
+        first = verify(token)
+        second = verify(token)
+
+    assert first == second
+    decode.assert_called_once()
+    assert 1 == firebase.verified_tokens.hits
+    assert 0.5 == firebase.verified_tokens.hit_rate
+
+
+def test_cached_token_nearly_expired():
+    """A token about to expire is verified every time"""
+    token = signed_token(claims(expires_in=firebase.EXPIRY_SKEW))
+
+    with patch("src.auth.firebase.jwt.decode", wraps=jwt.decode) as decode:
+        verify(token)
+        verify(token)
+
+    assert 2 == decode.call_count
+
+
+def test_cached_token_expired():
+    """A cached token is verified again once it expires"""
+    token = signed_token(claims())
+
+    verify(token)
+    with (
+        patch(
+            "src.cache.time",
+            return_value=time() + 3600 - firebase.EXPIRY_SKEW,
+        ),
+        patch("src.auth.firebase.jwt.decode", wraps=jwt.decode) as decode,
+    ):
+        verify(token)
+
+    decode.assert_called_once()
+    assert 0 == firebase.verified_tokens.hits
+
+
+def test_cached_token_rotated_keys(_mock_key_set):
+    """A cached token is verified again once the keys rotate"""
+    token = signed_token(claims())
+    verify(token)
+
+    rotated = key_set()
+    rotated["keys"].append({**rotated["keys"][0], "kid": "new-key"})
+    _mock_key_set.return_value = key_set_response(rotated)
+    asyncio.run(firebase.firebase_keys.refresh())
+
+    with patch("src.auth.firebase.jwt.decode", wraps=jwt.decode) as decode:
+        verify(token)
+
+    decode.assert_called_once()
+
+
+def test_rotated_key(_mock_key_set):
+    """A token signed by a key added since the keys were fetched is verified"""
+    verify(signed_token(claims()))
+
+    new_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    rotated = key_set()
+    rotated["keys"].extend(key_set(new_key, "new-key")["keys"])
+    _mock_key_set.return_value = key_set_response(rotated)
+
+    with patch(
+        "src.auth.keys.monotonic",
+        return_value=firebase.firebase_keys.fetched_at + keys.MIN_REFRESH_DELAY,
+    ):
+        result = verify(signed_token(claims(), private_key=new_key, key_id="new-key"))
+
+    assert FAKE_SUB == result.id
+    assert 2 == _mock_key_set.call_count
@@ -14,11 +14,14 @@ from tests.helpers import DEFAULT_ID
     "src.auth.depends.verify_firebase_token",
     side_effect=lambda token: Identity(id=token),
 )
+@patch("src.routers.games.GameService.revision", return_value=1)
 @patch(
     "src.routers.games.GameService.get",
     side_effect=AuthorizationError("forbidden"),
 )
-def test_returns_403_for_authorization_error(_mock_get, _mock_auth, client: TestClient):
+def test_returns_403_for_authorization_error(
+    _mock_get, _mock_revision, _mock_auth, client: TestClient
+):
     """Endpoint returns 403 when an AuthorizationError occurs"""
     resp = client.get(
         f"/players/{DEFAULT_ID}/games/{PydanticObjectId()}",
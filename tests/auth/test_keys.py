@@ -0,0 +1,142 @@
+"""Unit tests for the in-memory, background-refreshed key store"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.auth import keys
+from src.auth.keys import KeyStore
+from tests.helpers import SIGNING_KEY_ID, key_set, key_set_response
+
+URL = "https://example.com/keys"
+
+
+def refreshed_delays() -> list[float]:
+    """Run a key store's refresh loop for two refreshes, returning the delays"""
+    delays: list[float] = []
+
+    async def sleep(delay: float):
+        delays.append(delay)
+        if len(delays) == 2:
+            raise asyncio.CancelledError
+
+    with (
+        patch("src.auth.keys.asyncio.sleep", side_effect=sleep),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        asyncio.run(KeyStore(URL).keep_fresh())
+
+    return delays
+
+
+def test_refresh_parses_keys():
+    """Refreshing parses the signing keys and how long they may be cached for"""
+    store = KeyStore(URL)
+
+    max_age = asyncio.run(store.refresh())
+
+    assert 3600 == max_age
+    assert [SIGNING_KEY_ID] == list(store.keys)
+    assert store.digest
+
+
+def test_refresh_skips_encryption_keys(_mock_key_set):
+    """Keys that are not for signatures are not kept"""
+    encryption_keys = key_set()
+    encryption_keys["keys"].append(
+        {**encryption_keys["keys"][0], "kid": "encryption", "use": "enc"}
+    )
+    _mock_key_set.return_value = key_set_response(encryption_keys)
+    store = KeyStore(URL)
+
+    asyncio.run(store.refresh())
+
+    assert [SIGNING_KEY_ID] == list(store.keys)
+
+
+def test_refresh_without_max_age(_mock_key_set):
+    """Keys that do not say how long they may be cached for use the default"""
+    _mock_key_set.return_value = key_set_response(cache_control="no-cache")
+
+    assert keys.DEFAULT_MAX_AGE == asyncio.run(KeyStore(URL).refresh())
+
+
+def test_load_once(_mock_key_set):
+    """Loading does not fetch keys again while they are fresh"""
+    store = KeyStore(URL)
+
+    asyncio.run(store.load())
+    asyncio.run(store.load())
+
+    _mock_key_set.assert_called_once()
+
+
+def test_load_expired(_mock_key_set):
+    """Loading fetches keys again once they have expired"""
+    store = KeyStore(URL)
+    asyncio.run(store.load())
+
+    with patch("src.auth.keys.monotonic", return_value=store.fetched_at + 3600):
+        asyncio.run(store.load())
+
+    assert 2 == _mock_key_set.call_count
+
+
+def test_load_unknown_key(_mock_key_set):
+    """Loading fetches keys again when they do not have the key"""
+    store = KeyStore(URL)
+    asyncio.run(store.load())
+
+    with patch(
+        "src.auth.keys.monotonic",
+        return_value=store.fetched_at + keys.MIN_REFRESH_DELAY,
+    ):
+        asyncio.run(store.load(SIGNING_KEY_ID))
+        asyncio.run(store.load("unknown"))
+
+    assert 2 == _mock_key_set.call_count
+
+
+def test_load_unknown_key_recently_fetched(_mock_key_set):
+    """Loading does not fetch keys again soon after they were last fetched"""
+    store = KeyStore(URL)
+    asyncio.run(store.load())
+
+    asyncio.run(store.load("unknown"))
+
+    _mock_key_set.assert_called_once()
+
+
+def test_keep_fresh_before_expiry():
+    """Keys are refreshed shortly before they expire"""
+    assert [3600 - keys.REFRESH_MARGIN] * 2 == refreshed_delays()
+
+
+def test_keep_fresh_short_lived(_mock_key_set):
+    """Keys are not refreshed more often than the minimum delay"""
+    _mock_key_set.return_value = key_set_response(cache_control="max-age=1")
+
+    assert [keys.MIN_REFRESH_DELAY] * 2 == refreshed_delays()
+
+
+def test_keep_fresh_after_failure(_mock_key_set):
+    """A failed refresh is retried after the minimum delay"""
+    _mock_key_set.side_effect = [requests.ConnectionError("down"), key_set_response()]
+
+    assert [keys.MIN_REFRESH_DELAY, 3600 - keys.REFRESH_MARGIN] == refreshed_delays()
+
+
+def test_refreshing_in_background(_mock_key_set):
+    """Keys are loaded in the background while refreshing"""
+    store = KeyStore(URL)
+
+    async def refresh_in_background():
+        async with store.refreshing():
+            await asyncio.sleep(0.1)
+
+    asyncio.run(refresh_in_background())
+
+    assert store.keys
+    _mock_key_set.assert_called_once()
@@ -0,0 +1,76 @@
+"""
+Helpers to benchmark games: deterministic full games, timings, and their results.
+
+Timings are marked ``benchmark`` and left out of the default run; run them with
+``pytest -m benchmark``. Set ``BenchmarkResults`` to a path to write the timings
+of a run there as JSON, and ``BenchmarkBaseline`` to the path of an earlier run's
+results to fail any timing more than ``BenchmarkTolerance`` (a fraction, 0.5 by
+default) slower than it was. ``BenchmarkRuns`` sets how many times each timing is
+taken; the fastest is kept.
+"""
+
+import json
+import os
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from beanie import PydanticObjectId
+
+from src.models.internal import Game, NaiveCpu, PlayerGroup
+from tests.helpers import DEFAULT_ID
+
+# seeds of full games, in no particular order of length
+SEEDS = ["size-benchmark-1", "size-benchmark-2", "size-benchmark-3"]
+
+RUNS = int(os.environ.get("BenchmarkRuns", "3"))
+TOLERANCE = float(os.environ.get("BenchmarkTolerance", "0.5"))
+
+# the seconds each operation took, by operation and then by the moves of the game
+type Results = dict[str, dict[str, float]]
+
+
+def full_game(seed: str) -> Game:
+    """A game played to the end by four CPU players"""
+    game = Game(
+        id=str(PydanticObjectId()),
+        seed=seed,
+        organizer=NaiveCpu(DEFAULT_ID),
+        players=PlayerGroup(NaiveCpu(f"cpu-player-id-{n}") for n in range(3)),
+    )
+    assert game.winner
+    return game
+
+
+def full_games() -> list[Game]:
+    """Full games, from the fewest moves to the most"""
+    return sorted(map(full_game, SEEDS), key=lambda g: len(g.actions))
+
+
+def fastest(work: Callable[[], Any], runs: int = RUNS) -> float:
+    """The fewest seconds the work took over the runs"""
+    return min(timeit.repeat(work, number=1, repeat=runs))
+
+
+def regressions(results: Results, baseline: Results) -> list[str]:
+    """Describe every timing that is slower than the baseline allows"""
+    return [
+        f"{operation} on {moves} moves: {seconds:.4f}s, was {baseline_seconds:.4f}s"
+        for operation, timings in results.items()
+        for moves, seconds in timings.items()
+        if (baseline_seconds := baseline.get(operation, {}).get(moves)) is not None
+        and seconds > baseline_seconds * (1 + TOLERANCE)
+    ]
+
+
+def baseline() -> Results:
+    """The stored results to compare against, if any"""
+    path = os.environ.get("BenchmarkBaseline")
+    return json.loads(Path(path).read_text(encoding="utf-8")) if path else {}
+
+
+def record(results: Results) -> None:
+    """Write the results where they were asked for, if anywhere"""
+    if path := os.environ.get("BenchmarkResults"):
+        Path(path).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
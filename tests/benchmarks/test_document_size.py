@@ -0,0 +1,28 @@
+"""Benchmark the size of game documents with each format of moves"""
+
+import bson
+import pytest
+from beanie.odm.utils.dump import get_dict
+
+from src.mappers.db import serialize
+from src.models.db import Game as DbGame, GameV1
+from tests.benchmarks.helpers import SEEDS, full_game
+from tests.helpers import as_v0
+
+
+def document_size(db_game: DbGame) -> int:
+    """The size of the game document as stored"""
+    return len(bson.encode(get_dict(db_game, to_db=True)))
+
+
+@pytest.mark.usefixtures("client")  # the documents need the ODM initialized
+def test_packed_moves_size():
+    """Packed (V1) documents of full games are a fraction of the size of V0 documents"""
+    for seed in SEEDS:
+        game = full_game(seed)
+        v1_game = serialize.game(game)
+        assert isinstance(v1_game, GameV1)
+        v0_game = as_v0(v1_game)
+        v0_size, v1_size = document_size(v0_game), document_size(v1_game)
+
+        assert v1_size * 2 < v0_size
@@ -0,0 +1,214 @@
+"""
+Benchmark replaying, deriving, converting and responding with full games, and
+acting on them.
+
+Every timing is compared against the ``BenchmarkBaseline``, if one is set, so a
+change that makes games slower to replay fails here; see ``tests.benchmarks.helpers``.
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.auth import Identity
+from src.mappers.client import serialize as client_serialize
+from src.mappers.db import deserialize, serialize
+from src.models.client.responses import Event, GameResponse
+from src.models.internal import Game, Human
+from src.routers.encoding import ModelResponse, adapter
+from src.services import GameService
+from tests.benchmarks.helpers import (
+    RUNS,
+    Results,
+    baseline,
+    fastest,
+    full_games,
+    record,
+    regressions,
+)
+from tests.helpers import DEFAULT_ID, get_suggestion
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(name="games", scope="module")
+def fixture_games() -> list[Game]:
+    """Full games, from the fewest moves to the most"""
+    return full_games()
+
+
+@pytest.fixture(name="results", scope="module")
+def fixture_results() -> Iterator[Results]:
+    """The timings of the module, recorded once all are taken"""
+    results: Results = {}
+    yield results
+    record(results)
+
+
+def benchmark(
+    results: Results, operation: str, games: list[Game], time: Callable[[Game], float]
+) -> None:
+    """Time the operation on every game, and check none is slower than the baseline"""
+    timings = {str(len(game.actions)): time(game) for game in games}
+    results[operation] = timings
+
+    assert not regressions({operation: timings}, baseline())
+
+
+def validated_response(content: Any, model: Any) -> bytes:
+    """Encode the content as FastAPI does for an endpoint's ``response_model``"""
+    validated = adapter(model).validate_python(
+        adapter(model).dump_python(content, by_alias=True)
+    )
+    return bytes(
+        JSONResponse(
+            adapter(model).dump_python(validated, mode="json", by_alias=True)
+        ).body
+    )
+
+
+def copy(game: Game, organizer: Any = None, moves: int | None = None) -> Game:
+    """A new game replayed from the first ``moves`` moves of the game"""
+    return Game(
+        id=str(PydanticObjectId()),
+        seed=game.seed,
+        organizer=organizer or game.organizer,
+        players=game.players,
+        initial_actions=game.actions[:moves],
+    )
+
+
+@pytest.mark.usefixtures("client")  # the documents need the ODM initialized
+def test_replay(games: list[Game], results: Results):
+    """Replay games from their documents"""
+
+    def time(game: Game) -> float:
+        db_game = serialize.game(game)
+        return fastest(lambda: deserialize.game(db_game))
+
+    benchmark(results, "deserialize.game", games, time)
+
+
+def test_events(games: list[Game], results: Results):
+    """Derive the events of games"""
+    benchmark(results, "Game.events", games, lambda g: fastest(lambda: g.events))
+
+
+def test_rounds(games: list[Game], results: Results):
+    """Inspect the rounds of games"""
+    benchmark(results, "Game.rounds", games, lambda g: fastest(lambda: g.rounds))
+
+
+def test_serialize_game(games: list[Game], results: Results):
+    """Convert games for the client"""
+    benchmark(
+        results,
+        "serialize.game",
+        games,
+        lambda g: fastest(lambda: client_serialize.game(g, DEFAULT_ID)),
+    )
+
+
+def test_serialize_events(games: list[Game], results: Results):
+    """Convert the events of games for the client"""
+
+    def time(game: Game) -> float:
+        events = game.events
+        return fastest(lambda: client_serialize.events(events, DEFAULT_ID))
+
+    benchmark(results, "serialize.events", games, time)
+
+
+def test_respond_validated(games: list[Game], results: Results):
+    """Respond with games and their events as FastAPI does for a response_model"""
+    benchmark(results, "respond.validated", games, time_respond(validated_response))
+
+
+def test_respond_model(games: list[Game], results: Results):
+    """Respond with games and their events as they were built, in a ModelResponse"""
+
+    def respond(content: Any, model: Any) -> bytes:
+        return bytes(ModelResponse(content, model).body)
+
+    benchmark(results, "respond.model", games, time_respond(respond))
+
+
+def time_respond(respond: Callable[[Any, Any], bytes]) -> Callable[[Game], float]:
+    """Time responding with a game and its events, checking the response is as before"""
+
+    def time(game: Game) -> float:
+        client_game = client_serialize.game(game, DEFAULT_ID)
+        client_events = client_serialize.events(game.events, DEFAULT_ID)
+        assert json.loads(respond(client_game, GameResponse)) == json.loads(
+            validated_response(client_game, GameResponse)
+        )
+        assert json.loads(respond(client_events, list[Event])) == json.loads(
+            validated_response(client_events, list[Event])
+        )
+
+        return fastest(
+            lambda: (
+                respond(client_game, GameResponse),
+                respond(client_events, list[Event]),
+            )
+        )
+
+    return time
+
+
+def test_save(client: TestClient, games: list[Game], results: Results):
+    """Save new games, with their events"""
+    assert client.portal
+    portal = client.portal
+
+    def save(game: Game) -> Callable[[], Any]:
+        new_game = copy(game)
+        return lambda: portal.call(GameService.save, new_game)
+
+    def time(game: Game) -> float:
+        return min(fastest(save(game), runs=1) for _ in range(RUNS))
+
+    benchmark(results, "GameService.save", games, time)
+
+
+def test_act(client: TestClient, games: list[Game], results: Results):
+    """Make the last move of a person in saved games that are not cached"""
+    assert client.portal
+    portal = client.portal
+
+    def act(game: Game) -> Callable[[], Any]:
+        last_move = max(
+            i for i, a in enumerate(game.actions) if a.player_id == DEFAULT_ID
+        )
+        saved_game = portal.call(
+            GameService.save, copy(game, Human(DEFAULT_ID), last_move)
+        )
+        body = get_suggestion(client, str(saved_game.id))
+        GameService.cache.clear()
+
+        def post() -> None:
+            resp = client.post(
+                f"/players/{DEFAULT_ID}/games/{saved_game.id}/actions",
+                json=body,
+                headers={"authorization": f"Bearer {DEFAULT_ID}"},
+            )
+            assert 200 == resp.status_code
+
+        return post
+
+    with patch(
+        "src.auth.depends.verify_firebase_token",
+        side_effect=lambda token: Identity(id=token),
+    ):
+        benchmark(
+            results,
+            "act",
+            games,
+            lambda g: min(fastest(act(g), runs=1) for _ in range(RUNS)),
+        )
@@ -0,0 +1,29 @@
+"""Test converting a completed game, whose cards are shared rather than created"""
+
+from src.mappers.client import serialize
+from src.models.internal import Card, CardNumber, CardSuit
+from tests.benchmarks.helpers import full_game
+
+
+def test_serialize_completed_game():
+    """A completed game is converted for the client with one instance of each card"""
+    game = full_game("serialize-benchmark")
+    player_id = game.organizer.id
+
+    cards = [
+        card
+        for completed_round in serialize.game(game, player_id).completed_rounds
+        for hand in completed_round.initial_hands.values()
+        for card in hand
+    ]
+    assert len(cards) > len(set(cards))
+    assert len(set(cards)) == len({id(card) for card in cards})
+
+
+def test_cards_are_shared():
+    """Every conversion of a card gives the same instance"""
+    card = Card.of(CardSuit.HEARTS, CardNumber.FIVE)
+
+    assert card is Card.of(CardSuit.HEARTS, CardNumber.FIVE)
+    assert card is Card.from_engine(card.to_engine())
+    assert card == Card(suit=CardSuit.HEARTS, number=CardNumber.FIVE)
@@ -1,9 +1,19 @@
 """Helpers to perform common functions during testing"""
 
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
 from function_app import fastapi_app
+from tests.helpers import key_set_response
+
+
+@pytest.fixture(autouse=True)
+def _mock_key_set():
+    """Serve a test key set instead of fetching Firebase's"""
+    with patch("src.auth.keys.requests.get", return_value=key_set_response()) as get:
+        yield get
 
 
 @pytest.fixture
@@ -0,0 +1,101 @@
+"""Unit tests to ensure automation left pending by its budget is continued on reads"""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.models.internal import Game
+from src.services import GameService
+from tests.helpers import (
+    DEFAULT_ID,
+    get_events,
+    get_game,
+    leave,
+    saved_moves,
+    started_game,
+)
+
+STEPS = 20
+
+
+def test_leave_within_budget(client: TestClient):
+    """Leaving a game to CPU players saves only a budget of their moves"""
+    game = started_game(client)
+    assert client.portal
+    started_moves, _ = client.portal.call(saved_moves, game["id"])
+
+    with patch.object(Game, "automation_steps", STEPS):
+        events = leave(client, game["id"])
+
+    moves, pending = client.portal.call(saved_moves, game["id"])
+    assert STEPS <= len(events)
+    assert started_moves + STEPS == moves
+    assert pending
+
+
+def test_continue_on_read(client: TestClient):
+    """Each read of a game with pending automation makes and saves a budget of moves"""
+    game = started_game(client)
+    assert client.portal
+    started_moves, _ = client.portal.call(saved_moves, game["id"])
+
+    with patch.object(Game, "automation_steps", STEPS):
+        leave(client, game["id"])
+        GameService.cache.clear()  # loading the game makes none of its moves
+        read_game = get_game(client, game["id"], DEFAULT_ID)
+        moves, pending = client.portal.call(saved_moves, game["id"])
+
+        assert started_moves + STEPS * 2 == moves
+        assert pending
+        assert "WON" != read_game["active"]["status"]
+
+        for _ in range(100):
+            if read_game["active"]["status"] == "WON":
+                break
+            read_game = get_game(client, game["id"], DEFAULT_ID)
+
+    assert "WON" == read_game["active"]["status"]
+    _, pending = client.portal.call(saved_moves, game["id"])
+    assert not pending
+    events = get_events(client, game["id"], DEFAULT_ID)
+    assert [e["sequence"] for e in events] == list(range(len(events)))
+    assert "GAME_END" == events[-1]["content"]["type"]
+
+
+def test_continue_on_events(client: TestClient):
+    """Reading the events of a game with pending automation continues it"""
+    game = started_game(client)
+    assert client.portal
+    started_moves, _ = client.portal.call(saved_moves, game["id"])
+
+    with patch.object(Game, "automation_steps", STEPS):
+        left_events = leave(client, game["id"])
+        GameService.cache.clear()
+        events = get_events(client, game["id"], DEFAULT_ID)
+
+    assert len(left_events) < len(events)
+    assert started_moves + STEPS * 2 == client.portal.call(saved_moves, game["id"])[0]
+
+
+def test_continue_on_wait(client: TestClient):
+    """
+    Waiting on a game with pending automation makes exactly one budget of its moves
+    at once, and returns the events they produced
+    """
+    game = started_game(client)
+    assert client.portal
+
+    with patch.object(Game, "automation_steps", STEPS):
+        left_events = leave(client, game["id"])
+        left_moves, _ = client.portal.call(saved_moves, game["id"])
+        resp = client.get(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/turn",
+            params={"afterSequence": left_events[-1]["sequence"], "timeout": 5},
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    moves, pending = client.portal.call(saved_moves, game["id"])
+    assert 200 == resp.status_code
+    assert left_events[-1]["sequence"] + 1 == resp.json()[0]["sequence"]
+    assert left_moves + STEPS == moves
+    assert pending
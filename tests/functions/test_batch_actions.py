@@ -0,0 +1,98 @@
+"""Test to ensure several actions can be submitted together through the web server"""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from beanie import PydanticObjectId
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.models.internal import BidAmount, GameStatus
+from src.routers.games import MAX_BATCH_ACTIONS
+from src.services import GameService, MemoryGameQueue
+from tests.helpers import (
+    DEFAULT_ID,
+    contains_unsequenced,
+    get_events,
+    get_game,
+    started_game,
+)
+
+SHOOT_THE_MOON = {"type": "BID", "amount": BidAmount.SHOOT_THE_MOON}
+SELECT_HEARTS = {"type": "SELECT_TRUMP", "suit": "HEARTS"}
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=["requests", "queue"])
+def _queue(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Run each test with automated moves made by requests, then by the queue"""
+    with patch.object(
+        GameService, "queue", MemoryGameQueue() if request.param else None
+    ):
+        yield
+
+
+def act_in_batch(
+    client: TestClient, game_id: str, actions: list[dict[str, Any]]
+) -> Response:
+    """Submit several actions in the game together"""
+    return client.post(
+        f"/players/{DEFAULT_ID}/games/{game_id}/actions/batch",
+        json=actions,
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+
+def test_act_in_batch(client: TestClient):
+    """Every action in a batch is applied in order"""
+    game = started_game(client)
+
+    resp = act_in_batch(client, game["id"], [SHOOT_THE_MOON, SELECT_HEARTS])
+
+    assert 200 == resp.status_code
+    results = resp.json()
+    assert contains_unsequenced(results, {**SHOOT_THE_MOON, "playerId": DEFAULT_ID})
+    assert contains_unsequenced(results, {**SELECT_HEARTS, "playerId": DEFAULT_ID})
+    assert [r["content"] for r in results] == [
+        e["content"]
+        for e in get_events(client, game["id"], DEFAULT_ID)[-len(results) :]
+    ]
+    assert (
+        GameStatus.DISCARD.name
+        == get_game(client, game["id"], DEFAULT_ID)["active"]["status"]
+    )
+
+
+def test_invalid_action_in_batch(client: TestClient):
+    """A batch stops at its first invalid action, and none of it is saved"""
+    game = started_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    resp = act_in_batch(
+        client, game["id"], [SHOOT_THE_MOON, SHOOT_THE_MOON, SELECT_HEARTS]
+    )
+
+    assert 400 == resp.status_code
+    assert resp.json().startswith("Action 1 failed")
+    assert events == get_events(client, game["id"], DEFAULT_ID)
+
+
+def test_batch_size(client: TestClient):
+    """A batch must have at least one action, and not too many"""
+    game = started_game(client)
+
+    assert 422 == act_in_batch(client, game["id"], []).status_code
+    assert (
+        422
+        == act_in_batch(
+            client, game["id"], [SHOOT_THE_MOON] * (MAX_BATCH_ACTIONS + 1)
+        ).status_code
+    )
+
+
+def test_batch_on_nonexistent_game(client: TestClient):
+    """Acting in a game that does not exist is not found"""
+    resp = act_in_batch(client, str(PydanticObjectId()), [SHOOT_THE_MOON])
+
+    assert 404 == resp.status_code
@@ -0,0 +1,89 @@
+"""Test to ensure several games can be retrieved at once through the web server"""
+
+from typing import Any
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.cache import LruCache
+from src.services import GameService
+from tests.functions.test_game_cache import rename_elsewhere
+from tests.helpers import DEFAULT_ID, get_game, started_game
+
+
+def get_games(
+    client: TestClient, game_ids: list[Any], player_id: str = DEFAULT_ID
+) -> Response:
+    """Retrieve several games at once"""
+    return client.post(
+        f"/players/{player_id}/games/bulk",
+        json={"gameIds": game_ids},
+        headers={"authorization": f"Bearer {player_id}"},
+    )
+
+
+def test_get_games(client: TestClient):
+    """Games are retrieved as the player sees them, in the order requested"""
+    first = started_game(client, name="first")
+    second = started_game(client, name="second")
+
+    resp = get_games(client, [second["id"], str(PydanticObjectId()), first["id"]])
+
+    assert 200 == resp.status_code
+    assert [
+        get_game(client, second["id"], "other"),
+        get_game(client, first["id"], "other"),
+    ] == get_games(client, [second["id"], first["id"]], "other").json()
+    assert [second, first] == resp.json()
+
+
+def test_get_uncached_games(client: TestClient):
+    """Games that are not cached are read together, and cached"""
+    first = started_game(client, name="first")
+    second = started_game(client, name="second")
+
+    with patch.object(GameService, "cache", LruCache(2)):
+        resp = get_games(client, [first["id"], second["id"]])
+
+        assert GameService.cache.get(PydanticObjectId(first["id"]))
+        assert GameService.cache.get(PydanticObjectId(second["id"]))
+
+    assert [first, second] == resp.json()
+
+
+def test_get_recently_cached_games(client: TestClient):
+    """Recently cached games are not read again"""
+    game = started_game(client)
+
+    with (
+        patch.object(GameService, "cache_max_age", 60),
+        patch("src.services.game.DbGame.find", side_effect=AssertionError),
+    ):
+        assert [game] == get_games(client, [game["id"]]).json()
+
+
+def test_get_unchanged_cached_games(client: TestClient):
+    """Cached games that have not changed are not replayed"""
+    game = started_game(client)
+
+    with patch("src.services.game.deserialize.game") as replay:
+        assert [game] == get_games(client, [game["id"]]).json()
+
+    replay.assert_not_called()
+
+
+def test_get_games_changed_elsewhere(client: TestClient):
+    """Cached games that changed elsewhere are read again"""
+    game = started_game(client)
+    assert client.portal
+    client.portal.call(rename_elsewhere, game["id"], "renamed")
+
+    assert "renamed" == get_games(client, [game["id"]]).json()[0]["name"]
+
+
+def test_get_too_many_games(client: TestClient):
+    """At least one game, and not too many, must be requested at once"""
+    assert 422 == get_games(client, []).status_code
+    assert 422 == get_games(client, [str(PydanticObjectId())] * 51).status_code
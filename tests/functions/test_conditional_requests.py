@@ -0,0 +1,227 @@
+"""Test to ensure unchanged resources are not sent again through the web server"""
+
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from beanie.operators import Unset
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.models.db import Lobby as DbLobby
+from src.models.internal import Player
+from src.services import GameService
+from src.services.runner import GameRunner
+from tests.helpers import (
+    DEFAULT_ID,
+    get_suggestion,
+    lobby_game,
+    player,
+    started_game,
+)
+
+
+def conditional_get(
+    client: TestClient,
+    url: str,
+    if_none_match: str | None = None,
+    player_id: str = DEFAULT_ID,
+) -> Response:
+    """Get the resource, unless it matches the entity tag"""
+    headers = {"authorization": f"Bearer {player_id}"}
+    if if_none_match:
+        headers["if-none-match"] = if_none_match
+    return client.get(f"/players/{player_id}{url}", headers=headers)
+
+
+async def forget_lobby_revision(lobby_id: str):
+    """Remove the revision of a lobby, as if it was saved before revisions"""
+    await DbLobby.find_one(
+        DbLobby.id == PydanticObjectId(lobby_id), with_children=True
+    ).update(Unset({"revision": ""}))
+
+
+def test_unchanged_game(client: TestClient):
+    """An unchanged game is not sent again, or even loaded"""
+    game = started_game(client)
+    url = f"/games/{game['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    with patch.object(GameService, "get", side_effect=AssertionError):
+        resp = conditional_get(client, url, tag)
+
+    assert 304 == resp.status_code
+    assert tag == resp.headers["etag"]
+    assert not resp.content
+
+
+def test_changed_game(client: TestClient):
+    """A changed game is sent again with a new tag"""
+    game = started_game(client)
+    url = f"/games/{game['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json=get_suggestion(client, game["id"]),
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+    resp = conditional_get(client, url, tag)
+
+    assert 200 == resp.status_code
+    assert tag != resp.headers["etag"]
+    assert resp.json()["id"] == game["id"]
+
+
+def test_game_tagged_per_player(client: TestClient):
+    """Players who see different things have different tags for the same game"""
+    game = started_game(client)
+    url = f"/games/{game['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    resp = conditional_get(client, url, tag, player_id="other")
+
+    assert 200 == resp.status_code
+    assert tag != resp.headers["etag"]
+
+
+def test_if_none_match_forms(client: TestClient):
+    """Weak, listed, and wildcard tags all match"""
+    game = started_game(client)
+    url = f"/games/{game['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    assert 304 == conditional_get(client, url, f"W/{tag}").status_code
+    assert 304 == conditional_get(client, url, f'"other", {tag}').status_code
+    assert 304 == conditional_get(client, url, "*").status_code
+    assert 200 == conditional_get(client, url, '"other"').status_code
+
+
+def test_conditional_nonexistent_game(client: TestClient):
+    """A game that does not exist is not found, even conditionally"""
+    url = f"/games/{PydanticObjectId()}"
+
+    assert 404 == conditional_get(client, url, '"tag"').status_code
+    assert 404 == conditional_get(client, f"{url}/players", '"tag"').status_code
+
+
+def test_unchanged_events(client: TestClient):
+    """Unchanged events are not sent again"""
+    game = started_game(client)
+    url = f"/games/{game['id']}/events"
+    tag = conditional_get(client, url).headers["etag"]
+
+    assert 304 == conditional_get(client, url, tag).status_code
+    assert 200 == conditional_get(client, f"{url}?skip=1", tag).status_code
+
+
+def test_changed_events(client: TestClient):
+    """Changed events are sent again with a new tag"""
+    game = started_game(client)
+    url = f"/games/{game['id']}/events"
+    first = conditional_get(client, url)
+
+    client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json=get_suggestion(client, game["id"]),
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+    resp = conditional_get(client, url, first.headers["etag"])
+
+    assert 200 == resp.status_code
+    assert len(resp.json()) > len(first.json())
+
+
+def test_unchanged_game_players(client: TestClient):
+    """Unchanged players in a game are not sent again"""
+    game = started_game(client)
+    url = f"/games/{game['id']}/players"
+    tag = conditional_get(client, url).headers["etag"]
+
+    assert 304 == conditional_get(client, url, tag).status_code
+
+
+def test_changed_game_players(client: TestClient):
+    """Players in a game are sent again when a player changes"""
+    player(client, Player(player_id=DEFAULT_ID, name="before"))
+    game = started_game(client)
+    url = f"/games/{game['id']}/players"
+    tag = conditional_get(client, url).headers["etag"]
+
+    player(client, Player(player_id=DEFAULT_ID, name="after"))
+    resp = conditional_get(client, url, tag)
+
+    assert 200 == resp.status_code
+    assert "after" in [p["name"] for p in resp.json()]
+
+
+def test_game_players_without_replay(client: TestClient):
+    """Players in a game are read without loading the game"""
+    game = started_game(client)
+    url = f"/games/{game['id']}/players"
+    GameService.cache.clear()
+
+    with patch.object(GameRunner, "replay") as replay:
+        first = conditional_get(client, url)
+        resp = conditional_get(client, url, first.headers["etag"])
+
+    assert 200 == first.status_code
+    assert 304 == resp.status_code
+    assert 0 == replay.call_count
+
+
+def test_unchanged_lobby(client: TestClient):
+    """An unchanged lobby is not sent again"""
+    lobby = lobby_game(client)
+    url = f"/lobbies/{lobby['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    resp = conditional_get(client, url, tag)
+
+    assert 304 == resp.status_code
+    assert tag == resp.headers["etag"]
+
+
+def test_changed_lobby(client: TestClient):
+    """A changed lobby is sent again with a new tag"""
+    lobby = lobby_game(client)
+    url = f"/lobbies/{lobby['id']}"
+    tag = conditional_get(client, url).headers["etag"]
+
+    client.post(
+        f"/players/joiner/lobbies/{lobby['id']}/players",
+        json={"type": "JOIN"},
+        headers={"authorization": "Bearer joiner"},
+    )
+    resp = conditional_get(client, url, tag)
+
+    assert 200 == resp.status_code
+    assert tag != resp.headers["etag"]
+
+
+def test_lobby_saved_before_revisions(client: TestClient):
+    """A lobby saved before revisions is always sent, without a tag"""
+    lobby = lobby_game(client)
+    assert client.portal
+    client.portal.call(forget_lobby_revision, lobby["id"])
+
+    resp = conditional_get(client, f"/lobbies/{lobby['id']}", "*")
+
+    assert 200 == resp.status_code
+    assert "etag" not in resp.headers
+
+
+def test_conditional_nonexistent_lobby(client: TestClient):
+    """A lobby that does not exist is not found, even conditionally"""
+    url = f"/lobbies/{PydanticObjectId()}"
+
+    assert 404 == conditional_get(client, url, '"tag"').status_code
+    assert 404 == conditional_get(client, f"{url}/players", '"tag"').status_code
+
+
+def test_unchanged_lobby_players(client: TestClient):
+    """Unchanged players in a lobby are not sent again"""
+    lobby = lobby_game(client)
+    url = f"/lobbies/{lobby['id']}/players"
+    tag = conditional_get(client, url).headers["etag"]
+
+    assert 304 == conditional_get(client, url, tag).status_code
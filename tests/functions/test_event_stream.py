@@ -0,0 +1,168 @@
+"""Test to ensure game events are streamed properly through the web server"""
+
+import json
+from time import sleep
+from typing import Any
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from fastapi.testclient import TestClient
+
+from src.models.internal import Bid, Event
+from src.services import GameNotifier, GameService
+from tests.helpers import (
+    DEFAULT_ID,
+    completed_game,
+    get_events,
+    get_suggestion,
+    started_game,
+)
+
+
+def stream_events(
+    client: TestClient, game_id: str, player_id: str = DEFAULT_ID, **headers: str
+) -> list[dict[str, Any]]:
+    """Stream events for a game until the stream ends"""
+    resp = client.get(
+        f"/players/{player_id}/games/{game_id}/events/stream",
+        headers={"authorization": f"Bearer {player_id}", **headers},
+    )
+    assert 200 == resp.status_code
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    streamed = []
+    for message in resp.text.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in message.splitlines() if ": " in line
+        )
+        if "data" in fields:
+            event = json.loads(fields["data"])
+            assert str(event["sequence"]) == fields["id"]
+            streamed.append(event)
+    return streamed
+
+
+async def follow(game_id: str) -> list[tuple[int, list[Event]]]:
+    """Follow the events of a game until following ends"""
+    return [
+        page
+        async for page in await GameService.follow_events(PydanticObjectId(game_id))
+    ]
+
+
+def test_stream_completed_game(client: TestClient):
+    """A completed game streams every event the player can see, then ends"""
+    game = completed_game(client)
+
+    streamed = stream_events(client, game["id"])
+
+    assert get_events(client, game["id"], DEFAULT_ID) == streamed
+    assert "GAME_END" == streamed[-1]["content"]["type"]
+
+
+def test_stream_hides_other_hands(client: TestClient):
+    """The stream only shows what the player streaming it can see"""
+    game = completed_game(client)
+
+    assert get_events(client, game["id"], "other") == stream_events(
+        client, game["id"], "other"
+    )
+
+
+def test_stream_resumes_after_last_event(client: TestClient):
+    """A reconnecting stream resumes after the last event it received"""
+    game = completed_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    assert events[6:] == stream_events(client, game["id"], **{"Last-Event-ID": "5"})
+
+
+def test_stream_skips_events(client: TestClient):
+    """A stream can start after some events"""
+    game = completed_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    resp = client.get(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/events/stream?skip=3",
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert f"id: {events[3]['sequence']}" in resp.text
+    assert "id: 2\n" not in resp.text
+
+
+def test_stream_after_game_end(client: TestClient):
+    """A stream reconnecting after the end of a game ends immediately"""
+    game = completed_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    assert not stream_events(
+        client, game["id"], **{"Last-Event-ID": str(events[-1]["sequence"])}
+    )
+
+
+def test_stream_in_progress_game(client: TestClient):
+    """A stream of a game in progress ends after the follow duration"""
+    game = started_game(client)
+
+    with (
+        patch.object(GameService, "follow_duration", 0.2),
+        patch.object(GameService, "follow_interval", 0.05),
+    ):
+        streamed = stream_events(client, game["id"])
+
+    assert get_events(client, game["id"], DEFAULT_ID) == streamed
+
+
+def test_stream_missing_game(client: TestClient):
+    """Streaming the events of a game that does not exist is not found"""
+    resp = client.get(
+        f"/players/{DEFAULT_ID}/games/{PydanticObjectId()}/events/stream",
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 404 == resp.status_code
+
+
+def test_follow_woken_by_save(client: TestClient):
+    """Followers are woken when the game is saved, without waiting to check"""
+    game = started_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+    assert client.portal
+
+    # followers only check for saves elsewhere as the follow duration ends
+    with (
+        patch.object(GameService, "follow_duration", 2),
+        patch.object(GameService, "follow_interval", 60),
+    ):
+        followed = client.portal.start_task_soon(follow, game["id"])
+        while game["id"] not in vars(GameNotifier)["_GameNotifier__listeners"]:
+            sleep(0.01)
+        client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=get_suggestion(client, game["id"]),
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        pages = followed.result(timeout=5)
+
+    assert 2 == len(pages)
+    assert len(events) == pages[-1][0]
+    assert isinstance(pages[-1][1][0], Bid)
+    assert not vars(GameNotifier)["_GameNotifier__listeners"]
+
+
+def test_notify_every_follower():
+    """Every follower of a game is woken when it is saved"""
+    game_id = str(PydanticObjectId())
+
+    with (
+        GameNotifier.listen(game_id) as first,
+        GameNotifier.listen(game_id) as second,
+    ):
+        GameNotifier.notify(game_id)
+        GameNotifier.notify(str(PydanticObjectId()))
+
+        assert first.is_set()
+        assert second.is_set()
+
+    assert game_id not in vars(GameNotifier)["_GameNotifier__listeners"]
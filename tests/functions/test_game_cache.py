@@ -0,0 +1,129 @@
+"""Unit tests to ensure games are cached between requests safely"""
+
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from beanie.operators import Inc, Set
+from fastapi.testclient import TestClient
+
+from src.cache import LruCache
+from src.models.db import Game as DbGame
+from src.services import GameService
+from tests.helpers import DEFAULT_ID, get_game, get_suggestion, started_game
+
+
+async def rename_elsewhere(game_id: str, name: str):
+    """Rename a game in the DB, as if another instance changed it"""
+    await DbGame.find_one(
+        DbGame.id == PydanticObjectId(game_id), with_children=True
+    ).update(Set({DbGame.name: name}), Inc({"revision": 1}))
+
+
+def test_read_cached_game(client: TestClient):
+    """Reading a cached game does not replay it"""
+    game = started_game(client)
+    hits = GameService.cache.hits
+
+    with patch("src.services.game.deserialize.game") as replay:
+        assert game == get_game(client, game["id"], DEFAULT_ID)
+
+    replay.assert_not_called()
+    assert hits + 1 == GameService.cache.hits
+
+
+def test_read_game_changed_elsewhere(client: TestClient):
+    """Reading a cached game that changed elsewhere reads the latest game"""
+    game = started_game(client)
+    assert client.portal
+    client.portal.call(rename_elsewhere, game["id"], "renamed")
+
+    assert "renamed" == get_game(client, game["id"], DEFAULT_ID)["name"]
+
+
+def test_read_recently_cached_game(client: TestClient):
+    """Reading a recently cached game does not check it is the latest, unless asked"""
+    game = started_game(client)
+    game_id = PydanticObjectId(game["id"])
+    assert client.portal
+    client.portal.call(rename_elsewhere, game["id"], "renamed")
+
+    with patch.object(GameService, "cache_max_age", 60):
+        cached_game = client.portal.call(GameService.get, game_id)
+        revision = client.portal.call(GameService.revision, game_id)
+        latest_game = client.portal.call(GameService.get, game_id, revision)
+
+    assert game["name"] == cached_game.name
+    assert "renamed" == latest_game.name
+
+
+def test_read_recently_cached_game_changed_elsewhere(client: TestClient):
+    """
+    Retrieving a recently cached game that changed elsewhere retrieves the latest
+    game, reading its revision once
+    """
+    game = started_game(client)
+    assert client.portal
+    client.portal.call(rename_elsewhere, game["id"], "renamed")
+
+    with (
+        patch.object(GameService, "cache_max_age", 60),
+        patch.object(
+            GameService,
+            "_GameService__revision",
+            wraps=vars(GameService)["_GameService__revision"].__func__,
+        ) as revision,
+    ):
+        assert "renamed" == get_game(client, game["id"], DEFAULT_ID)["name"]
+
+    revision.assert_called_once()
+
+
+def test_read_cached_game_revision_once(client: TestClient):
+    """Retrieving an unchanged cached game reads only its revision, once"""
+    game = started_game(client)
+
+    with (
+        patch.object(
+            GameService,
+            "_GameService__revision",
+            wraps=vars(GameService)["_GameService__revision"].__func__,
+        ) as revision,
+        patch.object(
+            GameService, "_GameService__get", side_effect=AssertionError
+        ) as get,
+    ):
+        assert game == get_game(client, game["id"], DEFAULT_ID)
+
+    revision.assert_called_once()
+    get.assert_not_called()
+
+
+def test_act_leaves_cached_game(client: TestClient):
+    """Acting on a cached game changes a copy of it"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    cached_game = GameService.cache.get(PydanticObjectId(game["id"]))
+    assert cached_game
+    actions = cached_game.game.actions
+
+    resp = client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json=suggested_bid,
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 200 == resp.status_code
+    assert actions == cached_game.game.actions
+    assert cached_game is not GameService.cache.get(PydanticObjectId(game["id"]))
+
+
+def test_cache_forgets_least_recent_games(client: TestClient):
+    """The cache forgets the least recently used games when full"""
+    with patch.object(GameService, "cache", LruCache(1)):
+        first_game = started_game(client)
+        second_game = started_game(client)
+
+        assert 1 == GameService.cache.evictions
+        assert GameService.cache.get(PydanticObjectId(first_game["id"])) is None
+        assert GameService.cache.get(PydanticObjectId(second_game["id"]))
+        assert 1 == GameService.cache.misses
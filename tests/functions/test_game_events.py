@@ -1,8 +1,15 @@
 """Test to ensure game events are returned properly through the web server"""
 
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from beanie.operators import Unset
 from fastapi.testclient import TestClient
 
+from src.cache import LruCache
+from src.models.db import Game as DbGame
 from src.models.internal.constants import BidAmount, CardSuit
+from src.services import GameService
 from tests.helpers import (
     DEFAULT_ID,
     completed_game,
@@ -165,3 +172,109 @@ def test_completed_game_round_start_hands(client: TestClient):
     for rs in round_starts:
         assert "hands" in rs
         assert len(rs["hands"]) > 0
+
+
+def test_event_pages_match_all_events(client: TestClient):
+    """Pages of events read from the event log match the full list of events"""
+    game = completed_game(client)
+    all_events = get_events(client, game["id"], DEFAULT_ID)
+
+    with patch("src.services.game.GameService.get") as replay:
+        pages = [
+            client.get(
+                f"/players/{DEFAULT_ID}/games/{game['id']}/events",
+                params=params,
+                headers={"authorization": f"Bearer {DEFAULT_ID}"},
+            ).json()
+            for params in [
+                {"skip": 0, "limit": 10},
+                {"skip": len(all_events) - 5},
+                {"skip": -3},
+                {"skip": len(all_events) + 5, "limit": 10},
+            ]
+        ]
+
+    replay.assert_not_called()
+    assert all_events[:10] == pages[0]
+    assert all_events[-5:] == pages[1]
+    assert all_events[-3:] == pages[2]
+    assert [] == pages[3]
+
+
+def test_events_without_event_log(client: TestClient):
+    """Events are replayed from the game when its event log is incomplete"""
+    with patch("src.services.game.DbEvent.insert_many"):
+        game = started_game(client)
+
+    events = client.get(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/events",
+        params={"skip": 1, "limit": 1},
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    ).json()
+
+    assert [1] == [e["sequence"] for e in events]
+    assert "ROUND_START" == events[0]["content"]["type"]
+
+
+async def forget_event_count(game_id: str):
+    """Remove the event count of a game, as if it was saved before events were logged"""
+    await DbGame.find_one(
+        DbGame.id == PydanticObjectId(game_id), with_children=True
+    ).update(Unset({DbGame.event_count: ""}))
+
+
+def test_events_of_game_saved_before_event_log(client: TestClient):
+    """Events are replayed from the game when it was saved before events were logged"""
+    game = started_game(client)
+    assert client.portal
+    client.portal.call(forget_event_count, game["id"])
+
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    assert list(range(len(events))) == [e["sequence"] for e in events]
+    assert "GAME_START" == events[0]["content"]["type"]
+
+
+def act(client: TestClient, game_id: str) -> list[dict]:
+    """Make the suggested action in the game, returning the events it produced"""
+    resp = client.post(
+        f"/players/{DEFAULT_ID}/games/{game_id}/actions",
+        json=get_suggestion(client, game_id),
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+    assert 200 == resp.status_code
+    return resp.json()
+
+
+def test_action_events_sequenced_in_game(client: TestClient):
+    """The events an action produces are sequenced from where they start in the game"""
+    game = started_game(client)
+
+    new_events = act(client, game["id"])
+
+    events = get_events(client, game["id"], DEFAULT_ID)
+    assert events[-len(new_events) :] == new_events
+    assert new_events[0]["sequence"] > 0
+
+
+def test_action_events_of_game_saved_before_event_log(client: TestClient):
+    """Events of an action are sequenced in the game once its events are replayed"""
+    game = started_game(client)
+    assert client.portal
+    client.portal.call(forget_event_count, game["id"])
+
+    with patch.object(GameService, "cache", LruCache(1)):
+        new_events = act(client, game["id"])
+
+    events = get_events(client, game["id"], DEFAULT_ID)
+    assert events[-len(new_events) :] == new_events
+
+
+def test_events_of_nonexistent_game(client: TestClient):
+    """Retrieving events of a game that does not exist returns 404"""
+    resp = client.get(
+        f"/players/{DEFAULT_ID}/games/{PydanticObjectId()}/events",
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 404 == resp.status_code
@@ -0,0 +1,250 @@
+"""Unit tests to ensure automated moves can be made by the queue worker instead"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import azure.functions as func
+import pytest
+from azure.core.exceptions import AzureError
+from beanie.exceptions import CollectionWasNotInitialized
+from fastapi.testclient import TestClient
+
+from function_app import app
+from src.models.db.setup import odm_initialized
+from src.models.internal import Game
+from src.services import AdvanceGame, GameService, MemoryGameQueue
+from src.services.queue import StorageGameQueue, queue_from_environment
+from tests.helpers import (
+    DEFAULT_ID,
+    get_game,
+    get_suggestion,
+    leave,
+    saved_game,
+    started_game,
+)
+
+
+@pytest.fixture(name="queue")
+def fixture_queue() -> Iterator[MemoryGameQueue]:
+    """A queue in memory, for the game service to send games to"""
+    queue = MemoryGameQueue()
+    with patch.object(GameService, "queue", queue):
+        yield queue
+
+
+@pytest.fixture(name="queue_client")
+def fixture_queue_client() -> Iterator[MagicMock]:
+    """The client of any storage queue, in place of one for Azure Storage"""
+    with patch("src.services.queue.QueueClient.from_connection_string") as connect:
+        yield connect.return_value
+
+
+async def advance_game(message: AdvanceGame) -> None:
+    """Deliver the message to the function app's queue trigger"""
+    trigger = next(
+        f for f in app.get_functions() if f.get_function_name() == "advance_game"
+    ).get_user_function()
+    await trigger(func.QueueMessage(body=message.model_dump_json().encode()))
+
+
+def test_leave_queues_automation(client: TestClient, queue: MemoryGameQueue):
+    """Leaving a game saves no automated moves, and queues the game for them"""
+    game = started_game(client)
+    assert client.portal
+    started_moves = client.portal.call(saved_game, game["id"]).move_count
+
+    assert [] == leave(client, game["id"])
+
+    db_game = client.portal.call(saved_game, game["id"])
+    assert started_moves == db_game.move_count
+    assert db_game.automation_pending
+    assert [AdvanceGame(game_id=game["id"], revision=db_game.revision)] == (
+        queue.receive()
+    )
+    assert "WON" != get_game(client, game["id"], DEFAULT_ID)["active"]["status"]
+
+
+def test_advance_queued_game(client: TestClient, queue: MemoryGameQueue):
+    """The worker makes the queued moves, and queues the game again if any are left"""
+    game = started_game(client)
+    assert client.portal
+    leave(client, game["id"])
+
+    with patch.object(Game, "automation_steps", 20):
+        messages = queue.receive()
+        for _ in range(100):
+            if not messages:
+                break
+            for message in messages:
+                client.portal.call(GameService.advance, message)
+            messages = queue.receive()
+
+    assert not messages
+    assert not client.portal.call(saved_game, game["id"]).automation_pending
+    assert "WON" == get_game(client, game["id"], DEFAULT_ID)["active"]["status"]
+
+
+def test_advance_uncached_game(client: TestClient, queue: MemoryGameQueue):
+    """The worker makes, and saves, the queued moves of a game that is not cached"""
+    game = started_game(client)
+    assert client.portal
+    started_moves = client.portal.call(saved_game, game["id"]).move_count
+    leave(client, game["id"])
+    (message,) = queue.receive()
+    GameService.cache.clear()
+
+    with patch.object(Game, "automation_steps", 20):
+        client.portal.call(GameService.advance, message)
+
+    db_game = client.portal.call(saved_game, game["id"])
+    assert started_moves + 20 == db_game.move_count
+    assert message.revision + 1 == db_game.revision
+    assert db_game.automation_pending
+    assert [AdvanceGame(game_id=game["id"], revision=db_game.revision)] == (
+        queue.receive()
+    )
+
+
+def test_act_queues_automation(client: TestClient, queue: MemoryGameQueue):
+    """Acting saves only the move of the player, and queues the CPU turns after it"""
+    game = started_game(client)
+    assert client.portal
+    started_moves = client.portal.call(saved_game, game["id"]).move_count
+
+    resp = client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json=get_suggestion(client, game["id"]),
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+    assert 200 == resp.status_code
+
+    assert started_moves + 1 == client.portal.call(saved_game, game["id"]).move_count
+    (message,) = queue.receive()
+    client.portal.call(GameService.advance, message)
+
+    db_game = client.portal.call(saved_game, game["id"])
+    assert started_moves + 1 < db_game.move_count
+    assert DEFAULT_ID == db_game.active_player_id
+    assert not db_game.automation_pending
+    assert not queue.receive()
+
+
+def test_advance_once_per_revision(client: TestClient, queue: MemoryGameQueue):
+    """A message handled again, or after the game is saved again, changes nothing"""
+    game = started_game(client)
+    assert client.portal
+    leave(client, game["id"])
+    (message,) = queue.receive()
+
+    with patch.object(Game, "automation_steps", 20):
+        client.portal.call(GameService.advance, message)
+        db_game = client.portal.call(saved_game, game["id"])
+
+        client.portal.call(GameService.advance, message)
+
+    assert db_game.revision == client.portal.call(saved_game, game["id"]).revision
+    assert [AdvanceGame(game_id=game["id"], revision=db_game.revision)] == (
+        queue.receive()
+    )
+
+
+def test_advance_game_trigger(client: TestClient, queue: MemoryGameQueue):
+    """The queue trigger makes the moves of the game in the message"""
+    game = started_game(client)
+    assert client.portal
+    leave(client, game["id"])
+    (message,) = queue.receive()
+
+    client.portal.call(advance_game, message)
+
+    db_game = client.portal.call(saved_game, game["id"])
+    assert message.revision + 1 == db_game.revision
+    assert not db_game.automation_pending
+
+
+def test_advance_game_trigger_initializes_odm():
+    """The queue trigger initializes beanie when no request has yet"""
+    message = AdvanceGame(game_id="game", revision=1)
+
+    with (
+        patch("function_app.odm_initialized", return_value=False),
+        patch("function_app.initialize_odm", new_callable=AsyncMock) as initialize,
+        patch.object(GameService, "advance", new_callable=AsyncMock) as advance,
+    ):
+        asyncio.run(advance_game(message))
+
+    initialize.assert_awaited_once()
+    advance.assert_awaited_once_with(message)
+
+
+def test_odm_not_initialized():
+    """Beanie is not initialized until its documents are"""
+    with patch(
+        "src.models.db.setup.Game.get_settings",
+        side_effect=CollectionWasNotInitialized,
+    ):
+        assert not odm_initialized()
+
+
+def test_storage_queue_sends(queue_client: MagicMock):
+    """A storage queue sends each message as JSON"""
+    message = AdvanceGame(game_id="game", revision=1)
+
+    asyncio.run(StorageGameQueue("connection", "queue").send(message))
+
+    queue_client.send_message.assert_called_once_with(message.model_dump_json())
+
+
+def test_storage_queue_send_failure(
+    queue_client: MagicMock, caplog: pytest.LogCaptureFixture
+):
+    """A message the storage queue cannot send is logged, not raised"""
+    queue_client.send_message.side_effect = AzureError("unavailable")
+
+    with caplog.at_level(logging.ERROR, logger="src.services.queue"):
+        asyncio.run(
+            StorageGameQueue("connection", "queue").send(
+                AdvanceGame(game_id="game", revision=1)
+            )
+        )
+
+    assert "Could not queue game game" in caplog.text
+
+
+def test_queue_from_environment(queue_client: MagicMock):
+    """The storage queue is used when turned on"""
+    with patch.dict(
+        os.environ,
+        {"AdvanceGameQueue": "on", "AzureWebJobsStorage": "UseDevelopmentStorage=true"},
+    ):
+        queue = queue_from_environment()
+
+    assert isinstance(queue, StorageGameQueue)
+    assert queue_client is queue.client
+
+
+def test_act_with_queue_unavailable(client: TestClient, queue_client: MagicMock):
+    """A change is saved even if its game cannot be queued"""
+    queue_client.send_message.side_effect = AzureError("unavailable")
+    game = started_game(client)
+    assert client.portal
+
+    with patch.object(GameService, "queue", StorageGameQueue("connection", "queue")):
+        assert [] == leave(client, game["id"])
+
+    assert client.portal.call(saved_game, game["id"]).automation_pending
+
+
+def test_read_after_queue_timeout(client: TestClient, queue: MemoryGameQueue):
+    """Reading a game left to the queue for too long makes its moves"""
+    game = started_game(client)
+    leave(client, game["id"])
+    queue.receive()  # the message is lost
+
+    with patch.object(GameService, "queue_timeout", 0):
+        read_game = get_game(client, game["id"], DEFAULT_ID)
+
+    assert "WON" == read_game["active"]["status"]
@@ -0,0 +1,86 @@
+"""Unit tests to ensure the work of long games is run away from the event loop"""
+
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from beanie import PydanticObjectId
+from fastapi.testclient import TestClient
+
+from src.cache import LruCache
+from src.services import GameRunner, GameService
+from tests.functions.test_game_events import forget_event_count
+from tests.helpers import (
+    DEFAULT_ID,
+    completed_game,
+    get_events,
+    get_game,
+    get_suggestion,
+    started_game,
+)
+
+
+def test_run_short_games_inline(client: TestClient):
+    """Short games are run on the event loop, without the pools"""
+    pool = MagicMock(spec=Executor)
+
+    with (
+        patch.object(GameRunner, "inline_moves", 1000),
+        patch.object(GameRunner, "pool", pool),
+        patch.object(GameRunner, "threads", pool),
+        patch.object(GameService, "cache", LruCache(1)),
+    ):
+        game = completed_game(client)
+        get_events(client, started_game(client)["id"], DEFAULT_ID)
+        assert game == get_game(client, game["id"], DEFAULT_ID)
+
+    pool.submit.assert_not_called()
+
+
+def test_run_long_games_on_pools(client: TestClient):
+    """Long games are replayed, derived and changed the same way on the pools"""
+    game = started_game(client)
+    inline_game = get_game(client, game["id"], DEFAULT_ID)
+    inline_events = get_events(client, game["id"], DEFAULT_ID)
+    assert client.portal
+    client.portal.call(forget_event_count, game["id"])
+
+    with (
+        patch.object(GameRunner, "inline_moves", 0),
+        patch.object(GameService, "cache", LruCache(1)),
+    ):
+        assert inline_game == get_game(client, game["id"], DEFAULT_ID)
+        assert inline_events == get_events(client, game["id"], DEFAULT_ID)
+
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=get_suggestion(client, game["id"]),
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    assert len(inline_events) < len(get_events(client, game["id"], DEFAULT_ID))
+
+
+def test_replay_on_processes(client: TestClient):
+    """Games are replayed, and their events derived, the same way in other processes"""
+    game = completed_game(client)
+    inline_events = get_events(client, game["id"], DEFAULT_ID)
+    assert client.portal
+
+    with (
+        ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool,
+        patch.object(GameRunner, "inline_moves", 0),
+        patch.object(GameRunner, "pool", pool),
+        patch.object(GameService, "cache", LruCache(1)),
+    ):
+        replayed_game = client.portal.call(
+            GameService.get, PydanticObjectId(game["id"])
+        )
+        derived_events = client.portal.call(
+            GameRunner.events, replayed_game, len(replayed_game.actions)
+        )
+
+    assert game["scores"] == replayed_game.scores
+    assert inline_events == get_events(client, game["id"], DEFAULT_ID)
+    assert len(inline_events) == len(derived_events)
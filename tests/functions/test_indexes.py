@@ -0,0 +1,109 @@
+"""Unit tests to ensure the DB indexes serve the queries the services make"""
+
+import os
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from pymongo.asynchronous.collection import AsyncCollection
+
+from function_app import fastapi_app
+from src.models.db import Player as DbPlayer
+from tests.helpers import DEFAULT_ID, get_events, get_suggestion, started_game
+
+
+async def explain(collection: AsyncCollection, query: dict[str, Any]) -> dict[str, Any]:
+    """Explain how the DB will find the documents matching the query"""
+    return await collection.find(query).explain()
+
+
+def test_service_queries_use_indexes(client: TestClient):
+    """No query made while playing a game scans a whole collection"""
+    queries: list[tuple[AsyncCollection, dict[str, Any]]] = []
+    find = AsyncCollection.find
+
+    def recording_find(collection: AsyncCollection, *args, **kwargs):
+        queries.append((collection, kwargs.get("filter", args[0] if args else {})))
+        return find(collection, *args, **kwargs)
+
+    with patch.object(
+        AsyncCollection, "find", autospec=True, side_effect=recording_find
+    ):
+        game = started_game(client)
+        client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=get_suggestion(client, game["id"]),
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        get_events(client, game["id"], DEFAULT_ID)
+        client.get(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/players",
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        client.get(
+            f"/players/{DEFAULT_ID}",
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        client.post(
+            f"/players/{DEFAULT_ID}/search",
+            json={"searchText": "name"},
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        client.post(
+            f"/players/{DEFAULT_ID}/lobbies/search",
+            json={"searchText": "name"},
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        client.post(
+            f"/players/{DEFAULT_ID}/games/search",
+            json={
+                "searchText": "name",
+                "statuses": ["BIDDING"],
+                "activePlayer": DEFAULT_ID,
+                "winner": DEFAULT_ID,
+            },
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert queries
+    assert client.portal
+    for collection, query in queries:
+        plan = client.portal.call(explain, collection, query)
+        assert "COLLSCAN" not in str(plan["queryPlanner"]["winningPlan"]), query
+
+
+def test_verify_indexes():
+    """Startup can verify the indexes created by a previous startup"""
+    with TestClient(fastapi_app):
+        pass
+
+    with (
+        patch.dict(os.environ, {"DatabaseIndexes": "verify"}),
+        TestClient(fastapi_app),
+    ):
+        pass
+
+
+def test_verify_missing_indexes():
+    """Startup fails when verifying indexes that are missing"""
+    with TestClient(fastapi_app) as client:
+        assert client.portal
+        client.portal.call(DbPlayer.get_pymongo_collection().drop_index, "name_1")
+
+    with (
+        patch.dict(os.environ, {"DatabaseIndexes": "verify"}),
+        pytest.raises(RuntimeError, match="players.name_1"),
+        TestClient(fastapi_app),
+    ):
+        pass
+
+
+def test_unrecognized_index_setting():
+    """Startup fails when the index setting is not recognized"""
+    with (
+        patch.dict(os.environ, {"DatabaseIndexes": "sometimes"}),
+        pytest.raises(ValueError, match="sometimes"),
+        TestClient(fastapi_app),
+    ):
+        pass
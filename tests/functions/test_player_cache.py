@@ -0,0 +1,109 @@
+"""Unit tests to ensure players are cached between requests safely"""
+
+from time import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.mappers.db import serialize
+from src.models.db import Player as DbPlayer
+from src.models.internal import Player
+from src.services import PlayerService
+from tests.helpers import DEFAULT_ID, lobby_game, player, started_game
+
+
+def players_of(client: TestClient, kind: str, game_id: str, player_id: str) -> list:
+    """Retrieve the players of the lobby or game"""
+    resp = client.get(
+        f"/players/{player_id}/{kind}/{game_id}/players",
+        headers={"authorization": f"Bearer {player_id}"},
+    )
+    assert 200 == resp.status_code
+    return resp.json()
+
+
+def test_read_cached_players(client: TestClient):
+    """Reading the players of a game again does not read them from the DB"""
+    organizer = player(client, Player(player_id=f"{time()}", name="Organizer"))
+    game = started_game(client, organizer["id"])
+    players = players_of(client, "games", game["id"], DEFAULT_ID)
+
+    with patch("src.services.player.DbPlayer.find", side_effect=AssertionError):
+        assert players == players_of(client, "games", game["id"], DEFAULT_ID)
+
+    assert [organizer] == players
+
+
+def test_read_only_missing_players(client: TestClient):
+    """Only the players that are not cached are read, together"""
+    organizer = player(client, Player(player_id=f"{time()}-organizer", name="O"))
+    joiner = player(client, Player(player_id=f"{time()}-joiner", name="J"))
+    lobby = lobby_game(client, organizer["id"])
+    assert [organizer] == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)
+    client.post(
+        f"/players/{joiner['id']}/lobbies/{lobby['id']}/players",
+        json={"type": "JOIN"},
+        headers={"authorization": f"Bearer {joiner['id']}"},
+    )
+
+    with patch("src.services.player.DbPlayer.find", wraps=DbPlayer.find) as find:
+        assert [organizer, joiner] == players_of(
+            client, "lobbies", lobby["id"], DEFAULT_ID
+        )
+
+    find.assert_called_once()
+    assert {"player_id": {"$in": [joiner["id"]]}} == find.call_args.args[0].query
+
+
+def test_saving_player_forgets_cached_player(client: TestClient):
+    """Saving a player is seen by the next read of the players"""
+    player_id = f"{time()}"
+    player(client, Player(player_id=player_id, name="Initial"))
+    lobby = lobby_game(client, player_id)
+    assert (
+        "Initial" == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)[0]["name"]
+    )
+
+    player(client, Player(player_id=player_id, name="Updated"))
+
+    assert (
+        "Updated" == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)[0]["name"]
+    )
+
+
+def test_cached_players_expire(client: TestClient):
+    """Cached players are read again once they expire"""
+    lobby = lobby_game(client, f"{time()}")
+
+    with patch.object(PlayerService, "cache_ttl", 0):
+        assert [] == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)
+
+        with patch("src.services.player.DbPlayer.find", wraps=DbPlayer.find) as find:
+            assert [] == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)
+
+    find.assert_called_once()
+
+
+def test_players_without_profiles_are_cached(client: TestClient):
+    """People without a saved player, like CPU players, are not read again"""
+    game = started_game(client, f"{time()}")
+    assert [] == players_of(client, "games", game["id"], DEFAULT_ID)
+
+    with patch("src.services.player.DbPlayer.find", side_effect=AssertionError):
+        assert [] == players_of(client, "games", game["id"], DEFAULT_ID)
+
+
+def test_get_player_saved_elsewhere(client: TestClient):
+    """A player missing from the cache is found once another instance saves them"""
+    player_id = f"{time()}"
+    lobby = lobby_game(client, player_id)
+    assert [] == players_of(client, "lobbies", lobby["id"], DEFAULT_ID)
+    assert client.portal
+    client.portal.call(serialize.player(Player(player_id=player_id, name="Late")).save)
+
+    resp = client.get(
+        f"/players/{player_id}", headers={"authorization": f"Bearer {player_id}"}
+    )
+
+    assert 200 == resp.status_code
+    assert "Late" == resp.json()["name"]
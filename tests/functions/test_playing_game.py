@@ -1,10 +1,20 @@
 """ "Unit tests to ensure games that are in progress behave as expected"""
 
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from beanie.operators import Inc, Unset
 from fastapi.testclient import TestClient
+from hundredandten.engine import Game as Engine
 
-from src.models.internal import BidAmount, GameStatus
+from src.models.db import Game as DbGame, GameV0, GameV1
+from src.models.internal import BidAmount, Game, GameStatus
+from src.services import GameService
+from src.services.game import CachedGame
 from tests.helpers import (
     DEFAULT_ID,
+    as_v0,
+    completed_game,
     contains_unsequenced,
     game_with_manual_player,
     get_events,
@@ -222,6 +232,19 @@ def test_kick_player_as_player(client: TestClient):
     assert 403 == resp.status_code
 
 
+def test_cannot_act_on_won_game(client: TestClient):
+    """Server will not accept actions on a game that has been won"""
+    game = completed_game(client)
+
+    resp = client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json={"type": "BID", "amount": 0},
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 400 == resp.status_code
+
+
 def test_cannot_violate_engine_rule(client: TestClient):
     """Server will not allow violating an engine rule (playing out of order)"""
     original_game, _ = game_with_manual_player(client)
@@ -244,3 +267,186 @@ def test_cannot_violate_engine_rule(client: TestClient):
 
     assert original_game == game
     assert original_events == after_events
+
+
+def test_act_replays_game_once(client: TestClient):
+    """Acting replays the stored game once, from its seed"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    GameService.cache.clear()
+
+    initialize_engine = vars(Game)["_Game__initialize_engine"]
+    with (
+        patch.object(
+            Game,
+            "_Game__initialize_engine",
+            autospec=True,
+            side_effect=initialize_engine,
+        ) as replays,
+        patch("src.models.internal.game.Engine", wraps=Engine) as new_engines,
+    ):
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=suggested_bid,
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    assert contains_unsequenced(resp.json(), suggested_bid)
+    assert 1 == replays.call_count
+    assert 1 == new_engines.call_count
+
+
+def test_act_writes_only_changes(client: TestClient):
+    """Acting sets the changes on the stored game instead of rewriting it"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    previous_events = get_events(client, game["id"], DEFAULT_ID)
+
+    with patch.object(
+        GameV1, "save", autospec=True, side_effect=GameV1.save
+    ) as full_saves:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=suggested_bid,
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    assert 0 == full_saves.call_count
+    # the stored game includes everything the action did
+    assert [e["content"] for e in resp.json()] == [
+        e["content"]
+        for e in get_events(client, game["id"], DEFAULT_ID)[len(previous_events) :]
+    ]
+
+
+def concurrently_changed(times: int):
+    """
+    Load games as the service does, but change each of the first ``times`` in the
+    DB after it is loaded, as if another request saved the game meanwhile
+    """
+    load_game = vars(GameService)["_GameService__load"]
+    changes = iter(range(times))
+
+    async def load_changed_game(game_id: PydanticObjectId) -> CachedGame:
+        cached_game = await load_game(game_id)
+        if next(changes, None) is not None:
+            await DbGame.find_one(DbGame.id == game_id, with_children=True).update(
+                Inc({"revision": 1})
+            )
+        return cached_game
+
+    return patch.object(
+        GameService, "_GameService__load", side_effect=load_changed_game
+    )
+
+
+def test_act_on_changed_game(client: TestClient):
+    """Acting on a game changed since it was loaded applies the action to the latest game"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    previous_events = get_events(client, game["id"], DEFAULT_ID)
+
+    with concurrently_changed(1) as loads:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=suggested_bid,
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    assert 2 == loads.call_count
+    # the stored game includes everything the action did, once
+    assert [e["content"] for e in resp.json()] == [
+        e["content"]
+        for e in get_events(client, game["id"], DEFAULT_ID)[len(previous_events) :]
+    ]
+
+
+def test_act_on_continually_changed_game(client: TestClient):
+    """Acting on a game that keeps changing gives up with a conflict"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    previous_events = get_events(client, game["id"], DEFAULT_ID)
+
+    with concurrently_changed(5) as loads:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=suggested_bid,
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 409 == resp.status_code
+    assert 3 == loads.call_count
+    assert previous_events == get_events(client, game["id"], DEFAULT_ID)
+
+
+async def forget_revision(game_id: str):
+    """Remove the revision of a game, as if it was saved before revisions were tracked"""
+    await DbGame.find_one(
+        DbGame.id == PydanticObjectId(game_id), with_children=True
+    ).update(Unset({DbGame.revision: ""}))
+
+
+def test_act_on_game_saved_before_revisions(client: TestClient):
+    """Acting on a game saved before revisions were tracked saves the action"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    previous_events = get_events(client, game["id"], DEFAULT_ID)
+    assert client.portal
+    client.portal.call(forget_revision, game["id"])
+
+    resp = client.post(
+        f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+        json=suggested_bid,
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 200 == resp.status_code
+    assert [e["content"] for e in resp.json()] == [
+        e["content"]
+        for e in get_events(client, game["id"], DEFAULT_ID)[len(previous_events) :]
+    ]
+
+
+async def save_as_v0(game_id: str):
+    """Rewrite a game as a V0 document, as if it was saved before moves were packed"""
+    db_game = await DbGame.get(PydanticObjectId(game_id), with_children=True)
+    assert isinstance(db_game, GameV1)
+
+    await DbGame.find_one(DbGame.id == db_game.id, with_children=True).replace_one(
+        as_v0(db_game)
+    )
+    GameService.cache.clear()
+
+
+async def stored_game(game_id: str) -> DbGame | None:
+    """Retrieve the stored document of a game"""
+    return await DbGame.get(PydanticObjectId(game_id), with_children=True)
+
+
+def test_act_on_v0_game(client: TestClient):
+    """Acting on a game saved before moves were packed saves it with packed moves"""
+    game = started_game(client)
+    suggested_bid = get_suggestion(client, game["id"])
+    previous_events = get_events(client, game["id"], DEFAULT_ID)
+    assert client.portal
+    client.portal.call(save_as_v0, game["id"])
+    assert isinstance(client.portal.call(stored_game, game["id"]), GameV0)
+    assert game == get_game(client, game["id"], DEFAULT_ID)
+
+    with concurrently_changed(1) as loads:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=suggested_bid,
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    assert 2 == loads.call_count
+    assert isinstance(client.portal.call(stored_game, game["id"]), GameV1)
+    assert [e["content"] for e in resp.json()] == [
+        e["content"]
+        for e in get_events(client, game["id"], DEFAULT_ID)[len(previous_events) :]
+    ]
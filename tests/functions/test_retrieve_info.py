@@ -1,10 +1,13 @@
 """Unit tests to the client can query for info as necessary"""
 
 from time import time
+from unittest.mock import patch
 
 from beanie import PydanticObjectId
+from beanie.operators import Unset
 from fastapi.testclient import TestClient
 
+from src.models.db import Game as DbGame
 from src.models.internal import Player
 from src.models.internal.constants import BidAmount, CardSuit
 from tests.helpers import (
@@ -97,6 +100,70 @@ def test_search_game_by_active_player(client: TestClient):
     assert len(original_games) == len(games)
 
 
+def test_search_game_summary(client: TestClient):
+    """Searching games summarizes each game without replaying it"""
+    search = f"game{time()}"
+    game = started_game(client, name=search)
+
+    with patch("src.services.game.deserialize.game") as replay:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/search",
+            json={"searchText": search},
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    replay.assert_not_called()
+    assert [
+        {
+            "id": game["id"],
+            "name": search,
+            "players": game["players"],
+            "status": game["active"]["status"],
+            "activePlayerId": game["active"]["activePlayerId"],
+            "winnerPlayerId": None,
+            "scores": game["scores"],
+        }
+    ] == resp.json()
+
+
+async def forget_scores(game_id: str):
+    """Remove the scores of a game, as if it was saved before they were kept"""
+    await DbGame.find_one(
+        DbGame.id == PydanticObjectId(game_id), with_children=True
+    ).update(Unset({"scores": ""}))
+
+
+async def saved_scores(game_id: str):
+    """Read the scores kept with a game"""
+    db_game = await DbGame.find_one(
+        DbGame.id == PydanticObjectId(game_id), with_children=True
+    )
+    assert db_game
+    return db_game.scores
+
+
+def test_search_game_saved_before_summary(client: TestClient):
+    """Searching games summarizes games saved before their summary was kept"""
+    game = completed_game(client)
+    assert client.portal
+    client.portal.call(forget_scores, game["id"])
+
+    with patch("src.services.game.GameService.get") as get:
+        resp = client.post(
+            f"/players/{DEFAULT_ID}/games/search",
+            json={"winner": game["active"]["winnerPlayerId"]},
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    get.assert_not_called()
+    assert client.portal.call(saved_scores, game["id"]) is None
+    summary = next(g for g in resp.json() if g["id"] == game["id"])
+    assert "WON" == summary["status"]
+    assert summary["activePlayerId"] is None
+    assert game["active"]["winnerPlayerId"] == summary["winnerPlayerId"]
+    assert game["scores"] == summary["scores"]
+
+
 def test_game_info_invalid_id(client: TestClient):
     """Invalid game ID returns 422"""
     resp = client.get(
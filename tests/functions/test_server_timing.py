@@ -0,0 +1,106 @@
+"""Unit tests to ensure the stages of requests are timed when asked"""
+
+import logging
+from itertools import count
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.cache import LruCache
+from src.services import GameService
+from src.timing import ServerTimingMiddleware, Timings, current_timings, stage
+from tests.helpers import DEFAULT_ID, started_game
+
+
+def timed_stages(header: str) -> dict[str, float]:
+    """The milliseconds of each stage in a Server-Timing header"""
+    return {
+        name: float(duration.removeprefix("dur="))
+        for name, duration in (metric.split(";") for metric in header.split(", "))
+    }
+
+
+def test_untimed_by_default(client: TestClient):
+    """Requests are not timed unless timing is turned on"""
+    game = started_game(client)
+
+    resp = client.get(
+        f"/players/{DEFAULT_ID}/games/{game['id']}",
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+
+    assert 200 == resp.status_code
+    assert "server-timing" not in resp.headers
+
+
+def test_time_game_stages(client: TestClient, caplog: pytest.LogCaptureFixture):
+    """A game read lists the time of each stage in its header and its log"""
+    game = started_game(client)
+
+    with (
+        patch.object(ServerTimingMiddleware, "enabled", True),
+        patch.object(GameService, "cache", LruCache(1)),
+        caplog.at_level(logging.INFO, logger="src.timing.middleware"),
+    ):
+        GameService.cache.clear()
+        resp = client.get(
+            f"/players/{DEFAULT_ID}/games/{game['id']}",
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 200 == resp.status_code
+    stages = timed_stages(resp.headers["server-timing"])
+    assert {
+        "auth",
+        "gameService",
+        "replay",
+        "automation",
+        "serialize",
+        "encode",
+        "total",
+    } <= set(stages)
+    assert stages["gameService"] <= stages["total"]
+
+    dimensions = caplog.records[-1].custom_dimensions  # type: ignore[attr-defined]
+    assert "/players/{player_id}/games/{game_id}" == dimensions["route"]
+    assert 200 == dimensions["status"]
+    assert dimensions["replayMs"] <= dimensions["totalMs"]
+
+
+def test_time_errors(client: TestClient):
+    """Requests that fail are timed too"""
+    with patch.object(ServerTimingMiddleware, "enabled", True):
+        resp = client.get(
+            f"/players/{DEFAULT_ID}/games/{'0' * 24}",
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+
+    assert 404 == resp.status_code
+    assert "gameService" in timed_stages(resp.headers["server-timing"])
+
+
+def test_time_stage_within_itself_once():
+    """A stage entered within itself is counted once"""
+    timings = Timings()
+    token = current_timings.set(timings)
+    try:
+        # each reading of the clock is a second after the last
+        with (
+            patch("src.timing.stages.perf_counter", side_effect=count()),
+            stage("outer"),
+        ):
+            with stage("outer"), stage("inner"):
+                pass
+            with stage("inner"):
+                pass
+    finally:
+        current_timings.reset(token)
+
+    assert {"outer": 5, "inner": 2} == timings.durations
+
+
+def test_untimed_stages_do_nothing():
+    """Stages outside of a timed request record nothing"""
+    with stage("outer"):
+        assert current_timings.get() is None
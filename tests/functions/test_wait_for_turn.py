@@ -0,0 +1,147 @@
+"""Test to ensure players can wait for their turn through the web server"""
+
+from time import monotonic, sleep
+from typing import Any
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from src.services import GameNotifier, GameService
+from tests.functions.test_game_events import forget_event_count
+from tests.helpers import (
+    DEFAULT_ID,
+    completed_game,
+    get_events,
+    get_suggestion,
+    started_game,
+)
+
+OTHER_ID = "other"
+
+
+def wait_for_turn(
+    client: TestClient, game_id: str, player_id: str, **params: Any
+) -> Response:
+    """Wait for the player's turn in the game"""
+    return client.get(
+        f"/players/{player_id}/games/{game_id}/turn",
+        params=params,
+        headers={"authorization": f"Bearer {player_id}"},
+    )
+
+
+def test_wait_on_turn(client: TestClient):
+    """A player whose turn it is gets the events after the sequence at once"""
+    game = started_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    resp = wait_for_turn(client, game["id"], DEFAULT_ID, afterSequence=0)
+
+    assert 200 == resp.status_code
+    assert events[1:] == resp.json()
+
+
+def test_wait_with_new_events(client: TestClient):
+    """A player gets the events saved after the sequence at once"""
+    game = started_game(client)
+    events = get_events(client, game["id"], OTHER_ID)
+
+    resp = wait_for_turn(client, game["id"], OTHER_ID, afterSequence=1)
+
+    assert events[2:] == resp.json()
+
+
+def test_wait_without_changes(client: TestClient):
+    """A player gets no events when nothing changes before the timeout"""
+    game = started_game(client)
+    events = get_events(client, game["id"], OTHER_ID)
+
+    with patch.object(GameService, "follow_interval", 0.05):
+        resp = wait_for_turn(
+            client,
+            game["id"],
+            OTHER_ID,
+            afterSequence=events[-1]["sequence"],
+            timeout=0.2,
+        )
+
+    assert 200 == resp.status_code
+    assert [] == resp.json()
+
+
+def test_wait_on_game_saved_before_event_log(client: TestClient):
+    """Events are returned at once when the game does not know its event count"""
+    game = started_game(client)
+    events = get_events(client, game["id"], OTHER_ID)
+    assert client.portal
+    client.portal.call(forget_event_count, game["id"])
+
+    resp = wait_for_turn(
+        client, game["id"], OTHER_ID, afterSequence=events[-1]["sequence"]
+    )
+
+    assert [] == resp.json()
+
+
+def test_wait_on_won_game(client: TestClient):
+    """A player gets no events at once when the game has been won"""
+    game = completed_game(client)
+    events = get_events(client, game["id"], DEFAULT_ID)
+
+    started = monotonic()
+    with patch.object(GameService, "follow_interval", 60):
+        resp = wait_for_turn(
+            client,
+            game["id"],
+            DEFAULT_ID,
+            afterSequence=events[-1]["sequence"],
+            timeout=60,
+        )
+
+    assert [] == resp.json()
+    assert monotonic() - started < 30
+
+
+def test_wait_woken_by_save(client: TestClient):
+    """A waiting player is woken when the game is saved, without waiting to check"""
+    game = started_game(client)
+    events = get_events(client, game["id"], OTHER_ID)
+    assert client.portal
+
+    with patch.object(GameService, "follow_interval", 60):
+        waited = client.portal.start_task_soon(
+            GameService.wait_for_turn,
+            PydanticObjectId(game["id"]),
+            OTHER_ID,
+            events[-1]["sequence"],
+            30,
+        )
+        while game["id"] not in vars(GameNotifier)["_GameNotifier__listeners"]:
+            sleep(0.01)
+        client.post(
+            f"/players/{DEFAULT_ID}/games/{game['id']}/actions",
+            json=get_suggestion(client, game["id"]),
+            headers={"authorization": f"Bearer {DEFAULT_ID}"},
+        )
+        start, new_events = waited.result(timeout=5)
+
+    assert len(events) == start
+    assert new_events
+
+
+def test_wait_too_long(client: TestClient):
+    """Players cannot wait longer than the maximum timeout"""
+    game = started_game(client)
+
+    resp = wait_for_turn(client, game["id"], DEFAULT_ID, timeout=3600)
+
+    assert 422 == resp.status_code
+
+
+def test_wait_on_nonexistent_game(client: TestClient):
+    """Waiting on a game that does not exist is not found"""
+    resp = wait_for_turn(client, str(PydanticObjectId()), DEFAULT_ID)
+
+    assert 404 == resp.status_code
@@ -1,16 +1,55 @@
 """Helpers to perform common functions during testing"""
 
+import json
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import jwt
+from beanie import PydanticObjectId
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi.testclient import TestClient
 from httpx import Response
+from jwt.algorithms import RSAAlgorithm
 
 from src.auth import Identity
+from src.mappers.db import deserialize, serialize
+from src.models.db import Game as DbGame, GameV0, GameV1
 from src.models.internal import Player
 
 DEFAULT_ID = "id"
 
+SIGNING_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+SIGNING_KEY_ID = "signing-key"
+
+
+def key_set(
+    private_key: rsa.RSAPrivateKey = SIGNING_KEY, key_id: str = SIGNING_KEY_ID
+) -> dict[str, Any]:
+    """A JWK set with the public half of the private key"""
+    key = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    return {"keys": [{**key, "kid": key_id, "alg": "RS256", "use": "sig"}]}
+
+
+def key_set_response(
+    keys: dict[str, Any] | None = None, cache_control: str = "public, max-age=3600"
+) -> MagicMock:
+    """A response serving the JWK set"""
+    keys = keys or key_set()
+    response = MagicMock(
+        content=json.dumps(keys).encode(), headers={"Cache-Control": cache_control}
+    )
+    response.json.return_value = keys
+    return response
+
+
+def signed_token(
+    claims: dict[str, Any],
+    private_key: rsa.RSAPrivateKey = SIGNING_KEY,
+    key_id: str = SIGNING_KEY_ID,
+) -> str:
+    """A token with the claims, signed by the private key"""
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": key_id})
+
 
 def lobby_game(
     test_client: TestClient, organizer: str = DEFAULT_ID, name: str = "test game"
@@ -145,6 +184,30 @@ def get_game(test_client: TestClient, game_id: str, player_id: str) -> dict[str,
     ).json()
 
 
+def leave(test_client: TestClient, game_id: str) -> list[dict[str, Any]]:
+    """Leave the game as the default player, leaving only CPU players"""
+    resp = test_client.post(
+        f"/players/{DEFAULT_ID}/games/{game_id}/players",
+        json={"type": "LEAVE"},
+        headers={"authorization": f"Bearer {DEFAULT_ID}"},
+    )
+    assert 200 == resp.status_code
+    return resp.json()
+
+
+async def saved_game(game_id: str) -> DbGame:
+    """The game document as saved"""
+    db_game = await DbGame.get(PydanticObjectId(game_id), with_children=True)
+    assert db_game
+    return db_game
+
+
+async def saved_moves(game_id: str) -> tuple[int, bool]:
+    """The moves saved in the game, and whether automated moves are pending"""
+    db_game = await saved_game(game_id)
+    return db_game.move_count, db_game.automation_pending
+
+
 def contains_unsequenced(
     events: list[dict[str, Any]], unordered_event: dict[str, Any]
 ) -> bool:
@@ -158,3 +221,17 @@ def get_events(client: TestClient, game_id: str, player_id: str) -> list[dict]:
         f"/players/{player_id}/games/{game_id}/events",
         headers={"authorization": f"Bearer {player_id}"},
     ).json()
+
+
+def as_v0(db_game: GameV1) -> GameV0:
+    """The game document as it would have been saved before moves were packed"""
+    player_ids = [p.player_id for p in [db_game.organizer, *db_game.players]]
+    return GameV0.model_validate(
+        {
+            **db_game.model_dump(exclude={"moves"}),
+            "moves": [
+                serialize.event(action, str(db_game.id), 0).content.model_dump()
+                for action in deserialize.moves(db_game.moves, player_ids)
+            ],
+        }
+    )
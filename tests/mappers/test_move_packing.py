@@ -0,0 +1,62 @@
+"""Ensure packed moves survive the trip to and from the DB"""
+
+from src.mappers.db import deserialize, serialize
+from src.models import db
+from src.models.internal import (
+    Bid,
+    BidAmount,
+    Card,
+    CardNumber,
+    CardSuit,
+    Discard,
+    Game,
+    NaiveCpu,
+    Play,
+    PlayerGroup,
+    SelectTrump,
+)
+
+PLAYER_IDS = ["1", "2", "3", "4"]
+
+
+def test_completed_game_round_trip():
+    """Every move of a completed game is unpacked as it was made"""
+    game = Game(
+        id="test",
+        seed="packing-seed",
+        organizer=NaiveCpu(PLAYER_IDS[0]),
+        players=PlayerGroup(map(NaiveCpu, PLAYER_IDS[1:])),
+    )
+    assert game.winner
+
+    packed = serialize.moves(game.actions, PLAYER_IDS)
+
+    assert game.actions == deserialize.moves(packed, PLAYER_IDS)
+    assert len(game.actions) == len(db.split_packed_moves(packed))
+    assert {Bid, SelectTrump, Discard, Play} == {type(a) for a in game.actions}
+
+
+def test_every_card_round_trip():
+    """Every card, and discards of any size, are unpacked as they were made"""
+    cards = tuple(Card(suit=s, number=n) for s in CardSuit for n in CardNumber)
+    actions = [
+        Bid(player_id="4", amount=BidAmount.SHOOT_THE_MOON),
+        SelectTrump(player_id="3", suit=CardSuit.SPADES),
+        Discard(player_id="2", cards=()),
+        Discard(player_id="1", cards=cards),
+        *(Play(player_id="4", card=card) for card in cards),
+    ]
+
+    packed = serialize.moves(actions, PLAYER_IDS)
+
+    assert actions == deserialize.moves(packed, PLAYER_IDS)
+    assert len(actions) == len(db.split_packed_moves(packed))
+
+
+def test_play_packs_into_two_bytes():
+    """A play is packed as its type and player, then the code of its card"""
+    play = Play(player_id="3", card=Card(suit=CardSuit.HEARTS, number=CardNumber.ACE))
+
+    assert bytes((db.PackedMoveType.PLAY << 4 | 2, 3 * 16 + 1)) == serialize.moves(
+        [play], PLAYER_IDS
+    )
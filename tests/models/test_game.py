@@ -0,0 +1,118 @@
+"""Unit tests for changes made to an in-progress or completed game"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.models.internal import (
+    Bid,
+    BidAmount,
+    Card,
+    CardNumber,
+    CardSuit,
+    Game,
+    GameEnd,
+    GameStatus,
+    Human,
+    NaiveCpu,
+    Play,
+    PlayerGroup,
+)
+from src.models.internal.errors import BadRequestError
+
+
+def __game() -> Game:
+    return Game(
+        id="test",
+        seed="game-seed",
+        organizer=Human("human"),
+        players=PlayerGroup([NaiveCpu("1"), NaiveCpu("2"), NaiveCpu("3")]),
+    )
+
+
+def test_new_events_match_replayed_events():
+    """The events recorded while changing a game match a full replay"""
+    game = __game()
+    known_events = len(game.events)
+    assert not game.new_events
+
+    game.leave("human")
+
+    assert game.events[known_events:] == game.new_events
+    assert isinstance(game.new_events[-1], GameEnd)
+
+
+def test_act_after_game_won():
+    """Acting on a won game is rejected"""
+    game = __game()
+    game.leave("human")
+    assert GameStatus.WON == game.status
+
+    completed = Game(
+        id=game.id,
+        seed=game.seed,
+        organizer=game.organizer,
+        players=game.players,
+        initial_actions=game.actions,
+    )
+    with pytest.raises(BadRequestError):
+        completed.act(Bid(player_id="human", amount=BidAmount.PASS))
+
+    assert not completed.new_events
+    assert game.actions == completed.actions
+
+
+def test_automation_stops_at_its_budget():
+    """Automation makes at most its budget of moves at once, leaving the rest pending"""
+    game = __game()
+    moves = len(game.actions)
+
+    with patch.object(Game, "automation_steps", 10):
+        game.leave("human")
+        assert moves + 10 == len(game.actions)
+        assert game.automation_pending
+
+        game.continue_automation()
+        assert moves + 20 == len(game.actions)
+
+    game.continue_automation()
+    assert GameStatus.WON == game.status
+    assert not game.automation_pending
+    assert game.events[-len(game.new_events) :] == game.new_events
+
+
+def test_unavailable_queued_action_within_budget():
+    """Dropping a queued action that cannot be made does not start another budget"""
+    game = __game()
+    moves = len(game.actions)
+    unavailable = Play(player_id="human", card=Card.of(CardSuit.HEARTS, CardNumber.ACE))
+
+    with patch.object(
+        Game,
+        "_Game__automate",
+        autospec=True,
+        side_effect=vars(Game)["_Game__automate"],
+    ) as automate:
+        game.queue_action_for("human", unavailable)
+
+    automate.assert_called_once()
+    assert Human("human") == game.organizer
+    assert moves == len(game.actions)
+
+
+def test_replay_without_automation():
+    """A game replayed without automation leaves its automated moves pending"""
+    game = __game()
+    game.leave("human")
+
+    replayed = Game(
+        id=game.id,
+        seed=game.seed,
+        organizer=game.organizer,
+        players=game.players,
+        initial_actions=game.actions[:10],
+        initial_automation=False,
+    )
+
+    assert game.actions[:10] == replayed.actions
+    assert replayed.automation_pending
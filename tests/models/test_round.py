@@ -0,0 +1,90 @@
+"""Unit tests for the rounds of a game"""
+
+from unittest.mock import patch
+
+from src.cache import LruCache
+from src.models.internal import (
+    Bid,
+    BidAmount,
+    Game,
+    GameStatus,
+    Human,
+    NaiveCpu,
+    PlayerGroup,
+)
+
+
+def __game() -> Game:
+    return Game(
+        id="test",
+        seed="round-seed",
+        organizer=Human("human"),
+        players=PlayerGroup([NaiveCpu("1"), NaiveCpu("2"), NaiveCpu("3")]),
+    )
+
+
+def __won_game() -> Game:
+    game = __game()
+    game.leave("human")
+    assert GameStatus.WON == game.status
+    return game
+
+
+def test_round_is_computed_once():
+    """A round computes its hands once, however often they are used"""
+    game_round = __won_game().rounds[0]
+
+    assert game_round.initial_hands is game_round.initial_hands
+    assert game_round.discards is game_round.discards
+    assert game_round.tricks is game_round.tricks
+
+
+def test_completed_rounds_are_shared():
+    """The completed rounds of a game are shared with every copy of that game"""
+    game = __won_game()
+    copy = Game(
+        id=game.id,
+        seed=game.seed,
+        organizer=game.organizer,
+        players=game.players,
+        initial_actions=game.actions,
+    )
+
+    assert all(a is b for a, b in zip(game.rounds, copy.rounds, strict=True))
+
+
+def test_active_rounds_are_not_shared():
+    """The active round of a game is recomputed as the game changes"""
+    game = __game()
+    active_round = game.rounds[-1]
+    bid_history = active_round.bid_history
+
+    game.act(Bid(player_id="human", amount=BidAmount.SHOOT_THE_MOON))
+
+    assert active_round is not game.rounds[-1]
+    assert bid_history == active_round.bid_history
+    assert len(bid_history) < len(game.rounds[-1].bid_history)
+
+
+def test_completed_rounds_with_other_actions_are_not_shared():
+    """Completed rounds dealt the same way are only shared if they were played the same"""
+    game = __won_game()
+    other_game = __game()
+    other_game.act(Bid(player_id="human", amount=BidAmount.SHOOT_THE_MOON))
+    other_game.leave("human")
+
+    assert game.rounds[0] is not other_game.rounds[0]
+    assert game.rounds[0].bid_history != other_game.rounds[0].bid_history
+
+
+def test_completed_rounds_are_forgotten():
+    """Only the most recently used completed rounds are shared"""
+    game = __won_game()
+
+    completed_rounds: LruCache = LruCache(1)
+
+    with patch("src.models.internal.round._COMPLETED_ROUNDS", completed_rounds):
+        # using every round leaves only the last one shared
+        first_round = game.rounds[0]
+        assert first_round is not game.rounds[0]
+        assert completed_rounds.evictions > 0